@@ -7,10 +7,12 @@ from .base_agent import BaseEvaluationAgent
 from .novelty_agent import NoveltyEvaluationAgent
 from .progress_agent import ProgressEvaluationAgent
 from .field_agent import FieldExcellenceAgent
+from .composite_agent import CompositeEvaluationAgent
 
 __all__ = [
     "BaseEvaluationAgent",
     "NoveltyEvaluationAgent",
     "ProgressEvaluationAgent",
-    "FieldExcellenceAgent"
+    "FieldExcellenceAgent",
+    "CompositeEvaluationAgent"
 ]
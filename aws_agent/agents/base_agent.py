@@ -4,20 +4,123 @@
 """
 
 import json
-import boto3
+import logging
+import heapq
+import time
+import uuid
+import hashlib
+import threading
+import orjson
+from botocore.exceptions import ClientError
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any, Optional
-from dataclasses import dataclass, asdict
-from pathlib import Path
+from typing import List, Dict, Any, Iterator, Optional, Sequence, Set
+from dataclasses import dataclass
 
-import sys
-sys.path.append(str(Path(__file__).parent.parent.parent))
+from aws_agent.aws_clients import get_client
 from aws_agent.config import AWSConfig
+from aws_agent.lru import LRUCache
 from aws_agent.preprocessing.embedder import BedrockEmbedder
+from aws_agent.preprocessing.s3_uploader import S3Uploader
 from aws_agent.vectorstore.opensearch_client import OpenSearchVectorStore
-
-
-@dataclass
+from aws_agent.vectorstore.semantic_cache import SemanticRetrievalCache, shared_retrieval_cache
+
+logger = logging.getLogger(__name__)
+
+
+# LLM 응답 캐시 (동일 시스템/사용자 프롬프트 재호출 방지)
+_LLM_CACHE_MAXSIZE = 1024
+_llm_cache = LRUCache(_LLM_CACHE_MAXSIZE)
+
+
+# 임베더/벡터스토어 (설정별 프로세스 공유, HTTP 풀과 인증 정보 재사용)
+_EMBEDDERS: Dict[tuple, BedrockEmbedder] = {}
+_VECTORSTORES: Dict[tuple, OpenSearchVectorStore] = {}
+_shared_lock = threading.Lock()
+
+
+def _get_embedder(config: AWSConfig) -> BedrockEmbedder:
+    """리전/임베딩 모델별 BedrockEmbedder 반환 (최초 호출 시 생성)"""
+    key = (config.bedrock_region, config.bedrock_embedding_model_id, config.opensearch_vector_encoder)
+    embedder = _EMBEDDERS.get(key)
+    if embedder is None:
+        with _shared_lock:
+            embedder = _EMBEDDERS.get(key)
+            if embedder is None:
+                embedder = BedrockEmbedder(config)
+                _EMBEDDERS[key] = embedder
+    return embedder
+
+
+def _get_vectorstore(config: AWSConfig) -> OpenSearchVectorStore:
+    """엔드포인트/인덱스/라우팅 설정별 OpenSearchVectorStore 반환 (최초 호출 시 생성)"""
+    key = (
+        config.opensearch_endpoint, config.opensearch_index_name, config.region, config.opensearch_routing
+    )
+    vectorstore = _VECTORSTORES.get(key)
+    if vectorstore is None:
+        with _shared_lock:
+            vectorstore = _VECTORSTORES.get(key)
+            if vectorstore is None:
+                vectorstore = OpenSearchVectorStore(config)
+                _VECTORSTORES[key] = vectorstore
+    return vectorstore
+
+
+# 프롬프트 캐싱(cachePoint / cache_control) 요청을 거부한 모델 ID (이후 캐싱 없이 호출)
+_PROMPT_CACHING_UNSUPPORTED: Set[str] = set()
+
+
+def _is_prompt_caching_error(error: ClientError) -> bool:
+    """프롬프트 캐싱 블록 때문에 거부된 요청인지 확인 (다른 ValidationException은 제외)"""
+    err = error.response.get("Error", {})
+    if err.get("Code") != "ValidationException":
+        return False
+    message = err.get("Message", "").lower()
+    return "cachepoint" in message or "cache_control" in message
+
+
+# invoke_model_with_response_stream 이벤트 스트림의 오류 이벤트
+_STREAM_ERROR_EVENTS = (
+    "internalServerException",
+    "modelStreamErrorException",
+    "modelTimeoutException",
+    "serviceUnavailableException",
+    "throttlingException",
+    "validationException",
+)
+
+# 평가 결과 제출용 도구 (tool use로 스키마에 맞는 JSON을 직접 받음)
+_TOOL_NAME = "submit_evaluation"
+_TOOL_DESCRIPTION = "평가 결과를 제출합니다."
+
+_EVALUATION_SCHEMA: Dict[str, Any] = {
+    "type": "object",
+    "properties": {
+        "score": {"type": "number", "minimum": 1, "maximum": 5, "description": "종합 점수 (1~5)"},
+        "sub_scores": {
+            "type": "object",
+            "additionalProperties": {"type": "number"},
+            "description": "세부 항목별 점수"
+        },
+        "evidence": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "properties": {
+                    "type": {"type": "string"},
+                    "content": {"type": "string"},
+                    "location": {"type": "string"}
+                },
+                "required": ["type", "content"]
+            }
+        },
+        "comments": {"type": "string", "description": "종합 평가 의견"}
+    },
+    "required": ["score", "evidence", "comments"]
+}
+
+
+@dataclass(slots=True)
 class EvaluationResult:
     """평가 결과 데이터 구조"""
     criterion: str  # 평가 항목 (신규성, 진보성 등)
@@ -29,7 +132,16 @@ class EvaluationResult:
     sub_scores: Optional[Dict[str, float]] = None  # 세부 항목 점수
 
     def to_dict(self) -> Dict[str, Any]:
-        return asdict(self)
+        # asdict의 deepcopy 없이 얕은 dict 생성
+        return {
+            "criterion": self.criterion,
+            "score": self.score,
+            "grade": self.grade,
+            "evidence": self.evidence,
+            "comments": self.comments,
+            "pass_status": self.pass_status,
+            "sub_scores": self.sub_scores,
+        }
 
 
 class BaseEvaluationAgent(ABC):
@@ -43,14 +155,14 @@ class BaseEvaluationAgent(ABC):
         1: "불인정"
     }
 
+    # 검색 결과 캐시 (에이전트/벡터 스토어 간 공유, None이면 비활성화)
+    retrieval_cache: Optional[SemanticRetrievalCache] = shared_retrieval_cache
+
     def __init__(self, config: AWSConfig = None):
         self.config = config or AWSConfig()
-        self.bedrock_client = boto3.client(
-            "bedrock-runtime",
-            region_name=self.config.bedrock_region
-        )
-        self.embedder = BedrockEmbedder(self.config)
-        self.vectorstore = OpenSearchVectorStore(self.config)
+        self.bedrock_client = get_client("bedrock-runtime", self.config.bedrock_region)
+        self.embedder = _get_embedder(self.config)
+        self.vectorstore = _get_vectorstore(self.config)
 
         # 에이전트 설정
         self.criterion_name = "기본"
@@ -69,55 +181,110 @@ class BaseEvaluationAgent(ABC):
     def retrieve_context(
         self,
         tech_id: str,
-        queries: List[str],
+        queries: Sequence[str],
         k: int = None
     ) -> str:
         """RAG: 관련 문서 검색 및 컨텍스트 구성"""
         k = k or self.config.retrieval_k
-        all_results = []
 
+        cache = self.retrieval_cache
+        results_by_query: Dict[str, List[Dict[str, Any]]] = {}
+
+        # tech_id 단위로 색인된 샤드만 검색
+        routing = tech_id if tech_id and self.config.opensearch_routing else None
+        # 검색 대상(인덱스/라우팅)이 다른 결과는 캐시를 공유하지 않음
+        scope = (self.config.opensearch_endpoint, self.config.opensearch_index_name, routing)
+
+        # 1. 정확 일치 캐시 확인 (임베딩 생략)
+        pending = []
         for query in queries:
-            # 쿼리 임베딩 생성
-            query_embedding = self.embedder.embed_query(query)
+            cached = cache.get_exact(tech_id, query, k, scope) if cache else None
+            if cached is not None:
+                results_by_query[query] = cached
+            else:
+                pending.append(query)
+
+        # 2. 나머지 쿼리 임베딩 일괄 생성
+        query_embeddings = self.embedder.embed_queries(pending)
 
-            # 벡터 검색
-            results = self.vectorstore.search(
-                query_embedding=query_embedding,
+        # 3. 유사 쿼리 캐시 확인
+        misses = []
+        for query, query_embedding in zip(pending, query_embeddings):
+            cached = cache.get_similar(tech_id, query_embedding, k, scope) if cache else None
+            if cached is not None:
+                results_by_query[query] = cached
+            else:
+                misses.append((query, query_embedding))
+
+        # 4. 남은 쿼리는 _msearch 한 번으로 벡터 검색
+        if misses:
+            batch_results = self.vectorstore.msearch(
+                [query_embedding for _, query_embedding in misses],
                 tech_id=tech_id,
-                k=k
+                k=k,
+                routing=routing
             )
-            all_results.extend(results)
+            for (query, query_embedding), results in zip(misses, batch_results):
+                results_by_query[query] = results
+                if cache and results:
+                    cache.put(tech_id, query, query_embedding, k, results, scope)
 
-        # 중복 제거 및 정렬
-        seen = set()
-        unique_results = []
+        all_results = []
+        for query in queries:
+            all_results.extend(results_by_query.get(query, []))
+
+        # 중복 제거 (같은 청크는 최고 점수만 유지)
+        best: Dict[tuple, Dict[str, Any]] = {}
         for r in all_results:
-            key = f"{r['tech_id']}_{r['chunk_index']}"
-            if key not in seen:
-                seen.add(key)
-                unique_results.append(r)
-
-        # 점수순 정렬
-        unique_results.sort(key=lambda x: x.get("_score", 0), reverse=True)
-
-        # 컨텍스트 문자열 생성
-        context_parts = []
-        for i, result in enumerate(unique_results[:k * len(queries)]):
-            context_parts.append(
-                f"[문서 {i+1}] (섹션: {result.get('section', '알 수 없음')}, "
-                f"페이지: {result.get('page_numbers', [])})\n"
-                f"{result.get('content', '')}\n"
+            key = (r["tech_id"], r["chunk_index"])
+            prev = best.get(key)
+            if prev is None or r.get("_score", 0) > prev.get("_score", 0):
+                best[key] = r
+
+        # 점수 상위 결과만 선택 (프롬프트 토큰 예산 내로 제한)
+        unique_results = heapq.nlargest(
+            min(self.config.max_context_docs, len(best)),
+            best.values(),
+            key=lambda x: x.get("_score", 0)
+        )
+
+        # 컨텍스트 문자열 생성 (한 번의 join)
+        context_parts = [None] * len(unique_results)
+        for i, result in enumerate(unique_results):
+            get = result.get
+            context_parts[i] = (
+                f"[문서 {i+1}] (섹션: {get('section', '알 수 없음')}, "
+                f"페이지: {get('page_numbers', [])})\n"
+                f"{get('content', '')}\n"
             )
 
         return "\n---\n".join(context_parts)
 
-    def invoke_llm(self, prompt: str) -> str:
-        """Bedrock Claude 호출"""
-        request_body = {
+    def _build_request_body(
+        self,
+        prompt: str,
+        prompt_caching: bool = False,
+        structured: bool = False
+    ) -> Dict[str, Any]:
+        """Claude Messages API 요청 본문 생성
+
+        prompt_caching이 켜져 있으면 시스템 프롬프트에 cache_control을 붙여
+        동일 프롬프트 재호출 시 prefill을 서버 측 캐시로 대체한다.
+        structured가 켜져 있으면 평가 결과 제출 도구 호출을 강제한다.
+        """
+        system: Any = self.system_prompt
+        if prompt_caching:
+            system = [{
+                "type": "text",
+                "text": self.system_prompt,
+                "cache_control": {"type": "ephemeral"}
+            }]
+
+        body = {
             "anthropic_version": "bedrock-2023-05-31",
             "max_tokens": 4096,
             "temperature": 0.1,
-            "system": self.system_prompt,
+            "system": system,
             "messages": [
                 {
                     "role": "user",
@@ -125,65 +292,206 @@ class BaseEvaluationAgent(ABC):
                 }
             ]
         }
+        if structured:
+            body["tools"] = [{
+                "name": _TOOL_NAME,
+                "description": _TOOL_DESCRIPTION,
+                "input_schema": self._get_result_schema()
+            }]
+            body["tool_choice"] = {"type": "tool", "name": _TOOL_NAME}
+        return body
+
+    def _get_result_schema(self) -> Dict[str, Any]:
+        """평가 결과 도구 입력 스키마 (통합 에이전트 등에서 재정의)"""
+        return _EVALUATION_SCHEMA
+
+    def invoke_llm(self, prompt: str, use_cache: bool = True) -> str:
+        """Bedrock Claude 자유 형식 텍스트 호출 (동일 프롬프트는 캐시된 응답 반환)
+
+        평가 결과는 invoke_structured(도구 호출)로만 받으며, 이 경로는 응답을 파싱하지 않는다.
+        """
+        cache_key = self._llm_cache_key("text", prompt) if use_cache else None
+        if cache_key is not None:
+            cached = _llm_cache.get(cache_key)
+            if cached is not None:
+                return cached
+
+        text = self._invoke_model(prompt)
+
+        if cache_key is not None:
+            _llm_cache.put(cache_key, text)
+
+        return text
+
+    def invoke_structured(self, prompt: str, use_cache: bool = True) -> Optional[Dict[str, Any]]:
+        """Converse API + 도구 호출로 평가 결과 JSON 반환 (도구 호출이 없으면 None)"""
+        cache_key = self._llm_cache_key(_TOOL_NAME, prompt) if use_cache else None
+        if cache_key is not None:
+            cached = _llm_cache.get(cache_key)
+            if cached is not None:
+                # 호출자가 결과를 수정해도 캐시가 오염되지 않도록 직렬화 형태로 보관
+                return orjson.loads(cached)
+
+        data = self._converse(prompt)
+
+        if cache_key is not None and data is not None:
+            _llm_cache.put(cache_key, orjson.dumps(data))
+
+        return data
+
+    def _llm_cache_key(self, kind: str, prompt: str) -> str:
+        return hashlib.blake2b(
+            f"{kind}\0{self.config.bedrock_model_id}\0{self.system_prompt}\0{prompt}".encode("utf-8"),
+            digest_size=16
+        ).hexdigest()
+
+    def _converse(self, prompt: str) -> Optional[Dict[str, Any]]:
+        """Bedrock converse 호출 후 submit_evaluation 도구 입력 추출"""
+        prompt_caching = self._prompt_caching_enabled()
 
-        response = self.bedrock_client.invoke_model(
-            modelId=self.config.bedrock_model_id,
-            body=json.dumps(request_body),
-            contentType="application/json",
-            accept="application/json"
+        try:
+            response = self.bedrock_client.converse(**self._converse_request(prompt, prompt_caching))
+        except ClientError as e:
+            # 프롬프트 캐싱 미지원 모델이면 캐싱 없이 재시도
+            if not prompt_caching or not _is_prompt_caching_error(e):
+                raise
+            self._disable_prompt_caching()
+            response = self.bedrock_client.converse(**self._converse_request(prompt))
+
+        for block in response["output"]["message"]["content"]:
+            tool_use = block.get("toolUse")
+            if tool_use and tool_use.get("name") == _TOOL_NAME:
+                return tool_use["input"]
+
+        logger.warning("도구 호출 없는 응답 (stopReason=%s)", response.get("stopReason"))
+        return None
+
+    def _prompt_caching_enabled(self) -> bool:
+        """설정이 켜져 있고 현재 모델이 캐싱을 거부한 적이 없으면 True"""
+        return (
+            self.config.bedrock_prompt_caching
+            and self.config.bedrock_model_id not in _PROMPT_CACHING_UNSUPPORTED
         )
 
-        response_body = json.loads(response["body"].read())
-        return response_body["content"][0]["text"]
+    def _disable_prompt_caching(self):
+        """현재 모델을 프롬프트 캐싱 미지원으로 기록 (공유 설정은 변경하지 않음)"""
+        logger.warning("프롬프트 캐싱 미지원 모델: %s", self.config.bedrock_model_id)
+        _PROMPT_CACHING_UNSUPPORTED.add(self.config.bedrock_model_id)
+
+    def _converse_request(self, prompt: str, prompt_caching: bool = False) -> Dict[str, Any]:
+        """converse 요청 인자 생성"""
+        system: List[Dict[str, Any]] = [{"text": self.system_prompt}]
+        if prompt_caching:
+            system.append({"cachePoint": {"type": "default"}})
+
+        return {
+            "modelId": self.config.bedrock_model_id,
+            "system": system,
+            "messages": [{"role": "user", "content": [{"text": prompt}]}],
+            "inferenceConfig": {"maxTokens": 4096, "temperature": 0.1},
+            "toolConfig": {
+                "tools": [{
+                    "toolSpec": {
+                        "name": _TOOL_NAME,
+                        "description": _TOOL_DESCRIPTION,
+                        "inputSchema": {"json": self._get_result_schema()}
+                    }
+                }],
+                "toolChoice": {"tool": {"name": _TOOL_NAME}}
+            }
+        }
+
+    def _invoke_model(self, prompt: str) -> str:
+        """Bedrock 스트리밍 호출 결과를 하나의 문자열로 수집"""
+        return "".join(self.stream_llm(prompt))
+
+    def stream_llm(self, prompt: str) -> Iterator[str]:
+        """Bedrock Claude 스트리밍 호출 (텍스트 조각을 생성되는 대로 반환)
+
+        invoke_model_with_response_stream을 사용해 전체 응답 생성을 기다리지 않고
+        content_block_delta 이벤트의 텍스트를 순서대로 내보낸다. 자유 형식 텍스트용이며 평가에는 쓰지 않는다.
+        """
+        for event in self._open_response_stream(prompt):
+            chunk = event.get("chunk")
+            if not chunk:
+                # 스트림 도중 오류 이벤트는 잘린 응답으로 넘기지 않고 예외로 전달
+                for error_type in _STREAM_ERROR_EVENTS:
+                    if error_type in event:
+                        raise RuntimeError(
+                            f"Bedrock 스트리밍 오류 ({error_type}): {event[error_type].get('message', '')}"
+                        )
+                continue
+            payload = orjson.loads(chunk["bytes"])
+            event_type = payload.get("type")
+            if event_type == "content_block_delta":
+                text = payload["delta"].get("text")
+                if text:
+                    yield text
+            elif event_type == "message_stop":
+                break
+
+    def _open_response_stream(self, prompt: str) -> Any:
+        """invoke_model_with_response_stream 호출 후 이벤트 스트림 반환"""
+        prompt_caching = self._prompt_caching_enabled()
 
-    def parse_evaluation_response(self, response: str) -> EvaluationResult:
-        """LLM 응답 파싱"""
-        # JSON 추출 시도
         try:
-            # JSON 블록 찾기
-            import re
-            json_match = re.search(r'```json\s*(.*?)\s*```', response, re.DOTALL)
-            if json_match:
-                json_str = json_match.group(1)
-            else:
-                # JSON 객체 직접 찾기
-                json_match = re.search(r'\{.*\}', response, re.DOTALL)
-                if json_match:
-                    json_str = json_match.group(0)
-                else:
-                    raise ValueError("JSON not found")
+            response = self.bedrock_client.invoke_model_with_response_stream(
+                modelId=self.config.bedrock_model_id,
+                body=orjson.dumps(self._build_request_body(prompt, prompt_caching)),
+                contentType="application/json",
+                accept="application/json"
+            )
+        except ClientError as e:
+            # 프롬프트 캐싱 미지원 모델이면 캐싱 없이 재시도
+            if not prompt_caching or not _is_prompt_caching_error(e):
+                raise
+            self._disable_prompt_caching()
+            response = self.bedrock_client.invoke_model_with_response_stream(
+                modelId=self.config.bedrock_model_id,
+                body=orjson.dumps(self._build_request_body(prompt)),
+                contentType="application/json",
+                accept="application/json"
+            )
 
-            data = json.loads(json_str)
+        return response["body"]
 
-            # 점수를 등급으로 변환
-            score = data.get("score", 3)
-            grade = self.GRADE_MAP.get(round(score), "보통")
+    def _result_from_data(self, data: Dict[str, Any], criterion: str) -> EvaluationResult:
+        """도구 입력 JSON을 평가 결과로 변환"""
+        # 점수를 등급으로 변환
+        score = data.get("score", 3)
+        grade = self.GRADE_MAP.get(round(score), "보통")
 
-            return EvaluationResult(
-                criterion=self.criterion_name,
-                score=score,
-                grade=grade,
-                evidence=data.get("evidence", []),
-                comments=data.get("comments", ""),
-                pass_status=score >= 3,
-                sub_scores=data.get("sub_scores")
-            )
+        return EvaluationResult(
+            criterion=criterion,
+            score=score,
+            grade=grade,
+            evidence=data.get("evidence", []),
+            comments=data.get("comments", ""),
+            pass_status=score >= 3,
+            sub_scores=data.get("sub_scores")
+        )
 
-        except Exception as e:
-            print(f"[경고] 응답 파싱 실패: {e}")
-            # 기본 결과 반환
-            return EvaluationResult(
-                criterion=self.criterion_name,
-                score=0,
-                grade="파싱오류",
-                evidence=[],
-                comments=f"응답 파싱 실패: {response[:500]}",
-                pass_status=False
-            )
+    @staticmethod
+    def _parse_error_result(criterion: str) -> EvaluationResult:
+        """구조화 응답을 받지 못했을 때 기본 결과"""
+        return EvaluationResult(
+            criterion=criterion,
+            score=0,
+            grade="파싱오류",
+            evidence=[],
+            comments="평가 결과(submit_evaluation)를 받지 못했습니다.",
+            pass_status=False
+        )
+
+    def parse_evaluation_response(self, data: Optional[Dict[str, Any]]) -> EvaluationResult:
+        """도구 입력(평가 결과 JSON)을 평가 결과로 변환"""
+        if not data:
+            return self._parse_error_result(self.criterion_name)
+        return self._result_from_data(data, self.criterion_name)
 
     def evaluate(self, tech_id: str) -> EvaluationResult:
         """평가 실행"""
-        print(f"\n[평가] {tech_id} - {self.criterion_name}")
+        logger.info("[평가] %s - %s", tech_id, self.criterion_name)
 
         # 1. 관련 문서 검색
         queries = self._get_search_queries()
@@ -202,17 +510,141 @@ class BaseEvaluationAgent(ABC):
         # 2. 평가 프롬프트 생성
         prompt = self._get_evaluation_prompt(context, tech_id)
 
-        # 3. LLM 호출
-        response = self.invoke_llm(prompt)
+        # 3. LLM 호출 (도구 호출로 구조화된 결과 수신)
+        data = self.invoke_structured(prompt)
 
-        # 4. 결과 파싱
-        result = self.parse_evaluation_response(response)
+        # 4. 평가 결과 변환
+        result = self.parse_evaluation_response(data)
 
-        print(f"  → {result.grade} ({result.score}점)")
+        logger.info("  → %s (%s점)", result.grade, result.score)
         return result
 
+    def evaluate_batch(self, tech_ids: List[str]) -> Dict[str, EvaluationResult]:
+        """여러 신기술 일괄 평가 (Bedrock 배치 추론)
+
+        - 모든 프롬프트를 JSONL로 작성해 하나의 배치 작업으로 제출
+        - 배치 설정이 없거나 레코드 수가 최소 기준 미만이면 invoke_structured로 개별 호출
+        """
+        results = {}
+        prompts = {}
+
+        # 1. 프롬프트 일괄 생성
+        queries = self._get_search_queries()
+        for tech_id in tech_ids:
+            context = self.retrieve_context(tech_id, queries)
+            if not context:
+                results[tech_id] = EvaluationResult(
+                    criterion=self.criterion_name,
+                    score=0,
+                    grade="검색실패",
+                    evidence=[],
+                    comments="관련 문서를 찾을 수 없습니다.",
+                    pass_status=False
+                )
+                continue
+            prompts[tech_id] = self._get_evaluation_prompt(context, tech_id)
+
+        if not prompts:
+            return results
+
+        # 2. 배치 작업 실행 (불가능하면 개별 호출)
+        use_batch = (
+            self.config.bedrock_batch_role_arn
+            and len(prompts) >= self.config.batch_min_records
+        )
+        if use_batch:
+            responses = self._run_batch_job(prompts)
+        else:
+            responses = {tech_id: self.invoke_structured(p) for tech_id, p in prompts.items()}
+
+        # 3. recordId 기준으로 결과 변환
+        for tech_id in prompts:
+            data = responses.get(tech_id)
+            if data is None:
+                # 배치에서 누락된 레코드는 개별 호출로 보완
+                data = self.invoke_structured(prompts[tech_id])
+            results[tech_id] = self.parse_evaluation_response(data)
+
+        return results
+
+    def _run_batch_job(self, prompts: Dict[str, str]) -> Dict[str, Dict[str, Any]]:
+        """Bedrock 배치 추론 작업 제출 및 결과 수집 (recordId -> 도구 입력 JSON)"""
+        uploader = S3Uploader(self.config)
+        s3_client = uploader.s3_client
+        bedrock = get_client("bedrock", self.config.bedrock_region)
+
+        job_name = f"cnt-eval-{uuid.uuid4().hex[:12]}"
+        prefix = f"{self.config.s3_batch_prefix}{job_name}/"
+        input_key = f"{prefix}input.jsonl"
+
+        # JSONL 입력 파일 작성 (recordId = tech_id)
+        lines = [
+            orjson.dumps({
+                "recordId": tech_id,
+                "modelInput": self._build_request_body(prompt, structured=True)
+            })
+            for tech_id, prompt in prompts.items()
+        ]
+        s3_client.put_object(
+            Bucket=self.config.s3_bucket,
+            Key=input_key,
+            Body=b"\n".join(lines),
+            ContentType="application/jsonl"
+        )
+
+        job = bedrock.create_model_invocation_job(
+            jobName=job_name,
+            roleArn=self.config.bedrock_batch_role_arn,
+            modelId=self.config.bedrock_model_id,
+            inputDataConfig={
+                "s3InputDataConfig": {"s3Uri": f"s3://{self.config.s3_bucket}/{input_key}"}
+            },
+            outputDataConfig={
+                "s3OutputDataConfig": {"s3Uri": f"s3://{self.config.s3_bucket}/{prefix}output/"}
+            }
+        )
+        job_arn = job["jobArn"]
+        logger.info("[배치] 작업 제출: %s (%d건)", job_name, len(prompts))
+
+        # 완료까지 대기 (제한 시간 초과 시 작업 중지)
+        deadline = time.monotonic() + self.config.batch_timeout
+        while True:
+            status = bedrock.get_model_invocation_job(jobIdentifier=job_arn)["status"]
+            if status in ("Completed", "PartiallyCompleted", "Failed", "Stopped", "Expired"):
+                break
+            if time.monotonic() >= deadline:
+                logger.warning("[경고] 배치 작업 대기 시간 초과 (%d초), 작업 중지: %s", self.config.batch_timeout, job_name)
+                try:
+                    bedrock.stop_model_invocation_job(jobIdentifier=job_arn)
+                except ClientError as e:
+                    logger.error("[오류] 배치 작업 중지 실패: %s", e)
+                return {}
+            time.sleep(self.config.batch_poll_interval)
+
+        logger.info("[배치] 작업 종료: %s", status)
+        if status not in ("Completed", "PartiallyCompleted"):
+            return {}
+
+        # 출력 파일(*.jsonl.out) 수집 (1000개 초과 시 다음 페이지까지)
+        responses = {}
+        for obj in uploader.iter_objects(f"{prefix}output/"):
+            if not obj["Key"].endswith(".jsonl.out"):
+                continue
+            body = s3_client.get_object(Bucket=self.config.s3_bucket, Key=obj["Key"])["Body"].read()
+            for line in body.splitlines():
+                if not line.strip():
+                    continue
+                record = orjson.loads(line)
+                output = record.get("modelOutput") or {}
+                for block in output.get("content", []):
+                    if block.get("type") == "tool_use" and block.get("name") == _TOOL_NAME:
+                        responses[record["recordId"]] = block["input"]
+                        break
+
+        return responses
+
     @abstractmethod
-    def _get_search_queries(self) -> List[str]:
+    def _get_search_queries(self) -> Sequence[str]:
         """검색 쿼리 목록 반환 (하위 클래스에서 구현)"""
         pass
 
@@ -230,7 +662,7 @@ class MockEvaluationAgent(BaseEvaluationAgent):
     def _get_evaluation_prompt(self, context: str, tech_id: str) -> str:
         return f"테스트 평가 프롬프트: {tech_id}"
 
-    def _get_search_queries(self) -> List[str]:
+    def _get_search_queries(self) -> Sequence[str]:
         return ["테스트 쿼리"]
 
     def evaluate(self, tech_id: str) -> EvaluationResult:
@@ -246,6 +678,8 @@ class MockEvaluationAgent(BaseEvaluationAgent):
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+
     # 테스트
     print("=== 평가 에이전트 테스트 ===")
 
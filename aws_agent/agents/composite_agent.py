@@ -0,0 +1,160 @@
+"""
+통합 평가 에이전트
+- 신규성, 진보성, 현장적용성을 한 번의 LLM 호출로 평가
+- 검색 컨텍스트를 세 항목이 공유
+"""
+
+import logging
+from typing import Any, Dict, Optional, Sequence
+
+from aws_agent.agents.base_agent import BaseEvaluationAgent, EvaluationResult, _EVALUATION_SCHEMA
+from aws_agent.agents.novelty_agent import (
+    NoveltyEvaluationAgent, _NOVELTY_SYSTEM_PROMPT, _NOVELTY_QUERIES
+)
+from aws_agent.agents.progress_agent import (
+    ProgressEvaluationAgent, _PROGRESS_SYSTEM_PROMPT, _PROGRESS_QUERIES
+)
+from aws_agent.agents.field_agent import (
+    FieldExcellenceAgent, _FIELD_SYSTEM_PROMPT, _FIELD_QUERIES
+)
+from aws_agent.config import AWSConfig
+
+logger = logging.getLogger(__name__)
+
+
+_RUBRICS = "\n\n".join(
+    f"# [{json_key}] {name} 평가 기준\n\n{prompt}"
+    for json_key, name, prompt in (
+        ("novelty", "신규성", _NOVELTY_SYSTEM_PROMPT),
+        ("progress", "진보성", _PROGRESS_SYSTEM_PROMPT),
+        ("field", "현장적용성", _FIELD_SYSTEM_PROMPT),
+    )
+)
+
+_COMPOSITE_SYSTEM_PROMPT = f"""{_RUBRICS}
+
+# 통합 제출 형식
+위 세 가지 평가 기준을 모두 적용하되, 각 기준의 제출 형식 인자를
+submit_evaluation 도구의 "novelty", "progress", "field" 인자에 각각 넣어 한 번에 제출하세요.
+각 항목 인자는 score, sub_scores, evidence, comments로 구성됩니다."""
+
+# 통합 평가 결과 도구 입력 스키마 (항목별 평가 스키마를 키별로 묶음)
+_COMPOSITE_SCHEMA = {
+    "type": "object",
+    "properties": {key: _EVALUATION_SCHEMA for key in ("novelty", "progress", "field")},
+    "required": ["novelty", "progress", "field"]
+}
+
+# 세 에이전트 쿼리의 합집합 (순서 유지, 중복 제거)
+_COMPOSITE_QUERIES = tuple(dict.fromkeys(
+    _NOVELTY_QUERIES + _PROGRESS_QUERIES + _FIELD_QUERIES
+))
+
+
+class CompositeEvaluationAgent(BaseEvaluationAgent):
+    """통합 평가 에이전트 (신규성 + 진보성 + 현장적용성)"""
+
+    # 도구 인자 키 -> (결과 키, 평가 항목명, 원본 에이전트)
+    CRITERIA = {
+        "novelty": ("novelty", "신규성", NoveltyEvaluationAgent),
+        "progress": ("progressiveness", "진보성", ProgressEvaluationAgent),
+        "field": ("field_applicability", "현장적용성", FieldExcellenceAgent),
+    }
+
+    def __init__(self, config: AWSConfig = None):
+        super().__init__(config)
+        self.criterion_name = "종합"
+
+    def _get_system_prompt(self) -> str:
+        return _COMPOSITE_SYSTEM_PROMPT
+
+    def _get_evaluation_prompt(self, context: str, tech_id: str) -> str:
+        return f"""## 평가 대상
+신기술 번호: {tech_id}
+
+## 검색된 관련 문서
+{context}
+
+## 평가 지시사항
+
+위 문서를 바탕으로 신기술 {tech_id}의 **신규성**, **진보성**, **현장적용성**을 각각 평가해주세요.
+각 항목은 시스템 프롬프트의 해당 평가 기준과 가중치를 따릅니다.
+
+### 출력:
+submit_evaluation 도구로 통합 평가 결과(novelty / progress / field)를 제출하세요."""
+
+    def _get_search_queries(self) -> Sequence[str]:
+        return _COMPOSITE_QUERIES
+
+    def _get_result_schema(self) -> Dict[str, Any]:
+        return _COMPOSITE_SCHEMA
+
+    def parse_composite_response(self, data: Optional[Dict[str, Any]]) -> Dict[str, EvaluationResult]:
+        """통합 도구 입력을 항목별 평가 결과로 분리"""
+        data = data or {}
+
+        results = {}
+        for json_key, (result_key, name, _) in self.CRITERIA.items():
+            section = data.get(json_key)
+            if isinstance(section, dict):
+                results[result_key] = self._result_from_data(section, name)
+            else:
+                results[result_key] = self._parse_error_result(name)
+        return results
+
+    def evaluate_all(self, tech_id: str) -> Dict[str, EvaluationResult]:
+        """세 항목 통합 평가 (검색 1회 + LLM 호출 1회)"""
+        logger.info("[평가] %s - %s", tech_id, self.criterion_name)
+
+        context = self.retrieve_context(tech_id, self._get_search_queries())
+
+        if not context:
+            return {
+                result_key: EvaluationResult(
+                    criterion=name,
+                    score=0,
+                    grade="검색실패",
+                    evidence=[],
+                    comments="관련 문서를 찾을 수 없습니다.",
+                    pass_status=False
+                )
+                for result_key, name, _ in self.CRITERIA.values()
+            }
+
+        data = self.invoke_structured(self._get_evaluation_prompt(context, tech_id))
+        results = self.parse_composite_response(data)
+
+        for result in results.values():
+            logger.info("  → %s: %s (%s점)", result.criterion, result.grade, result.score)
+        return results
+
+    def parse_evaluation_response(self, data: Optional[Dict[str, Any]]) -> EvaluationResult:
+        """통합 도구 입력을 종합 결과 하나로 변환 (evaluate / evaluate_batch 경로)"""
+        return self._combine(self.parse_composite_response(data))
+
+    def _combine(self, results: Dict[str, EvaluationResult]) -> EvaluationResult:
+        """항목별 결과를 종합 결과로 병합 (점수는 평균)"""
+        score = sum(r.score for r in results.values()) / len(results)
+        return EvaluationResult(
+            criterion=self.criterion_name,
+            score=score,
+            grade=self.GRADE_MAP.get(round(score), "보통"),
+            evidence=[e for r in results.values() for e in r.evidence],
+            comments="\n".join(f"[{r.criterion}] {r.comments}" for r in results.values()),
+            pass_status=all(r.pass_status for r in results.values()),
+            sub_scores={r.criterion: r.score for r in results.values()}
+        )
+
+    def evaluate(self, tech_id: str) -> EvaluationResult:
+        """통합 평가 후 종합 결과 반환"""
+        return self._combine(self.evaluate_all(tech_id))
+
+
+if __name__ == "__main__":
+    # 테스트
+    print("=== 통합 평가 에이전트 테스트 ===")
+
+    agent = CompositeEvaluationAgent()
+
+    print("\n시스템 프롬프트 길이:", len(agent.system_prompt))
+    print("\n검색 쿼리:", agent._get_search_queries())
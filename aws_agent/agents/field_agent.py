@@ -5,24 +5,13 @@
 - 보급성 (시장성, 공익성)
 """
 
-from typing import List
-from pathlib import Path
+from typing import Sequence
 
-import sys
-sys.path.append(str(Path(__file__).parent.parent.parent))
 from aws_agent.agents.base_agent import BaseEvaluationAgent, EvaluationResult
 from aws_agent.config import AWSConfig
 
 
-class FieldExcellenceAgent(BaseEvaluationAgent):
-    """현장적용성 평가 에이전트 (2차 심사)"""
-
-    def __init__(self, config: AWSConfig = None):
-        super().__init__(config)
-        self.criterion_name = "현장적용성"
-
-    def _get_system_prompt(self) -> str:
-        return """당신은 대한민국 국토교통과학기술진흥원의 건설신기술(CNT) 심사위원입니다.
+_FIELD_SYSTEM_PROMPT = """당신은 대한민국 국토교통과학기술진흥원의 건설신기술(CNT) 심사위원입니다.
 
 ## 역할
 건설기술진흥법 제14조제1항에 따른 건설신기술 2차심사 전문가로서 "현장적용성" 항목을 평가합니다.
@@ -92,33 +81,33 @@ class FieldExcellenceAgent(BaseEvaluationAgent):
 - 경제성: 절감, 저감, 단축, 비용, 공기, 효율, 경제 (평균 129회)
 - 환경성: 환경, 친환경, 저탄소, 재활용 (평균 85.3회)
 
-## 응답 형식
-반드시 아래 JSON 형식으로 응답하세요:
-```json
-{
-  "score": 0.0,
-  "sub_scores": {
-    "field_excellence": 0.0,
-    "economy": 0.0,
-    "marketability": 0.0
-  },
-  "evidence": [
-    {
-      "type": "현장우수성" 또는 "경제성" 또는 "보급성",
-      "sub_type": "시공성/안전성/비용절감 등",
-      "content": "근거 내용",
-      "location": "문서/페이지 위치",
-      "quantitative_data": "정량적 수치"
-    }
-  ],
-  "field_records": {
-    "count": 0,
-    "sites": ["현장명1", "현장명2"],
-    "has_client_confirmation": true/false
-  },
-  "comments": "종합 평가 의견"
-}
-```"""
+## 제출 형식
+submit_evaluation 도구의 인자로 평가 결과를 제출하세요:
+- score: 종합 점수 (1~5)
+- sub_scores: field_excellence(현장우수성), economy(경제성), marketability(보급성) 점수
+- evidence: 근거 목록 (type: "현장우수성" / "경제성" / "보급성", sub_type: 시공성/안전성/비용절감 등, content: 근거 내용, location: 문서/페이지 위치, quantitative_data: 정량적 수치)
+- comments: 종합 평가 의견 (현장 적용 실적 건수, 현장명, 발주처 확인 여부 포함)"""
+
+_FIELD_QUERIES = (
+    "현장적용 실적 시공사례 발주처",
+    "시공성 시공방법 작업 효율",
+    "비용 절감 공사비 원가계산서",
+    "공기단축 공사기간 공정",
+    "유지관리 보수 점검",
+    "환경 친환경 소음 진동 저감",
+    "시장성 수요 보급 적용분야",
+)
+
+
+class FieldExcellenceAgent(BaseEvaluationAgent):
+    """현장적용성 평가 에이전트 (2차 심사)"""
+
+    def __init__(self, config: AWSConfig = None):
+        super().__init__(config)
+        self.criterion_name = "현장적용성"
+
+    def _get_system_prompt(self) -> str:
+        return _FIELD_SYSTEM_PROMPT
 
     def _get_evaluation_prompt(self, context: str, tech_id: str) -> str:
         return f"""## 평가 대상
@@ -158,29 +147,13 @@ class FieldExcellenceAgent(BaseEvaluationAgent):
 - 원가계산서, 경제성 분석자료 확인
 
 ### 출력:
-반드시 JSON 형식으로 평가 결과를 제시하세요."""
+submit_evaluation 도구로 평가 결과를 제출하세요."""
 
-    def _get_search_queries(self) -> List[str]:
-        return [
-            "현장적용 실적 시공사례 발주처",
-            "시공성 시공방법 작업 효율",
-            "비용 절감 공사비 원가계산서",
-            "공기단축 공사기간 공정",
-            "유지관리 보수 점검",
-            "환경 친환경 소음 진동 저감",
-            "시장성 수요 보급 적용분야"
-        ]
+    def _get_search_queries(self) -> Sequence[str]:
+        return _FIELD_QUERIES
 
 
-class EconomyAgent(BaseEvaluationAgent):
-    """경제성 세부 평가 에이전트"""
-
-    def __init__(self, config: AWSConfig = None):
-        super().__init__(config)
-        self.criterion_name = "경제성"
-
-    def _get_system_prompt(self) -> str:
-        return """당신은 건설신기술 경제성 평가 전문가입니다.
+_ECONOMY_SYSTEM_PROMPT = """당신은 건설신기술 경제성 평가 전문가입니다.
 
 ## 평가 항목
 
@@ -205,19 +178,29 @@ class EconomyAgent(BaseEvaluationAgent):
 | 비용절감 | 20%+ | 10-20% | 5-10% | <5% |
 | 공기단축 | 30%+ | 15-30% | 5-15% | <5% |
 
-## 응답 형식
-```json
-{
-  "score": 0.0,
-  "sub_scores": {
-    "cost_reduction": 0.0,
-    "time_reduction": 0.0,
-    "maintenance_cost": 0.0
-  },
-  "evidence": [...],
-  "comments": ""
-}
-```"""
+## 제출 형식
+submit_evaluation 도구의 인자로 평가 결과를 제출하세요:
+- score: 종합 점수 (1~5)
+- sub_scores: cost_reduction(비용절감), time_reduction(공기단축), maintenance_cost(유지관리비) 점수
+- evidence: 근거 목록 (type, content, location)
+- comments: 종합 평가 의견"""
+
+_ECONOMY_QUERIES = (
+    "비용 절감 공사비 원가",
+    "공기단축 공사기간 공정",
+    "유지관리비 LCC 수명주기",
+)
+
+
+class EconomyAgent(BaseEvaluationAgent):
+    """경제성 세부 평가 에이전트"""
+
+    def __init__(self, config: AWSConfig = None):
+        super().__init__(config)
+        self.criterion_name = "경제성"
+
+    def _get_system_prompt(self) -> str:
+        return _ECONOMY_SYSTEM_PROMPT
 
     def _get_evaluation_prompt(self, context: str, tech_id: str) -> str:
         return f"""신기술 {tech_id}의 경제성을 평가하세요.
@@ -227,12 +210,8 @@ class EconomyAgent(BaseEvaluationAgent):
 
 정량적 수치(절감률, 단축률)를 찾아 평가하세요."""
 
-    def _get_search_queries(self) -> List[str]:
-        return [
-            "비용 절감 공사비 원가",
-            "공기단축 공사기간 공정",
-            "유지관리비 LCC 수명주기"
-        ]
+    def _get_search_queries(self) -> Sequence[str]:
+        return _ECONOMY_QUERIES
 
 
 if __name__ == "__main__":
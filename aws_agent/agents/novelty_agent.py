@@ -4,24 +4,13 @@
 - 독창성 및 자립성
 """
 
-from typing import List
-from pathlib import Path
+from typing import Sequence
 
-import sys
-sys.path.append(str(Path(__file__).parent.parent.parent))
 from aws_agent.agents.base_agent import BaseEvaluationAgent, EvaluationResult
 from aws_agent.config import AWSConfig
 
 
-class NoveltyEvaluationAgent(BaseEvaluationAgent):
-    """신규성 평가 에이전트"""
-
-    def __init__(self, config: AWSConfig = None):
-        super().__init__(config)
-        self.criterion_name = "신규성"
-
-    def _get_system_prompt(self) -> str:
-        return """당신은 대한민국 국토교통과학기술진흥원의 건설신기술(CNT) 심사위원입니다.
+_NOVELTY_SYSTEM_PROMPT = """당신은 대한민국 국토교통과학기술진흥원의 건설신기술(CNT) 심사위원입니다.
 
 ## 역할
 건설기술진흥법 제14조제1항에 따른 건설신기술 심사 전문가로서 "신규성" 항목을 평가합니다.
@@ -55,25 +44,30 @@ class NoveltyEvaluationAgent(BaseEvaluationAgent):
 
 ## 통과 제안서 특허 보유율: 98%
 
-## 응답 형식
-반드시 아래 JSON 형식으로 응답하세요:
-```json
-{
-  "score": 0.0,
-  "sub_scores": {
-    "differentiation": 0.0,
-    "originality": 0.0
-  },
-  "evidence": [
-    {
-      "type": "차별성" 또는 "독창성",
-      "content": "근거 내용",
-      "location": "문서/페이지 위치"
-    }
-  ],
-  "comments": "종합 평가 의견"
-}
-```"""
+## 제출 형식
+submit_evaluation 도구의 인자로 평가 결과를 제출하세요:
+- score: 종합 점수 (1~5)
+- sub_scores: differentiation(차별성), originality(독창성) 점수
+- evidence: 근거 목록 (type: "차별성" 또는 "독창성", content: 근거 내용, location: 문서/페이지 위치)
+- comments: 종합 평가 의견"""
+
+_NOVELTY_QUERIES = (
+    "선행기술조사 기존기술 비교 차별성",
+    "특허 지식재산권 등록 출원",
+    "독자개발 독창 신규 최초",
+    "기술 차별화 요소 핵심기술",
+)
+
+
+class NoveltyEvaluationAgent(BaseEvaluationAgent):
+    """신규성 평가 에이전트"""
+
+    def __init__(self, config: AWSConfig = None):
+        super().__init__(config)
+        self.criterion_name = "신규성"
+
+    def _get_system_prompt(self) -> str:
+        return _NOVELTY_SYSTEM_PROMPT
 
     def _get_evaluation_prompt(self, context: str, tech_id: str) -> str:
         return f"""## 평가 대상
@@ -103,15 +97,10 @@ class NoveltyEvaluationAgent(BaseEvaluationAgent):
 - 선행기술 비교분석 내용 확인
 
 ### 출력:
-반드시 JSON 형식으로 평가 결과를 제시하세요."""
-
-    def _get_search_queries(self) -> List[str]:
-        return [
-            "선행기술조사 기존기술 비교 차별성",
-            "특허 지식재산권 등록 출원",
-            "독자개발 독창 신규 최초",
-            "기술 차별화 요소 핵심기술"
-        ]
+submit_evaluation 도구로 평가 결과를 제출하세요."""
+
+    def _get_search_queries(self) -> Sequence[str]:
+        return _NOVELTY_QUERIES
 
 
 if __name__ == "__main__":
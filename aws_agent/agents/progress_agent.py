@@ -6,24 +6,13 @@
 - 개량정도
 """
 
-from typing import List
-from pathlib import Path
+from typing import Sequence
 
-import sys
-sys.path.append(str(Path(__file__).parent.parent.parent))
 from aws_agent.agents.base_agent import BaseEvaluationAgent, EvaluationResult
 from aws_agent.config import AWSConfig
 
 
-class ProgressEvaluationAgent(BaseEvaluationAgent):
-    """진보성 평가 에이전트"""
-
-    def __init__(self, config: AWSConfig = None):
-        super().__init__(config)
-        self.criterion_name = "진보성"
-
-    def _get_system_prompt(self) -> str:
-        return """당신은 대한민국 국토교통과학기술진흥원의 건설신기술(CNT) 심사위원입니다.
+_PROGRESS_SYSTEM_PROMPT = """당신은 대한민국 국토교통과학기술진흥원의 건설신기술(CNT) 심사위원입니다.
 
 ## 역할
 건설기술진흥법 제14조제1항에 따른 건설신기술 심사 전문가로서 "진보성" 항목을 평가합니다.
@@ -63,28 +52,31 @@ class ProgressEvaluationAgent(BaseEvaluationAgent):
 ## 핵심 키워드 (통과 제안서 평균 288.8회 언급)
 향상, 개선, 증가, 우수, 효과, 성능, 품질
 
-## 응답 형식
-반드시 아래 JSON 형식으로 응답하세요:
-```json
-{
-  "score": 0.0,
-  "sub_scores": {
-    "quality_improvement": 0.0,
-    "safety": 0.0,
-    "advanced_tech": 0.0,
-    "improvement_degree": 0.0
-  },
-  "evidence": [
-    {
-      "type": "품질향상" 또는 "안전성" 또는 "첨단기술성" 또는 "개량정도",
-      "content": "근거 내용",
-      "location": "문서/페이지 위치",
-      "quantitative_data": "정량적 수치 (있는 경우)"
-    }
-  ],
-  "comments": "종합 평가 의견"
-}
-```"""
+## 제출 형식
+submit_evaluation 도구의 인자로 평가 결과를 제출하세요:
+- score: 종합 점수 (1~5)
+- sub_scores: quality_improvement(품질향상), safety(안전성), advanced_tech(첨단기술성), improvement_degree(개량정도) 점수
+- evidence: 근거 목록 (type: "품질향상" / "안전성" / "첨단기술성" / "개량정도", content: 근거 내용, location: 문서/페이지 위치, quantitative_data: 정량적 수치 (있는 경우))
+- comments: 종합 평가 의견"""
+
+_PROGRESS_QUERIES = (
+    "성능 시험 품질 향상 개선 효과",
+    "공인기관 시험성적서 KICT KTR",
+    "구조계산서 안전성 시험 인증",
+    "스마트건설 ICT IoT AI 첨단기술",
+    "기존기술 문제점 해결 개량 개선",
+)
+
+
+class ProgressEvaluationAgent(BaseEvaluationAgent):
+    """진보성 평가 에이전트"""
+
+    def __init__(self, config: AWSConfig = None):
+        super().__init__(config)
+        self.criterion_name = "진보성"
+
+    def _get_system_prompt(self) -> str:
+        return _PROGRESS_SYSTEM_PROMPT
 
     def _get_evaluation_prompt(self, context: str, tech_id: str) -> str:
         return f"""## 평가 대상
@@ -123,16 +115,10 @@ class ProgressEvaluationAgent(BaseEvaluationAgent):
 - 구조계산서, 안전인증서 존재 여부
 
 ### 출력:
-반드시 JSON 형식으로 평가 결과를 제시하세요."""
-
-    def _get_search_queries(self) -> List[str]:
-        return [
-            "성능 시험 품질 향상 개선 효과",
-            "공인기관 시험성적서 KICT KTR",
-            "구조계산서 안전성 시험 인증",
-            "스마트건설 ICT IoT AI 첨단기술",
-            "기존기술 문제점 해결 개량 개선"
-        ]
+submit_evaluation 도구로 평가 결과를 제출하세요."""
+
+    def _get_search_queries(self) -> Sequence[str]:
+        return _PROGRESS_QUERIES
 
 
 if __name__ == "__main__":
@@ -4,18 +4,144 @@ KISTI ScienceON API 클라이언트
 - AES256 암호화 기반 토큰 인증
 """
 
+import io
 import os
-import json
+import logging
+import time
+import asyncio
+import threading
 import base64
 import hashlib
 import urllib.parse
+from functools import lru_cache
 from datetime import datetime, timedelta
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Tuple
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from Crypto.Cipher import AES
 from Crypto.Util.Padding import pad, unpad
+import orjson
 import requests
+import urllib3
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import xml.etree.ElementTree as ET
+from dotenv import load_dotenv
+
+logger = logging.getLogger("aws_agent.api.kisti")
+
+# .env 파일 로드 (모듈 로드 시 1회, KISTIConfig 기본값이 환경 변수를 읽음)
+load_dotenv()
+
+# XML 파서: lxml(libxml2) 우선, 없으면 ElementTree
+try:
+    import lxml.etree as LET
+    _HAS_LXML = True
+    _iterparse = LET.iterparse
+    _XML_ERRORS = (ET.ParseError, LET.XMLSyntaxError)
+except ImportError:
+    _HAS_LXML = False
+    _iterparse = ET.iterparse
+    _XML_ERRORS = (ET.ParseError,)
+
+# 다중 페이지 동시 검색용 HTTP/2 클라이언트 (선택)
+try:
+    import httpx
+    _HAS_HTTPX = True
+except ImportError:
+    _HAS_HTTPX = False
+
+# AES 백엔드: cryptography(OpenSSL EVP, AES-NI 자동 사용) 우선, 없으면 pycryptodome
+try:
+    from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
+    _HAS_CRYPTOGRAPHY = True
+except ImportError:
+    _HAS_CRYPTOGRAPHY = False
+    try:
+        from Crypto.Util._cpu_features import have_aes_ni
+        if not have_aes_ni():
+            logger.warning("AES-NI 미지원 환경: pycryptodome 소프트웨어 AES 사용")
+    except ImportError:
+        pass
+
+# 토큰 요청 경로에서 반복 사용하는 함수 (속성 조회 생략)
+_AES_new = AES.new
+_b64encode = base64.urlsafe_b64encode
+_quote = urllib.parse.quote
+
+# KISTI 서버 인증서 이슈로 verify_ssl=False 사용 시 경고 억제 (모듈 로드 시 1회)
+urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+
+
+@lru_cache(maxsize=1024)
+def _encode_search_query(search_field: str, query: str) -> str:
+    """searchQuery 파라미터 JSON 생성 (페이지 이동/반복 검색 시 재사용)"""
+    return orjson.dumps({search_field: query}).decode('utf-8')
+
+
+def _parse_kisti_ts(s: str) -> datetime:
+    """KISTI 시각 문자열(YYYY-MM-DD HH:MM:SS...) 파싱 (고정 폭 슬라이싱)"""
+    return datetime(
+        int(s[0:4]), int(s[5:7]), int(s[8:10]),
+        int(s[11:13]), int(s[14:16]), int(s[17:19])
+    )
+
+
+# 레코드 필드 매핑: (출력 키, 주 metaCode, 대체 metaCode)
+_COMMON_FIELDS = (
+    ("cn", "CN", "ArticleId"),
+    ("title", "Title", "TI"),
+    ("title_en", "Title2", "TI_EN"),
+)
+_FIELD_MAP = {
+    "ARTI": (  # 논문
+        ("authors", "Authors", "AU"),
+        ("journal", "JournalName", "JT"),
+        ("volume", "VolNo1", "VO"),
+        ("issue", "VolNo2", "IS"),
+        ("year", "Pubyear", "PY"),
+        ("doi", "DOI", None),
+        ("issn", "ISSN", None),
+        ("abstract", "Abstract", "AB"),
+        ("keywords", "Keyword", "KW"),
+        ("publisher", "Publisher", None),
+    ),
+    "PATENT": (  # 특허
+        ("applicant", "Applicant", "AP"),
+        ("inventor", "Inventor", "IN"),
+        ("application_no", "ApplicationNo", "AN"),
+        ("publication_no", "PublicationNo", "PN"),
+        ("application_date", "ApplicationDate", "AD"),
+        ("publication_date", "PublicationDate", "PD"),
+        ("ipc", "IPC", None),
+        ("abstract", "Abstract", "AB"),
+    ),
+    "REPORT": (  # 보고서
+        ("authors", "Authors", "AU"),
+        ("organization", "Organization", "OG"),
+        ("year", "Pubyear", "PY"),
+        ("report_no", "ReportNo", "RN"),
+        ("abstract", "Abstract", "AB"),
+        ("keywords", "Keyword", "KW"),
+    ),
+    "ATT": (  # 동향
+        ("authors", "Authors", "AU"),
+        ("source", "Source", "SO"),
+        ("year", "Pubyear", "PY"),
+        ("abstract", "Abstract", "AB"),
+        ("keywords", "Keyword", "KW"),
+    ),
+}
+_FIELDS_BY_TARGET = {target: _COMMON_FIELDS + fields for target, fields in _FIELD_MAP.items()}
+
+
+def _wanted_codes(fields: tuple) -> frozenset:
+    """필드 매핑에서 실제로 읽는 metaCode 집합"""
+    return frozenset(code for _, primary, fallback in fields for code in (primary, fallback) if code)
+
+
+_COMMON_CODES = _wanted_codes(_COMMON_FIELDS)
+_CODES_BY_TARGET = {target: _wanted_codes(fields) for target, fields in _FIELDS_BY_TARGET.items()}
 
 
 @dataclass
@@ -51,19 +177,6 @@ class KISTIConfig:
     api_version: str = "1.0"
     verify_ssl: bool = False  # SSL 인증서 검증 (KISTI 서버 인증서 이슈로 비활성화)
 
-    def __post_init__(self):
-        """환경 변수에서 설정 로드"""
-        from dotenv import load_dotenv
-        load_dotenv()
-
-        # 환경 변수 다시 확인
-        if os.getenv("KISTI_API_KEY"):
-            self.api_key = os.getenv("KISTI_API_KEY")
-        if os.getenv("KISTI_CLIENT_ID"):
-            self.client_id = os.getenv("KISTI_CLIENT_ID")
-        if os.getenv("KISTI_MAC_ADDRESS"):
-            self.mac_address = os.getenv("KISTI_MAC_ADDRESS")
-
 
 class KISTIClient:
     """KISTI ScienceON API 클라이언트"""
@@ -76,6 +189,10 @@ class KISTIClient:
         "ATT": "ATT",        # 동향
     }
 
+    # 검색 결과 캐시 (동일 검색 재호출 시 HTTP 요청 생략)
+    SEARCH_CACHE_MAXSIZE = 1024
+    SEARCH_CACHE_TTL = 600  # 초 (Access Token 만료 시각을 넘지 않음)
+
     # KISTI 고정 IV (이 값이 핵심!)
     FIXED_IV = 'jvHJ1EFA0IXBrxxz'
     BLOCK_SIZE = 16
@@ -83,13 +200,50 @@ class KISTIClient:
     def __init__(self, config: KISTIConfig = None):
         self.config = config or KISTIConfig()
         self.token_info = KISTITokenInfo()
+        self.session = self._create_session()
+        self._next_recheck_monotonic = 0.0  # 토큰 유효성 재확인 시각 (monotonic)
+        # 토큰 발급/갱신 직렬화 (만료 시 동시 요청이 각자 갱신해 서로 덮어쓰지 않도록)
+        self._token_lock = threading.Lock()
+
+        # 검색 결과 캐시: 키 -> (만료 시각(monotonic), 결과)
+        self._search_cache: "OrderedDict[tuple, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self._search_cache_lock = threading.Lock()
+
+        # 호출마다 동일한 검색 파라미터
+        self._base_params = {
+            "client_id": self.config.client_id,
+            "version": self.config.api_version,
+            "action": "search",
+        }
 
-    def _pad(self, plain_txt: str) -> str:
-        """PKCS7 패딩 (문자열 기반)"""
-        number_of_bytes_to_pad = self.BLOCK_SIZE - len(plain_txt) % self.BLOCK_SIZE
-        ascii_str = chr(number_of_bytes_to_pad)
-        padding_str = number_of_bytes_to_pad * ascii_str
-        return plain_txt + padding_str
+        # 암호화 키/IV 바이트 (클라이언트 수명 동안 불변)
+        self._key_bytes = self.config.api_key.encode('utf-8')
+        self._iv_bytes = self.FIXED_IV.encode('utf-8')
+
+    @staticmethod
+    def _create_session() -> requests.Session:
+        """Keep-alive 연결 풀과 재시도가 설정된 HTTP 세션 생성"""
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=10,
+            pool_maxsize=10,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.3,
+                status_forcelist=[500, 502, 503, 504]
+            )
+        )
+        session.mount("https://", adapter)
+        return session
+
+    def get_session(self) -> requests.Session:
+        """공유 HTTP 세션 반환 (프록시/헤더 등 추가 설정용)"""
+        return self.session
+
+    def _pad(self, data_bytes: bytes) -> bytes:
+        """PKCS7 패딩 (바이트 기반, BLOCK_SIZE는 2의 거듭제곱)"""
+        pad_len = self.BLOCK_SIZE - (len(data_bytes) & (self.BLOCK_SIZE - 1))
+        return data_bytes + bytes((pad_len,)) * pad_len
 
     def _aes256_encrypt_kisti(self, data: str) -> str:
         """KISTI 공식 AES256 암호화 방식
@@ -98,16 +252,18 @@ class KISTIClient:
         - URL-safe Base64 인코딩
         - URL quote 적용
         """
-        key_bytes = self.config.api_key.encode('utf-8')
-        iv_bytes = self.FIXED_IV.encode('utf-8')
+        padded_bytes = self._pad(data.encode('utf-8'))
 
-        cipher = AES.new(key_bytes, AES.MODE_CBC, iv_bytes)
-        padded_txt = self._pad(data)
-        encrypted_bytes = cipher.encrypt(padded_txt.encode('utf-8'))
+        if _HAS_CRYPTOGRAPHY:
+            encryptor = Cipher(algorithms.AES(self._key_bytes), modes.CBC(self._iv_bytes)).encryptor()
+            encrypted_bytes = encryptor.update(padded_bytes) + encryptor.finalize()
+        else:
+            cipher = _AES_new(self._key_bytes, AES.MODE_CBC, self._iv_bytes)
+            encrypted_bytes = cipher.encrypt(padded_bytes)
 
         # URL-safe Base64 + URL 인코딩
-        encrypted_str = base64.urlsafe_b64encode(encrypted_bytes).decode('utf-8')
-        return urllib.parse.quote(encrypted_str, safe='')
+        encrypted_str = _b64encode(encrypted_bytes).decode('utf-8')
+        return _quote(encrypted_str, safe='')
 
     def _generate_accounts_param(self) -> str:
         """accounts 파라미터 생성 (KISTI 공식 방식)
@@ -117,17 +273,15 @@ class KISTIClient:
         - JSON 필드 순서: datetime 먼저, mac_address 다음
         - AES256-CBC with 고정 IV + URL-safe Base64
         """
-        import re
-
-        # 현재 시간 (숫자만 추출)
-        time_str = ''.join(re.findall(r"\d", datetime.now().strftime('%Y-%m-%d %H:%M:%S')))
+        # 현재 시간 (YYYYMMDDHHmmss)
+        time_str = datetime.now().strftime('%Y%m%d%H%M%S')
 
         # JSON 데이터 (datetime 먼저!)
         plain_data = {
             "datetime": time_str,
             "mac_address": self.config.mac_address
         }
-        json_data = json.dumps(plain_data, separators=(',', ':'))
+        json_data = orjson.dumps(plain_data).decode('utf-8')
 
         # AES256 암호화 (KISTI 공식 방식)
         encrypted = self._aes256_encrypt_kisti(json_data)
@@ -136,25 +290,22 @@ class KISTIClient:
 
     def request_token(self) -> bool:
         """토큰 발급 요청 (KISTI 공식 방식)"""
-        import urllib3
-        urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
-
         accounts = self._generate_accounts_param()
 
         # URL 직접 구성 (accounts는 이미 URL 인코딩됨)
         url = f"{self.config.base_url}/tokenrequest.do?client_id={self.config.client_id}&accounts={accounts}"
 
         try:
-            response = requests.get(url, timeout=30, verify=self.config.verify_ssl)
+            response = self.session.get(url, timeout=30, verify=self.config.verify_ssl)
 
             if response.status_code == 200:
-                data = response.json()
+                data = orjson.loads(response.content)
 
                 # 에러 체크
                 if "errorCode" in data:
                     error_code = data.get('errorCode')
                     error_msg = data.get('errorMessage')
-                    print(f"[KISTI 토큰 오류] {error_code}: {error_msg}")
+                    logger.error("[KISTI 토큰 오류] %s: %s", error_code, error_msg)
                     return False
 
                 # 토큰 정보 저장
@@ -164,33 +315,26 @@ class KISTIClient:
 
                 # 만료 시간 파싱
                 if data.get("access_token_expire"):
-                    self.token_info.access_token_expire = datetime.strptime(
-                        data["access_token_expire"][:19], "%Y-%m-%d %H:%M:%S"
-                    )
+                    self.token_info.access_token_expire = _parse_kisti_ts(data["access_token_expire"])
                 if data.get("refresh_token_expire"):
-                    self.token_info.refresh_token_expire = datetime.strptime(
-                        data["refresh_token_expire"][:19], "%Y-%m-%d %H:%M:%S"
-                    )
+                    self.token_info.refresh_token_expire = _parse_kisti_ts(data["refresh_token_expire"])
                 if data.get("issued_at"):
-                    self.token_info.issued_at = datetime.strptime(
-                        data["issued_at"][:19], "%Y-%m-%d %H:%M:%S"
-                    )
+                    self.token_info.issued_at = _parse_kisti_ts(data["issued_at"])
 
-                print(f"[KISTI] 토큰 발급 성공!")
-                print(f"  Access Token 만료: {self.token_info.access_token_expire}")
+                logger.info("[KISTI] 토큰 발급 성공 (Access Token 만료: %s)", self.token_info.access_token_expire)
                 return True
             else:
-                print(f"[KISTI 오류] HTTP {response.status_code}: {response.text}")
+                logger.error("[KISTI 오류] HTTP %s: %s", response.status_code, response.text)
                 return False
 
         except Exception as e:
-            print(f"[KISTI 오류] 토큰 요청 실패: {e}")
+            logger.error("[KISTI 오류] 토큰 요청 실패: %s", e)
             return False
 
     def refresh_access_token(self) -> bool:
         """Refresh Token으로 Access Token 재발급"""
         if not self.token_info.is_refresh_token_valid():
-            print("[KISTI] Refresh Token이 만료되었습니다. 새로운 토큰을 요청합니다.")
+            logger.info("[KISTI] Refresh Token이 만료되었습니다. 새로운 토큰을 요청합니다.")
             return self.request_token()
 
         url = f"{self.config.base_url}/tokenrequest.do"
@@ -200,40 +344,61 @@ class KISTIClient:
         }
 
         try:
-            response = requests.get(url, params=params, timeout=30, verify=self.config.verify_ssl)
+            response = self.session.get(url, params=params, timeout=30, verify=self.config.verify_ssl)
 
             if response.status_code == 200:
-                data = response.json()
+                data = orjson.loads(response.content)
 
                 if "errorCode" in data:
-                    print(f"[KISTI 토큰 갱신 오류] {data.get('errorCode')}: {data.get('errorMessage')}")
+                    logger.error("[KISTI 토큰 갱신 오류] %s: %s", data.get('errorCode'), data.get('errorMessage'))
                     return self.request_token()  # 실패 시 새 토큰 요청
 
                 # Access Token 업데이트
                 self.token_info.access_token = data.get("access_token", "")
                 if data.get("access_token_expire"):
-                    self.token_info.access_token_expire = datetime.strptime(
-                        data["access_token_expire"][:19], "%Y-%m-%d %H:%M:%S"
-                    )
+                    self.token_info.access_token_expire = _parse_kisti_ts(data["access_token_expire"])
 
-                print(f"[KISTI] Access Token 갱신 성공")
+                logger.info("[KISTI] Access Token 갱신 성공")
                 return True
             else:
                 return self.request_token()
 
         except Exception as e:
-            print(f"[KISTI 오류] 토큰 갱신 실패: {e}")
+            logger.error("[KISTI 오류] 토큰 갱신 실패: %s", e)
             return self.request_token()
 
     def ensure_valid_token(self) -> bool:
-        """유효한 토큰 확보"""
-        if self.token_info.is_access_token_valid():
+        """유효한 토큰 확보 (최근 확인 후 일정 시간은 재확인 생략)"""
+        if time.monotonic() < self._next_recheck_monotonic:
             return True
 
-        if self.token_info.is_refresh_token_valid():
-            return self.refresh_access_token()
+        with self._token_lock:
+            # 잠금 대기 중 다른 요청이 이미 확인/갱신했으면 그대로 사용
+            now = time.monotonic()
+            if now < self._next_recheck_monotonic:
+                return True
+
+            if self.token_info.is_access_token_valid():
+                valid = True
+            elif self.token_info.is_refresh_token_valid():
+                valid = self.refresh_access_token()
+            else:
+                valid = self.request_token()
+
+            if valid and self.token_info.access_token_expire:
+                # 만료 30초 전까지, 최대 60초 동안 재확인 생략
+                remaining = (self.token_info.access_token_expire - datetime.now()).total_seconds() - 30
+                if remaining > 0:
+                    self._next_recheck_monotonic = now + min(60.0, remaining)
 
-        return self.request_token()
+            return valid
+
+    def _renew_token(self, stale_token: str) -> bool:
+        """401 응답 후 토큰 갱신 (다른 요청이 이미 새 토큰을 받았으면 갱신 생략)"""
+        with self._token_lock:
+            if self.token_info.access_token != stale_token and self.token_info.is_access_token_valid():
+                return True
+            return self.refresh_access_token()
 
     def search(
         self,
@@ -243,7 +408,8 @@ class KISTIClient:
         cur_page: int = 1,
         row_count: int = 10,
         sort_field: str = "",
-        session_id: str = "cnt_eval_system"
+        session_id: str = "cnt_eval_system",
+        use_cache: bool = True
     ) -> Dict[str, Any]:
         """
         KISTI 검색 API 호출
@@ -256,10 +422,17 @@ class KISTIClient:
             row_count: 결과 수 (최대 100)
             sort_field: 정렬 필드
             session_id: 세션 ID
+            use_cache: 동일 검색의 캐시된 결과 사용 여부
 
         Returns:
             검색 결과 딕셔너리
         """
+        cache_key = (target.upper(), search_field, query, cur_page, min(row_count, 100), sort_field)
+        if use_cache:
+            cached = self._get_cached_search(cache_key)
+            if cached is not None:
+                return cached
+
         # 토큰 확인
         if not self.ensure_valid_token():
             return {"success": False, "error": "토큰 발급 실패"}
@@ -268,85 +441,224 @@ class KISTIClient:
         if target.upper() not in self.SERVICE_TARGETS:
             return {"success": False, "error": f"지원하지 않는 서비스: {target}"}
 
-        # 검색 쿼리 생성
-        search_query = json.dumps({search_field: query}, ensure_ascii=False)
-
         url = f"{self.config.base_url}/openapicall.do"
-        params = {
-            "client_id": self.config.client_id,
-            "token": self.token_info.access_token,
-            "version": self.config.api_version,
-            "action": "search",
-            "target": target.upper(),
-            "searchQuery": search_query,
-            "curPage": cur_page,
-            "rowCount": min(row_count, 100),  # 최대 100건
-            "session_id": session_id,
-        }
-
-        if sort_field:
-            params["sortField"] = sort_field
+        params = self._build_search_params(
+            target, query, search_field, cur_page, row_count, sort_field, session_id
+        )
 
         try:
-            response = requests.get(url, params=params, timeout=60, verify=self.config.verify_ssl)
+            response = self.session.get(url, params=params, timeout=60, verify=self.config.verify_ssl)
+
+            if response.status_code == 401:
+                # 토큰 만료 - 캐시 무효화, 갱신 후 재시도
+                self.clear_search_cache()
+                if not self._renew_token(params["token"]):
+                    return {"success": False, "error": "인증 실패"}
+                params["token"] = self.token_info.access_token
+                response = self.session.get(url, params=params, timeout=60, verify=self.config.verify_ssl)
+                if response.status_code != 200:
+                    return {"success": False, "error": "인증 실패"}
 
             if response.status_code == 200:
-                return self._parse_xml_response(response.text, target)
-            elif response.status_code == 401:
-                # 토큰 만료 - 갱신 후 재시도
-                if self.refresh_access_token():
-                    params["token"] = self.token_info.access_token
-                    response = requests.get(url, params=params, timeout=60, verify=self.config.verify_ssl)
-                    if response.status_code == 200:
-                        return self._parse_xml_response(response.text, target)
-                return {"success": False, "error": "인증 실패"}
+                result = self._parse_xml_response(response.text, target)
+                if use_cache and result.get("success"):
+                    self._put_cached_search(cache_key, result)
+                return result
             else:
                 return {"success": False, "error": f"HTTP {response.status_code}"}
 
         except Exception as e:
             return {"success": False, "error": str(e)}
 
+    def _get_cached_search(self, key: tuple) -> Optional[Dict[str, Any]]:
+        """캐시된 검색 결과 조회 (만료 시 제거)"""
+        with self._search_cache_lock:
+            entry = self._search_cache.get(key)
+            if entry is None:
+                return None
+            if time.monotonic() >= entry[0]:
+                del self._search_cache[key]
+                return None
+            self._search_cache.move_to_end(key)
+            # 호출자가 결과를 수정해도 캐시가 바뀌지 않도록 복사본 반환 (레코드 목록 포함)
+            result = dict(entry[1])
+            result["records"] = [dict(r) for r in result.get("records", [])]
+            return result
+
+    def _put_cached_search(self, key: tuple, result: Dict[str, Any]):
+        """검색 결과 저장 (TTL은 Access Token 남은 수명 이내)"""
+        ttl = self.SEARCH_CACHE_TTL
+        if self.token_info.access_token_expire:
+            ttl = min(ttl, (self.token_info.access_token_expire - datetime.now()).total_seconds())
+        if ttl <= 0:
+            return
+
+        with self._search_cache_lock:
+            self._search_cache[key] = (time.monotonic() + ttl, result)
+            self._search_cache.move_to_end(key)
+            if len(self._search_cache) > self.SEARCH_CACHE_MAXSIZE:
+                self._search_cache.popitem(last=False)
+
+    def clear_search_cache(self):
+        """검색 결과 캐시 비우기"""
+        with self._search_cache_lock:
+            self._search_cache.clear()
+
+    def _build_search_params(
+        self,
+        target: str,
+        query: str,
+        search_field: str,
+        cur_page: int,
+        row_count: int,
+        sort_field: str,
+        session_id: str
+    ) -> Dict[str, Any]:
+        """검색 API 요청 파라미터 생성"""
+        params = self._base_params.copy()
+        params["token"] = self.token_info.access_token
+        params["target"] = target.upper()
+        params["searchQuery"] = _encode_search_query(search_field, query)
+        params["curPage"] = cur_page
+        params["rowCount"] = min(row_count, 100)  # 최대 100건
+        params["session_id"] = session_id
+
+        if sort_field:
+            params["sortField"] = sort_field
+
+        return params
+
+    async def search_many(
+        self,
+        target: str,
+        query: str,
+        pages: List[int],
+        search_field: str = "BI",
+        row_count: int = 10,
+        sort_field: str = "",
+        session_id: str = "cnt_eval_system"
+    ) -> List[Dict[str, Any]]:
+        """여러 페이지 동시 검색 (페이지 순서대로 결과 반환)
+
+        httpx가 설치되어 있으면 HTTP/2 연결 하나에 페이지 요청을 다중화하고,
+        없으면 search()를 스레드에서 병렬 실행한다.
+        """
+        if not _HAS_HTTPX:
+            return list(await asyncio.gather(*(
+                asyncio.to_thread(
+                    self.search, target, query, search_field, page, row_count, sort_field, session_id
+                )
+                for page in pages
+            )))
+
+        # 토큰 확인
+        if not await asyncio.to_thread(self.ensure_valid_token):
+            return [{"success": False, "error": "토큰 발급 실패"} for _ in pages]
+
+        # 타겟 검증
+        if target.upper() not in self.SERVICE_TARGETS:
+            return [{"success": False, "error": f"지원하지 않는 서비스: {target}"} for _ in pages]
+
+        url = f"{self.config.base_url}/openapicall.do"
+
+        async def fetch(client, page: int) -> Dict[str, Any]:
+            params = self._build_search_params(
+                target, query, search_field, page, row_count, sort_field, session_id
+            )
+            try:
+                response = await client.get(url, params=params)
+                if response.status_code == 401:
+                    # 토큰 만료 - 갱신 후 재시도
+                    if not await asyncio.to_thread(self._renew_token, params["token"]):
+                        return {"success": False, "error": "인증 실패"}
+                    params["token"] = self.token_info.access_token
+                    response = await client.get(url, params=params)
+                if response.status_code == 200:
+                    return self._parse_xml_response(response.text, target)
+                return {"success": False, "error": f"HTTP {response.status_code}"}
+            except Exception as e:
+                return {"success": False, "error": str(e)}
+
+        limits = httpx.Limits(max_keepalive_connections=10, max_connections=20)
+        try:
+            client = httpx.AsyncClient(
+                http2=True, verify=self.config.verify_ssl, timeout=60, limits=limits
+            )
+        except ImportError:
+            # h2 패키지 미설치 시 HTTP/1.1 연결 풀 사용
+            client = httpx.AsyncClient(verify=self.config.verify_ssl, timeout=60, limits=limits)
+
+        async with client:
+            return list(await asyncio.gather(*(fetch(client, page) for page in pages)))
+
     def _parse_xml_response(self, xml_text: str, target: str) -> Dict[str, Any]:
-        """XML 응답 파싱"""
+        """XML 응답 파싱 (iterparse 스트리밍, recordList/record 단위로 메모리 해제)"""
+        status_code = None
+        error_code = None
+        error_msg = None
+        total_count = "0"
+        cur_page = "1"
+        records = []
+
         try:
-            root = ET.fromstring(xml_text)
-
-            # 에러 체크
-            status_code = root.findtext(".//statusCode")
-            if status_code and status_code != "200":
-                error_code = root.findtext(".//errorCode", "")
-                error_msg = root.findtext(".//errorMessage", "")
-                return {
-                    "success": False,
-                    "error": f"[{error_code}] {error_msg}",
-                    "status_code": status_code
-                }
-
-            # 결과 요약
-            total_count = int(root.findtext(".//TotalCount", "0"))
-            cur_page = int(root.findtext(".//curPage", "1"))
-
-            # 레코드 파싱
-            records = []
-            record_list = root.find(".//recordList")
-
-            if record_list is not None:
-                for record in record_list.findall("record"):
-                    record_data = self._parse_record(record, target)
+            source = io.BytesIO(xml_text.encode('utf-8'))
+            # 현재 요소의 상위 태그 경로 (recordList 바로 아래 record만 레코드로 취급)
+            path = []
+            for event, elem in _iterparse(source, events=("start", "end")):
+                tag = elem.tag
+                if event == "start":
+                    path.append(tag)
+                    continue
+                path.pop()
+
+                if tag == "record" and path and path[-1] == "recordList":
+                    record_data = self._parse_record(elem, target)
                     if record_data:
                         records.append(record_data)
+                    # 처리한 레코드 해제 (lxml은 앞선 형제 노드까지 제거)
+                    elem.clear()
+                    if _HAS_LXML:
+                        while elem.getprevious() is not None:
+                            del elem.getparent()[0]
+                    continue
+
+                if tag == "statusCode":
+                    status_code = elem.text or ""
+                elif tag == "errorCode":
+                    error_code = elem.text or ""
+                elif tag == "errorMessage":
+                    error_msg = elem.text or ""
+                elif tag == "TotalCount":
+                    total_count = elem.text or "0"
+                elif tag == "curPage":
+                    cur_page = elem.text or "1"
+                else:
+                    continue
+
+                # 오류 응답이면 나머지 문서는 읽지 않음
+                if (status_code and status_code != "200"
+                        and error_code is not None and error_msg is not None):
+                    break
+
+        except _XML_ERRORS as e:
+            return {"success": False, "error": f"XML 파싱 오류: {e}"}
 
+        # 에러 체크
+        if status_code and status_code != "200":
             return {
-                "success": True,
-                "target": target,
-                "total_count": total_count,
-                "current_page": cur_page,
-                "records_count": len(records),
-                "records": records
+                "success": False,
+                "error": f"[{error_code or ''}] {error_msg or ''}",
+                "status_code": status_code
             }
 
-        except ET.ParseError as e:
-            return {"success": False, "error": f"XML 파싱 오류: {e}"}
+        return {
+            "success": True,
+            "target": target,
+            "total_count": int(total_count),
+            "current_page": int(cur_page),
+            "records_count": len(records),
+            "records": records
+        }
 
     def _parse_record(self, record: ET.Element, target: str) -> Dict[str, Any]:
         """개별 레코드 파싱
@@ -355,54 +667,20 @@ class KISTIClient:
         """
         data = {}
 
-        # 모든 item 요소를 딕셔너리로 변환
+        # 출력 필드에 쓰이는 metaCode의 item만 딕셔너리로 변환
+        wanted = _CODES_BY_TARGET.get(target, _COMMON_CODES)
         items = {}
-        for item in record.findall("item"):
-            meta_code = item.get("metaCode", "")
-            if meta_code:
+        for item in record.iterfind("item"):
+            meta_code = item.get("metaCode")
+            if meta_code in wanted:
                 items[meta_code] = item.text or ""
 
-        # 공통 필드 매핑
-        data["cn"] = items.get("CN", items.get("ArticleId", ""))
-        data["title"] = items.get("Title", items.get("TI", ""))
-        data["title_en"] = items.get("Title2", items.get("TI_EN", ""))
-
-        if target == "ARTI":  # 논문
-            data["authors"] = items.get("Authors", items.get("AU", ""))
-            data["journal"] = items.get("JournalName", items.get("JT", ""))
-            data["volume"] = items.get("VolNo1", items.get("VO", ""))
-            data["issue"] = items.get("VolNo2", items.get("IS", ""))
-            data["year"] = items.get("Pubyear", items.get("PY", ""))
-            data["doi"] = items.get("DOI", "")
-            data["issn"] = items.get("ISSN", "")
-            data["abstract"] = items.get("Abstract", items.get("AB", ""))
-            data["keywords"] = items.get("Keyword", items.get("KW", ""))
-            data["publisher"] = items.get("Publisher", "")
-
-        elif target == "PATENT":  # 특허
-            data["applicant"] = items.get("Applicant", items.get("AP", ""))
-            data["inventor"] = items.get("Inventor", items.get("IN", ""))
-            data["application_no"] = items.get("ApplicationNo", items.get("AN", ""))
-            data["publication_no"] = items.get("PublicationNo", items.get("PN", ""))
-            data["application_date"] = items.get("ApplicationDate", items.get("AD", ""))
-            data["publication_date"] = items.get("PublicationDate", items.get("PD", ""))
-            data["ipc"] = items.get("IPC", "")
-            data["abstract"] = items.get("Abstract", items.get("AB", ""))
-
-        elif target == "REPORT":  # 보고서
-            data["authors"] = items.get("Authors", items.get("AU", ""))
-            data["organization"] = items.get("Organization", items.get("OG", ""))
-            data["year"] = items.get("Pubyear", items.get("PY", ""))
-            data["report_no"] = items.get("ReportNo", items.get("RN", ""))
-            data["abstract"] = items.get("Abstract", items.get("AB", ""))
-            data["keywords"] = items.get("Keyword", items.get("KW", ""))
-
-        elif target == "ATT":  # 동향
-            data["authors"] = items.get("Authors", items.get("AU", ""))
-            data["source"] = items.get("Source", items.get("SO", ""))
-            data["year"] = items.get("Pubyear", items.get("PY", ""))
-            data["abstract"] = items.get("Abstract", items.get("AB", ""))
-            data["keywords"] = items.get("Keyword", items.get("KW", ""))
+        # 필드 매핑 (주 metaCode가 없으면 대체 metaCode 사용)
+        for out_key, primary, fallback in _FIELDS_BY_TARGET.get(target, _COMMON_FIELDS):
+            value = items.get(primary)
+            if value is None:
+                value = items.get(fallback, "")
+            data[out_key] = value
 
         return data
 
@@ -435,6 +713,8 @@ def get_kisti_client() -> KISTIClient:
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+
     # 테스트
     print("=" * 60)
     print("KISTI ScienceON API 테스트")
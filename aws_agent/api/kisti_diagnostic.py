@@ -9,13 +9,22 @@ import sys
 import json
 import base64
 import hashlib
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timezone
 from Crypto.Cipher import AES
 from Crypto.Util.Padding import pad
 import requests
+from requests.adapters import HTTPAdapter
 import urllib3
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
+try:
+    from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
+    _HAS_CRYPTOGRAPHY = True
+except ImportError:
+    _HAS_CRYPTOGRAPHY = False
+
 # 환경변수에서 로드 시도
 try:
     from dotenv import load_dotenv
@@ -29,15 +38,67 @@ CLIENT_ID = os.getenv("KISTI_CLIENT_ID", "2cdbac21f1e013308bc27ebd2dc20353d7a301
 MAC_ADDRESS = os.getenv("KISTI_MAC_ADDRESS", "D8-43-AE-1B-9F-B7")
 BASE_URL = "https://apigateway.kisti.re.kr"
 
+# 동시 요청 수 (조합 테스트 병렬 실행)
+MAX_WORKERS = 16
+
+# MAC 주소 구분자 변환 테이블
+_TO_COLON = str.maketrans({'-': ':'})
+_STRIP = str.maketrans('', '', '-')
+_MAC_STRIPPED = MAC_ADDRESS.translate(_STRIP)
+
+# MAC 주소 형식
+MAC_FORMATS = {
+    "hyphen": MAC_ADDRESS,
+    "colon": MAC_ADDRESS.translate(_TO_COLON),
+    "none": _MAC_STRIPPED,
+    "lower_hyphen": MAC_ADDRESS.lower(),
+    "lower_none": _MAC_STRIPPED.lower(),
+}
+# JSON 문자열 값으로 이스케이프한 MAC 주소 (따옴표 포함)
+_MAC_FORMATS_JSON = {name: json.dumps(value) for name, value in MAC_FORMATS.items()}
+
+# 키 해석 방식 (키, IV)
+_API_KEY_BYTES = API_KEY.encode('utf-8')
+_API_KEY_SHA256 = hashlib.sha256(_API_KEY_BYTES).digest()
+KEY_METHODS = {
+    "api_key_utf8": (_API_KEY_BYTES[:32].ljust(32, b'\0'), _API_KEY_BYTES[:16]),
+    "api_key_utf8_zero_iv": (_API_KEY_BYTES[:32].ljust(32, b'\0'), b'\0' * 16),
+    "api_key_hex": (bytes.fromhex(API_KEY).ljust(32, b'\0')[:32], b'\0' * 16),
+    "api_key_hex_iv": (bytes.fromhex(API_KEY).ljust(16, b'\0'), bytes.fromhex(API_KEY)[:16]),
+    "client_id_hex": (bytes.fromhex(CLIENT_ID[:64]), bytes.fromhex(CLIENT_ID[:32])),
+    "sha256_api_key": (_API_KEY_SHA256, _API_KEY_SHA256[:16]),
+}
+
+# JSON 필드명
+JSON_FIELD_NAMES = ("mac_address", "macAddress", "mac_addr", "mac")
+
 
 def aes_encrypt(data: str, key_bytes: bytes, iv: bytes, mode=AES.MODE_CBC) -> str:
-    """AES 암호화"""
-    cipher = AES.new(key_bytes, mode, iv) if mode == AES.MODE_CBC else AES.new(key_bytes, mode)
-    encrypted = cipher.encrypt(pad(data.encode('utf-8'), AES.block_size))
+    """AES 암호화 (CBC는 cryptography 백엔드 우선)"""
+    padded = pad(data.encode('utf-8'), AES.block_size)
+    if _HAS_CRYPTOGRAPHY and mode == AES.MODE_CBC:
+        encryptor = Cipher(algorithms.AES(key_bytes), modes.CBC(iv)).encryptor()
+        encrypted = encryptor.update(padded) + encryptor.finalize()
+    else:
+        cipher = AES.new(key_bytes, mode, iv) if mode == AES.MODE_CBC else AES.new(key_bytes, mode)
+        encrypted = cipher.encrypt(padded)
     return base64.b64encode(encrypted).decode('utf-8')
 
 
-def test_token_request(json_data: str, key_bytes: bytes, iv: bytes, description: str) -> dict:
+def create_session(pool_maxsize: int = 32) -> requests.Session:
+    """연결을 재사용하는 공유 HTTP 세션 생성"""
+    session = requests.Session()
+    session.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=pool_maxsize))
+    return session
+
+
+def test_token_request(
+    json_data: str,
+    key_bytes: bytes,
+    iv: bytes,
+    description: str,
+    session: requests.Session = None
+) -> dict:
     """토큰 요청 테스트"""
     try:
         encrypted = aes_encrypt(json_data, key_bytes, iv)
@@ -48,7 +109,7 @@ def test_token_request(json_data: str, key_bytes: bytes, iv: bytes, description:
             "client_id": CLIENT_ID
         }
 
-        response = requests.get(url, params=params, timeout=30, verify=False)
+        response = (session or requests).get(url, params=params, timeout=30, verify=False)
         data = response.json()
 
         return {
@@ -88,56 +149,61 @@ def run_diagnostics():
     # datetime 준비
     current_time = datetime.now().strftime("%Y%m%d%H%M%S")
 
-    # MAC 주소 형식
-    mac_formats = {
-        "hyphen": MAC_ADDRESS,
-        "colon": MAC_ADDRESS.replace("-", ":"),
-        "none": MAC_ADDRESS.replace("-", ""),
-        "lower_hyphen": MAC_ADDRESS.lower(),
-        "lower_none": MAC_ADDRESS.replace("-", "").lower(),
-    }
-
-    # 키 해석 방식
-    key_methods = {
-        "api_key_utf8": (API_KEY.encode('utf-8')[:32].ljust(32, b'\0'), API_KEY.encode('utf-8')[:16]),
-        "api_key_utf8_zero_iv": (API_KEY.encode('utf-8')[:32].ljust(32, b'\0'), b'\0' * 16),
-        "api_key_hex": (bytes.fromhex(API_KEY).ljust(32, b'\0')[:32], b'\0' * 16),
-        "api_key_hex_iv": (bytes.fromhex(API_KEY).ljust(16, b'\0'), bytes.fromhex(API_KEY)[:16]),
-        "client_id_hex": (bytes.fromhex(CLIENT_ID[:64]), bytes.fromhex(CLIENT_ID[:32])),
-        "sha256_api_key": (hashlib.sha256(API_KEY.encode()).digest(), hashlib.sha256(API_KEY.encode()).digest()[:16]),
-    }
-
-    # JSON 필드명
-    json_field_names = ["mac_address", "macAddress", "mac_addr", "mac"]
-
-    results = []
-    test_count = 0
+    # 테스트 조합 (설명, JSON, 키, IV)
+    jobs = [
+        (
+            f"key={key_name}, mac={mac_name}, field={field_name}",
+            f'{{"{field_name}":{mac_json},"datetime":"{current_time}"}}',
+            key_bytes[:32],
+            iv
+        )
+        for key_name, (key_bytes, iv) in KEY_METHODS.items()
+        for mac_name, mac_json in _MAC_FORMATS_JSON.items()
+        for field_name in JSON_FIELD_NAMES
+    ]
 
     print("[테스트 실행 중...]")
 
-    # 주요 조합만 테스트 (전체 테스트는 시간이 오래 걸림)
-    for key_name, (key_bytes, iv) in key_methods.items():
-        for mac_name, mac_value in mac_formats.items():
-            for field_name in json_field_names:
-                test_count += 1
-
-                json_data = json.dumps({
-                    field_name: mac_value,
-                    "datetime": current_time
-                }, separators=(',', ':'))
-
-                desc = f"key={key_name}, mac={mac_name}, field={field_name}"
-                result = test_token_request(json_data, key_bytes[:32], iv, desc)
-                results.append(result)
-
-                # 진행 상황 표시
-                if test_count % 10 == 0:
-                    print(f"  {test_count}개 테스트 완료...")
-
-                # 성공하면 즉시 종료
-                if result.get("success"):
-                    print(f"\n성공! {desc}")
-                    return results
+    # 조합별 요청을 병렬 실행 (공유 세션으로 TLS 연결 재사용)
+    session = create_session(pool_maxsize=MAX_WORKERS * 2)
+    found = threading.Event()
+
+    def run_job(job):
+        if found.is_set():
+            return None
+        desc, json_data, key_bytes, iv = job
+        return test_token_request(json_data, key_bytes, iv, desc, session)
+
+    indexed_results = []
+    test_count = 0
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        futures = {executor.submit(run_job, job): i for i, job in enumerate(jobs)}
+        for future in as_completed(futures):
+            # 성공 후 취소된 요청은 결과 없음
+            if future.cancelled():
+                continue
+            result = future.result()
+            if result is None:
+                continue
+
+            test_count += 1
+            indexed_results.append((futures[future], result))
+
+            # 진행 상황 표시
+            if test_count % 10 == 0:
+                print(f"  {test_count}개 테스트 완료...")
+
+            # 성공하면 남은 요청 취소 후 종료
+            if result.get("success") and not found.is_set():
+                found.set()
+                for pending in futures:
+                    pending.cancel()
+                print(f"\n성공! {result['description']}")
+
+    # 조합 순서대로 정렬
+    results = [result for _, result in sorted(indexed_results, key=lambda x: x[0])]
+    if found.is_set():
+        return results
 
     print(f"  총 {test_count}개 테스트 완료")
     print()
@@ -148,6 +148,7 @@ class LLMRequest(BaseModel):
     system_prompt: Optional[str] = Field(None, description="시스템 프롬프트")
     max_tokens: int = Field(4096, description="최대 토큰")
     temperature: float = Field(0.1, description="온도")
+    use_cache: bool = Field(True, description="동일 요청 응답 캐시 사용")
 
 
 class LLMResponse(BaseModel):
@@ -169,6 +170,7 @@ class MultiEvaluatorRequest(BaseModel):
         default_factory=list,
         description="평가위원 설정 목록"
     )
+    use_cache: bool = Field(True, description="동일 요청 응답 캐시 사용")
 
 
 class EvaluatorResult(BaseModel):
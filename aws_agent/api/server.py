@@ -1,27 +1,43 @@
 """
 CNT 평가 시스템 FastAPI 서버
+- Bedrock 런타임 클라이언트는 모든 라우트가 공유 (invoke_model은 스레드 안전)
 """
 
 import os
+import re
 import sys
-import json
+import time
+import asyncio
+import hashlib
+import logging
+import functools
 from pathlib import Path
 from datetime import datetime
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Iterator, Optional, Tuple
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 
 # 프로젝트 루트 추가
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
 from fastapi import FastAPI, HTTPException, BackgroundTasks
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from pydantic import BaseModel
-import boto3
+import orjson
 from dotenv import load_dotenv
 
 # 환경 변수 로드
 load_dotenv()
 
+# 로깅 설정 (운영 기본값 WARNING, LOG_LEVEL로 조정)
+logging.basicConfig(
+    level=os.getenv("LOG_LEVEL", "WARNING").upper(),
+    format="%(asctime)s %(levelname)s %(name)s: %(message)s"
+)
+
 from aws_agent.config import AWSConfig
+from aws_agent.aws_clients import get_client
+from aws_agent.lru import LRUCache
 from aws_agent.api.models.schemas import (
     EvaluateRequest, EvaluateResponse, EvidenceItem,
     FullEvaluateRequest, FullEvaluateResponse,
@@ -32,12 +48,37 @@ from aws_agent.api.models.schemas import (
     MultiEvaluatorRequest, MultiEvaluatorResponse, EvaluatorResult,
     HealthResponse, EvaluatorType
 )
+from aws_agent.agents.novelty_agent import NoveltyEvaluationAgent
+from aws_agent.agents.progress_agent import ProgressEvaluationAgent
+from aws_agent.agents.field_agent import FieldExcellenceAgent
+from aws_agent.evaluation.runner import EvaluationRunner
+from aws_agent.preprocessing.embedder import BedrockEmbedder
+from aws_agent.vectorstore.opensearch_client import OpenSearchVectorStore, LocalVectorStore
+
+# 문서 파서 (선택 설치, 없으면 해당 형식 파싱 시 오류)
+try:
+    import fitz  # PyMuPDF
+except ImportError:
+    fitz = None
+try:
+    import pandas as pd
+except ImportError:
+    pd = None
+try:
+    from docx import Document
+except ImportError:
+    Document = None
+try:
+    import olefile
+except ImportError:
+    olefile = None
 
 # FastAPI 앱 생성
 app = FastAPI(
     title="CNT 평가 시스템 API",
     description="건설신기술 평가를 위한 LLM 기반 API",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse
 )
 
 # CORS 설정
@@ -49,43 +90,86 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+logger = logging.getLogger(__name__)
+
 # 전역 설정
 config = AWSConfig()
 
+# 블로킹 작업(에이전트 평가, KISTI/OpenSearch 호출) 실행용 기본 스레드 풀 크기
+API_THREAD_POOL_SIZE = int(os.getenv("API_THREAD_POOL_SIZE", "32"))
 
-def get_bedrock_client():
-    """Bedrock 클라이언트 생성"""
-    return boto3.client(
-        "bedrock-runtime",
-        region_name=config.bedrock_region,
-        aws_access_key_id=os.getenv("AWS_ACCESS_KEY_ID"),
-        aws_secret_access_key=os.getenv("AWS_SECRET_ACCESS_KEY")
+
+@app.on_event("startup")
+async def _configure_default_executor():
+    """asyncio.to_thread가 쓰는 기본 실행기 크기 지정"""
+    asyncio.get_running_loop().set_default_executor(
+        ThreadPoolExecutor(max_workers=API_THREAD_POOL_SIZE, thread_name_prefix="api-worker")
     )
 
+# Bedrock 동시 호출 수 상한 (계정 QPM 한도에 맞춰 조정)
+BEDROCK_MAX_CONCURRENCY = int(os.getenv("BEDROCK_MAX_CONCURRENCY", "16"))
+
+
+def _create_bedrock_client():
+    """Bedrock 클라이언트 반환 (에이전트/임베더와 같은 공유 클라이언트)"""
+    try:
+        return get_client("bedrock-runtime", config.bedrock_region)
+    except Exception as e:
+        logger.warning("Bedrock 클라이언트 생성 실패: %s", e)
+        return None
+
+
+# 프로세스 공유 Bedrock 클라이언트 (서비스 모델/서명기/커넥션 풀 재사용)
+_BEDROCK_CLIENT = _create_bedrock_client()
+
+
+def get_bedrock_client():
+    """공유 Bedrock 클라이언트 반환"""
+    if _BEDROCK_CLIENT is None:
+        raise RuntimeError("Bedrock 클라이언트가 초기화되지 않았습니다")
+    return _BEDROCK_CLIENT
+
+
+async def _run_bounded(func, items) -> list:
+    """블로킹 함수를 항목별로 스레드에서 동시 실행 (입력 순서 유지, 동시 실행 수 제한)"""
+    sem = asyncio.Semaphore(BEDROCK_MAX_CONCURRENCY)
+
+    async def _run(item):
+        async with sem:
+            return await asyncio.to_thread(func, item)
+
+    return await asyncio.gather(*[_run(item) for item in items])
+
 
 # ===== 헬스 체크 =====
 
+# 헬스 체크 결과 캐시 (liveness probe가 잦아도 매번 점검하지 않도록)
+_HEALTH_CACHE_TTL = 30.0
+_health_cache: Dict[str, Any] = {"t": 0.0, "response": None}
+
+
 @app.get("/api/health", response_model=HealthResponse)
 async def health_check():
     """헬스 체크"""
+    now = time.monotonic()
+    if _health_cache["response"] is not None and now - _health_cache["t"] < _HEALTH_CACHE_TTL:
+        return _health_cache["response"]
+
     aws_configured = bool(os.getenv("AWS_ACCESS_KEY_ID") and os.getenv("AWS_SECRET_ACCESS_KEY"))
 
-    # Bedrock 연결 테스트
-    bedrock_available = False
-    if aws_configured:
-        try:
-            client = get_bedrock_client()
-            bedrock_available = True
-        except Exception:
-            pass
+    # Bedrock 클라이언트 준비 여부
+    bedrock_available = aws_configured and _BEDROCK_CLIENT is not None
 
-    return HealthResponse(
+    response = HealthResponse(
         status="healthy",
         aws_configured=aws_configured,
         bedrock_available=bedrock_available,
         opensearch_available=bool(os.getenv("OPENSEARCH_ENDPOINT")),
         version="1.0.0"
     )
+    _health_cache["t"] = now
+    _health_cache["response"] = response
+    return response
 
 
 # ===== LLM 직접 호출 =====
@@ -107,11 +191,11 @@ def invoke_model_with_format(client, model_id: str, prompt: str, system_prompt:
 
         response = client.invoke_model(
             modelId=model_id,
-            body=json.dumps(request_body),
+            body=orjson.dumps(request_body),
             contentType="application/json",
             accept="application/json"
         )
-        response_body = json.loads(response["body"].read())
+        response_body = orjson.loads(response["body"].read())
         return response_body["content"][0]["text"], response_body.get("usage")
 
     # Mistral 형식
@@ -130,11 +214,11 @@ def invoke_model_with_format(client, model_id: str, prompt: str, system_prompt:
 
         response = client.invoke_model(
             modelId=model_id,
-            body=json.dumps(request_body),
+            body=orjson.dumps(request_body),
             contentType="application/json",
             accept="application/json"
         )
-        response_body = json.loads(response["body"].read())
+        response_body = orjson.loads(response["body"].read())
         output_text = response_body.get("outputs", [{}])[0].get("text", "")
         return output_text, None
 
@@ -153,11 +237,11 @@ def invoke_model_with_format(client, model_id: str, prompt: str, system_prompt:
 
         response = client.invoke_model(
             modelId=model_id,
-            body=json.dumps(request_body),
+            body=orjson.dumps(request_body),
             contentType="application/json",
             accept="application/json"
         )
-        response_body = json.loads(response["body"].read())
+        response_body = orjson.loads(response["body"].read())
         return response_body.get("generation", ""), None
 
     # Amazon Titan 형식
@@ -172,27 +256,54 @@ def invoke_model_with_format(client, model_id: str, prompt: str, system_prompt:
 
         response = client.invoke_model(
             modelId=model_id,
-            body=json.dumps(request_body),
+            body=orjson.dumps(request_body),
             contentType="application/json",
             accept="application/json"
         )
-        response_body = json.loads(response["body"].read())
+        response_body = orjson.loads(response["body"].read())
         return response_body.get("results", [{}])[0].get("outputText", ""), None
 
 
+# LLM 응답 캐시 (동일 모델/프롬프트/파라미터 재호출 방지)
+_LLM_CACHE_MAXSIZE = 1024
+_llm_cache = LRUCache(_LLM_CACHE_MAXSIZE)
+
+
+def invoke_model_cached(client, model_id: str, prompt: str, system_prompt: str = None, max_tokens: int = 1024, temperature: float = 0.1, use_cache: bool = True):
+    """invoke_model_with_format + 응답 캐시 (캐시 적중 시 Bedrock 호출 생략)"""
+    if not use_cache:
+        return invoke_model_with_format(client, model_id, prompt, system_prompt, max_tokens, temperature)
+
+    key = hashlib.blake2b(
+        orjson.dumps([model_id, system_prompt, prompt, max_tokens, temperature]),
+        digest_size=16
+    ).hexdigest()
+    cached = _llm_cache.get(key)
+    if cached is not None:
+        return cached
+
+    result = invoke_model_with_format(client, model_id, prompt, system_prompt, max_tokens, temperature)
+
+    _llm_cache.put(key, result)
+    return result
+
+
 @app.post("/api/llm/invoke", response_model=LLMResponse)
 async def invoke_llm(request: LLMRequest):
     """Bedrock LLM 직접 호출 (Claude, Mistral, Llama 지원)"""
     try:
         client = get_bedrock_client()
 
-        response_text, usage = invoke_model_with_format(
+        # 호출과 응답 본문 읽기/파싱 모두 스레드에서 실행 (이벤트 루프 블로킹 방지)
+        response_text, usage = await asyncio.to_thread(
+            invoke_model_cached,
             client=client,
             model_id=config.bedrock_model_id,
             prompt=request.prompt,
             system_prompt=request.system_prompt,
             max_tokens=request.max_tokens,
-            temperature=request.temperature
+            temperature=request.temperature,
+            use_cache=request.use_cache
         )
 
         return LLMResponse(
@@ -213,25 +324,36 @@ async def invoke_llm(request: LLMRequest):
 
 # ===== 단일 평가 =====
 
+_AGENT_CLASSES = {
+    EvaluatorType.NOVELTY: NoveltyEvaluationAgent,
+    EvaluatorType.PROGRESSIVENESS: ProgressEvaluationAgent,
+    EvaluatorType.FIELD: FieldExcellenceAgent,
+}
+
+# 평가 유형별 에이전트 인스턴스 (최초 요청 시 생성 후 재사용)
+_AGENT_CACHE: Dict[EvaluatorType, Any] = {}
+
+
+def get_agent(evaluator_type: EvaluatorType):
+    """평가 유형별 에이전트 반환"""
+    agent = _AGENT_CACHE.get(evaluator_type)
+    if agent is None:
+        agent_class = _AGENT_CLASSES.get(evaluator_type)
+        if agent_class is None:
+            raise ValueError(f"Unknown evaluator type: {evaluator_type}")
+        agent = _AGENT_CACHE[evaluator_type] = agent_class(config)
+    return agent
+
+
 @app.post("/api/evaluate", response_model=EvaluateResponse)
 async def evaluate_single(request: EvaluateRequest):
     """단일 평가 실행"""
     try:
         # 평가 유형에 따른 에이전트 선택
-        if request.evaluator_type == EvaluatorType.NOVELTY:
-            from aws_agent.agents.novelty_agent import NoveltyEvaluationAgent
-            agent = NoveltyEvaluationAgent(config)
-        elif request.evaluator_type == EvaluatorType.PROGRESSIVENESS:
-            from aws_agent.agents.progress_agent import ProgressEvaluationAgent
-            agent = ProgressEvaluationAgent(config)
-        elif request.evaluator_type == EvaluatorType.FIELD:
-            from aws_agent.agents.field_agent import FieldExcellenceAgent
-            agent = FieldExcellenceAgent(config)
-        else:
-            raise ValueError(f"Unknown evaluator type: {request.evaluator_type}")
+        agent = get_agent(request.evaluator_type)
 
         # 평가 실행
-        result = agent.evaluate(request.tech_id)
+        result = await asyncio.to_thread(agent.evaluate, request.tech_id)
 
         return EvaluateResponse(
             success=True,
@@ -263,10 +385,8 @@ async def evaluate_single(request: EvaluateRequest):
 async def evaluate_full(request: FullEvaluateRequest):
     """전체 평가 실행 (1차 + 2차 심사)"""
     try:
-        from aws_agent.evaluation.runner import EvaluationRunner
-
         runner = EvaluationRunner(config, use_aws=request.use_aws)
-        result = runner.run_full_evaluation(request.tech_id)
+        result = await asyncio.to_thread(runner.run_full_evaluation, request.tech_id)
 
         return FullEvaluateResponse(
             success=True,
@@ -309,24 +429,9 @@ EVALUATOR_CONFIGS = [
 ]
 
 
-@app.post("/api/evaluate/multi", response_model=MultiEvaluatorResponse)
-async def evaluate_multi(request: MultiEvaluatorRequest):
-    """10명 평가위원 다중 평가"""
-    try:
-        client = get_bedrock_client()
-        evaluator_results = []
-
-        # 평가위원 설정
-        evaluators = request.evaluators if request.evaluators else EVALUATOR_CONFIGS
-
-        for eval_config in evaluators:
-            evaluator_id = eval_config.get("id", "unknown")
-            expertise = eval_config.get("expertise", "general")
-            stance = eval_config.get("stance", "neutral")
-            eval_type = eval_config.get("eval_type", "novelty")
-
-            # 평가위원별 시스템 프롬프트
-            system_prompt = f"""당신은 건설신기술 심사위원회의 {expertise} 분야 전문가입니다.
+def _render_system_prompt(expertise: str, stance: str) -> str:
+    """평가위원 시스템 프롬프트 생성"""
+    return f"""당신은 건설신기술 심사위원회의 {expertise} 분야 전문가입니다.
 평가 성향: {stance}
 평가 관점: {"보수적이고 안전성을 중시" if stance == "conservative" else "혁신적이고 기술 발전을 중시" if stance == "progressive" else "균형 잡힌 관점"}
 
@@ -350,47 +455,96 @@ async def evaluate_multi(request: MultiEvaluatorRequest):
 }}
 ```"""
 
-            # 평가 프롬프트
-            eval_prompt = f"""신기술 번호: {request.tech_id}
+
+# 기본 평가위원 시스템 프롬프트 (전문분야/성향별로 미리 생성)
+_EVALUATOR_SYSTEM_PROMPTS = {
+    (c["expertise"], c["stance"]): _render_system_prompt(c["expertise"], c["stance"])
+    for c in EVALUATOR_CONFIGS
+}
+
+# 평가위원 응답 JSON 추출 패턴 (```json 코드블록 우선, 없으면 중괄호 범위)
+# 다중 평가는 도구 호출을 지원하지 않는 모델(Mistral/Llama/Titan)도 쓰는 텍스트 경로이므로 여기서만 사용
+# (에이전트 평가는 submit_evaluation 도구 호출로 받으며 텍스트 JSON을 파싱하지 않음)
+_JSON_FENCE_RE = re.compile(r'```json\s*(.*?)\s*```', re.DOTALL)
+_JSON_BRACE_RE = re.compile(r'\{.*\}', re.DOTALL)
+
+# 응답 파싱/호출 실패 시 평가위원 기본 결과
+_FALLBACK_EVAL_DATA = {
+    "verdict": "Rejected",
+    "novelty_score": 30,
+    "progress_score": 30,
+    "confidence": 0.5,
+    "evidence": [],
+    "comments": "응답 파싱 실패"
+}
+
+
+@app.post("/api/evaluate/multi", response_model=MultiEvaluatorResponse)
+async def evaluate_multi(request: MultiEvaluatorRequest):
+    """10명 평가위원 다중 평가"""
+    try:
+        client = get_bedrock_client()
+
+        # 평가위원 설정
+        evaluators = request.evaluators if request.evaluators else EVALUATOR_CONFIGS
+
+        # 평가 프롬프트 공통 부분 (tech_id/문서 컨텍스트)
+        eval_prompt_head = f"""신기술 번호: {request.tech_id}
 
 문서 컨텍스트:
 {request.document_context or "문서 정보가 제공되지 않았습니다."}
 
-위 건설신기술에 대해 {expertise} 분야 전문가로서 평가해주세요."""
+"""
 
-            # Bedrock 호출 (다양한 모델 형식 지원)
-            response_text, _ = invoke_model_with_format(
-                client=client,
-                model_id=config.bedrock_model_id,
-                prompt=eval_prompt,
-                system_prompt=system_prompt,
-                max_tokens=2048,
-                temperature=0.2
+        async def _run_one(eval_config: Dict[str, Any]) -> Dict[str, Any]:
+            """평가위원 1명 평가 (프롬프트 구성 → Bedrock 호출 → JSON 파싱)"""
+            expertise = eval_config.get("expertise", "general")
+            stance = eval_config.get("stance", "neutral")
+            eval_type = eval_config.get("eval_type", "novelty")
+
+            # 평가위원별 시스템 프롬프트 (기본 평가위원은 미리 생성된 프롬프트 사용)
+            system_prompt = (
+                _EVALUATOR_SYSTEM_PROMPTS.get((expertise, stance))
+                or _render_system_prompt(expertise, stance)
+            )
+
+            # 평가 프롬프트
+            eval_prompt = f"{eval_prompt_head}위 건설신기술에 대해 {expertise} 분야 전문가로서 평가해주세요."
+
+            # Bedrock 호출 (다양한 모델 형식 지원, 블로킹 호출은 스레드에서 실행)
+            # 프롬프트에 tech_id/문서 컨텍스트/전문분야/성향이 모두 들어가므로 평가위원별로 캐시됨
+            response_text, _ = await asyncio.to_thread(
+                invoke_model_cached,
+                client, config.bedrock_model_id, eval_prompt, system_prompt, 2048, 0.2,
+                request.use_cache
             )
 
             # JSON 파싱
             try:
-                import re
-                json_match = re.search(r'```json\s*(.*?)\s*```', response_text, re.DOTALL)
+                json_match = _JSON_FENCE_RE.search(response_text)
                 if json_match:
-                    eval_data = json.loads(json_match.group(1))
+                    eval_data = orjson.loads(json_match.group(1))
                 else:
-                    json_match = re.search(r'\{.*\}', response_text, re.DOTALL)
-                    eval_data = json.loads(json_match.group(0)) if json_match else {}
+                    json_match = _JSON_BRACE_RE.search(response_text)
+                    eval_data = orjson.loads(json_match.group(0)) if json_match else {}
             except:
-                eval_data = {
-                    "verdict": "Rejected",
-                    "novelty_score": 30,
-                    "progress_score": 30,
-                    "confidence": 0.5,
-                    "evidence": [],
-                    "comments": "응답 파싱 실패"
-                }
+                eval_data = dict(_FALLBACK_EVAL_DATA)
+            return eval_data
+
+        # 평가위원 동시 호출 (Bedrock 왕복 시간이 합산되지 않도록)
+        results = await asyncio.gather(*[_run_one(c) for c in evaluators], return_exceptions=True)
+
+        evaluator_results = []
+        for eval_config, eval_data in zip(evaluators, results):
+            evaluator_id = eval_config.get("id", "unknown")
+            if isinstance(eval_data, Exception):
+                logger.warning("평가위원 %s 평가 실패: %s", evaluator_id, eval_data)
+                eval_data = dict(_FALLBACK_EVAL_DATA)
 
             evaluator_results.append(EvaluatorResult(
                 evaluator_id=f"evaluator_{evaluator_id}",
-                expertise=expertise,
-                stance=stance,
+                expertise=eval_config.get("expertise", "general"),
+                stance=eval_config.get("stance", "neutral"),
                 verdict=eval_data.get("verdict", "Rejected"),
                 novelty_score=eval_data.get("novelty_score", 30),
                 progress_score=eval_data.get("progress_score", 30),
@@ -427,25 +581,29 @@ async def evaluate_multi(request: MultiEvaluatorRequest):
 
 # ===== 문서 청킹 =====
 
+def _sliding_chunks(text: str, chunk_size: int, overlap: int) -> List[Dict[str, Any]]:
+    """슬라이딩 윈도우 청킹 (공백뿐인 윈도우 제외)"""
+    text_len = len(text)
+    windows = (
+        (i, text[i:i + chunk_size])
+        for i in range(0, text_len, chunk_size - overlap)
+    )
+    return [
+        {
+            "index": idx,
+            "content": chunk_text,
+            "start_pos": i,
+            "end_pos": min(i + chunk_size, text_len)
+        }
+        for idx, (i, chunk_text) in enumerate(w for w in windows if not w[1].isspace())
+    ]
+
+
 @app.post("/api/chunk", response_model=ChunkResponse)
 async def chunk_document(request: ChunkRequest):
     """텍스트 청킹"""
     try:
-        chunks = []
-        text = request.text
-        chunk_size = request.chunk_size
-        overlap = request.chunk_overlap
-
-        # 슬라이딩 윈도우 청킹
-        for i in range(0, len(text), chunk_size - overlap):
-            chunk_text = text[i:i + chunk_size]
-            if chunk_text.strip():
-                chunks.append({
-                    "index": len(chunks),
-                    "content": chunk_text,
-                    "start_pos": i,
-                    "end_pos": min(i + chunk_size, len(text))
-                })
+        chunks = _sliding_chunks(request.text, request.chunk_size, request.chunk_overlap)
 
         return ChunkResponse(
             success=True,
@@ -464,30 +622,64 @@ async def chunk_document(request: ChunkRequest):
 
 # ===== 임베딩 생성 =====
 
+# 스트리밍 응답 전환 기준 (임베딩 수, 1536차원 기준 약 4MB) 및 한 번에 내보내는 임베딩 수
+_STREAM_EMBEDDINGS_THRESHOLD = 256
+_STREAM_EMBEDDINGS_PER_CHUNK = 32
+
+
+def _stream_embeddings(embeddings: List[List[float]], dimension: int) -> Iterator[bytes]:
+    """EmbeddingResponse 형식 JSON을 조각 단위로 생성"""
+    yield b'{"success":true,"dimension":%d,"error":null,"embeddings":[' % dimension
+    for i in range(0, len(embeddings), _STREAM_EMBEDDINGS_PER_CHUNK):
+        part = b",".join(orjson.dumps(e) for e in embeddings[i:i + _STREAM_EMBEDDINGS_PER_CHUNK])
+        yield part if i == 0 else b"," + part
+    yield b"]}"
+
+
+def _embed_one(client, text: str) -> List[float]:
+    """Titan Embeddings 단건 호출"""
+    response = client.invoke_model(
+        modelId=config.bedrock_embedding_model_id,
+        body=orjson.dumps({"inputText": text[:8000]}),  # 최대 8000자
+        contentType="application/json",
+        accept="application/json"
+    )
+
+    response_body = orjson.loads(response["body"].read())
+    return response_body.get("embedding", [])
+
+
 @app.post("/api/embedding", response_model=EmbeddingResponse)
 async def create_embeddings(request: EmbeddingRequest):
     """Bedrock Titan 임베딩 생성"""
     try:
         client = get_bedrock_client()
-        embeddings = []
-
-        for text in request.texts:
-            # Titan Embeddings 호출
-            response = client.invoke_model(
-                modelId=config.bedrock_embedding_model_id,
-                body=json.dumps({"inputText": text[:8000]}),  # 최대 8000자
-                contentType="application/json",
-                accept="application/json"
-            )
+        texts = request.texts
+
+        # 긴 텍스트부터 호출해 큰 요청 하나가 마지막에 남아 전체를 지연시키지 않도록 함
+        order = sorted(range(len(texts)), key=lambda i: len(texts[i]), reverse=True)
+        results = await _run_bounded(
+            functools.partial(_embed_one, client), [texts[i] for i in order]
+        )
+
+        # 입력 순서로 복원
+        embeddings = [None] * len(texts)
+        for i, embedding in zip(order, results):
+            embeddings[i] = embedding
 
-            response_body = json.loads(response["body"].read())
-            embedding = response_body.get("embedding", [])
-            embeddings.append(embedding)
+        dimension = len(embeddings[0]) if embeddings else 0
+
+        # 대량 임베딩은 한 번에 직렬화해 버퍼에 쌓지 않고 조각 단위로 전송
+        if len(embeddings) > _STREAM_EMBEDDINGS_THRESHOLD:
+            return StreamingResponse(
+                _stream_embeddings(embeddings, dimension),
+                media_type="application/json"
+            )
 
         return EmbeddingResponse(
             success=True,
             embeddings=embeddings,
-            dimension=len(embeddings[0]) if embeddings else 0
+            dimension=dimension
         )
 
     except Exception as e:
@@ -505,22 +697,19 @@ async def create_embeddings(request: EmbeddingRequest):
 async def search_documents(request: SearchRequest):
     """문서 검색 (OpenSearch 또는 로컬 벡터스토어 - 시뮬레이션 없음)"""
     try:
-        from aws_agent.preprocessing.embedder import BedrockEmbedder
-
         # Bedrock 임베딩으로 쿼리 벡터 생성 (API 필수)
         embedder = BedrockEmbedder(config)
-        query_embedding = embedder.embed_query(request.query)
+        query_embedding = await embedder.acreate_embedding(request.query)
 
         # OpenSearch가 설정된 경우
         if os.getenv("OPENSEARCH_ENDPOINT"):
-            from aws_agent.vectorstore.opensearch_client import OpenSearchVectorStore
             vectorstore = OpenSearchVectorStore(config)
         else:
             # 로컬 벡터스토어 사용 (ChromaDB)
-            from aws_agent.vectorstore.opensearch_client import LocalVectorStore
             vectorstore = LocalVectorStore()
 
-        results = vectorstore.search(
+        results = await asyncio.to_thread(
+            vectorstore.search,
             query_embedding=query_embedding,
             tech_id=request.tech_id,
             k=request.k
@@ -562,11 +751,183 @@ class ParseResponse(BaseModel):
     file_path: str = ""
     error: Optional[str] = None
 
+# PDF 파싱 프로세스 풀 (CPU 작업이 이벤트 루프/다른 요청과 GIL을 다투지 않도록, 최초 사용 시 생성)
+_pdf_pool: Optional[ProcessPoolExecutor] = None
+
+# PDF 파싱 프로세스 수 (uvicorn 워커마다 풀이 따로 생기므로 작게 유지, PDF_POOL_WORKERS로 조정)
+PDF_POOL_WORKERS = int(os.getenv("PDF_POOL_WORKERS", str(min(4, os.cpu_count() or 1))))
+
+
+def _get_pdf_pool() -> ProcessPoolExecutor:
+    global _pdf_pool
+    if _pdf_pool is None:
+        _pdf_pool = ProcessPoolExecutor(max_workers=PDF_POOL_WORKERS)
+    return _pdf_pool
+
+
+@app.on_event("shutdown")
+async def _shutdown_pdf_pool():
+    """서버 종료 시 PDF 파싱 프로세스 풀 정리"""
+    global _pdf_pool
+    if _pdf_pool is not None:
+        _pdf_pool.shutdown(cancel_futures=True)
+        _pdf_pool = None
+
+
+def _require(module, package: str):
+    """선택 설치 파서가 없으면 설치 안내와 함께 오류"""
+    if module is None:
+        raise RuntimeError(f"{package} 미설치 (pip install {package})")
+
+
+# 파싱 지원 확장자
+_SUPPORTED_EXTENSIONS = (".pdf", ".xlsx", ".xls", ".docx", ".hwp", ".txt")
+
+# 프로세스 풀 작업 하나가 맡는 PDF 페이지 수
+_PDF_PAGES_PER_TASK = 32
+
+
+def _pdf_page_count(file_path: str) -> int:
+    _require(fitz, "PyMuPDF")
+    with fitz.open(file_path) as doc:
+        return len(doc)
+
+
+def _parse_pdf(file_path: str, start: int = 0, stop: Optional[int] = None) -> Tuple[str, int]:
+    """PyMuPDF로 PDF 페이지 범위 파싱 → (텍스트, 전체 페이지 수)
+
+    프로세스 풀에서 실행되므로 모듈 수준 함수이며, fitz 문서 객체는 프로세스 간
+    공유할 수 없어 작업마다 파일을 새로 연다.
+    """
+    _require(fitz, "PyMuPDF")
+    doc = fitz.open(file_path)
+    try:
+        page_count = len(doc)
+        stop = page_count if stop is None else min(stop, page_count)
+        return "\n".join(doc[i].get_text("text") for i in range(start, stop)), page_count
+    finally:
+        doc.close()
+
+
+async def _parse_pdf_parallel(file_path: str) -> Tuple[str, int]:
+    """PDF 페이지 범위를 프로세스 풀에 나눠 병렬 추출"""
+    loop = asyncio.get_running_loop()
+    pool = _get_pdf_pool()
+
+    page_count = await loop.run_in_executor(pool, _pdf_page_count, file_path)
+    parts = await asyncio.gather(*[
+        loop.run_in_executor(pool, _parse_pdf, file_path, start, start + _PDF_PAGES_PER_TASK)
+        for start in range(0, page_count, _PDF_PAGES_PER_TASK)
+    ])
+    return "\n".join(text for text, _ in parts), page_count
+
+
+def _parse_sync(file_path: Path) -> Tuple[str, int]:
+    """확장자별 문서 파싱 (블로킹) → (텍스트, 페이지 수)"""
+    ext = file_path.suffix.lower()
+    text = ""
+    pages = 0
+
+    if ext == ".pdf":
+        text, pages = _parse_pdf(str(file_path))
+
+    elif ext == ".xlsx" or ext == ".xls":
+        # pandas로 Excel 파싱 (시트 전체를 한 번에 읽고 행 문자열화는 벡터 연산으로)
+        _require(pd, "pandas")
+        sheets = pd.read_excel(str(file_path), sheet_name=None, header=None, dtype=object)
+        text_parts = []
+        for sheet, df in sheets.items():
+            text_parts.append(f"\n[시트: {sheet}]\n")
+            if not df.empty:
+                # 빈 셀과 거짓 값(0, False, "") 셀은 빈 문자열로 (기존 openpyxl 출력과 동일)
+                cells = df.where(df.notna() & df.astype(bool), "").astype(str)
+                rows = cells.agg(" | ".join, axis=1)
+                text_parts.append(rows[rows.str.strip() != ""].str.cat(sep="\n"))
+        text = "\n".join(text_parts)
+        pages = len(sheets)
+
+    elif ext == ".docx":
+        # python-docx로 Word 파싱
+        _require(Document, "python-docx")
+        doc = Document(str(file_path))
+        # 문단을 한 번만 순회하며 텍스트 수집과 개수 세기를 함께 처리
+        text_parts = []
+        paragraph_count = 0
+        for p in doc.paragraphs:
+            paragraph_count += 1
+            p_text = p.text
+            if p_text and not p_text.isspace():
+                text_parts.append(p_text)
+        text = "\n".join(text_parts)
+        pages = paragraph_count // 30 + 1
+
+    elif ext == ".hwp":
+        # olefile로 HWP 파싱 (기본 텍스트 추출)
+        _require(olefile, "olefile")
+        if olefile.isOleFile(str(file_path)):
+            ole = olefile.OleFileIO(str(file_path))
+            if ole.exists("PrvText"):
+                text = ole.openstream("PrvText").read().decode("utf-16", errors="ignore")
+            ole.close()
+        else:
+            text = "[HWP 파싱 실패: OLE 형식이 아님]"
+        pages = 1
+
+    elif ext == ".txt":
+        with open(file_path, "r", encoding="utf-8", errors="ignore") as f:
+            text = f.read()
+        pages = 1
+
+    else:
+        raise ValueError(f"지원하지 않는 파일 형식: {ext}")
+
+    return text, pages
+
+
+async def _parse_file(file_path: Path) -> Tuple[str, int]:
+    """이벤트 루프를 막지 않고 문서 파싱 (PDF는 프로세스 풀, 나머지는 스레드)"""
+    if file_path.suffix.lower() == ".pdf":
+        return await _parse_pdf_parallel(str(file_path))
+    return await asyncio.to_thread(_parse_sync, file_path)
+
+
+# 파싱 결과 캐시 (경로 + 수정 시각 기준, 같은 파일 반복 파이프라인 실행 시 재파싱 생략)
+_TEXT_CACHE_MAXSIZE = 64
+_text_cache = LRUCache(_TEXT_CACHE_MAXSIZE)
+
+
+async def _extract_text(file_path: Path) -> Tuple[str, int]:
+    """문서 텍스트 추출 → (텍스트, 페이지 수), 파일이 바뀌지 않았으면 캐시 사용"""
+    key = (str(file_path.resolve()), file_path.stat().st_mtime_ns)
+    cached = _text_cache.get(key)
+    if cached is not None:
+        return cached
+
+    result = await _parse_file(file_path)
+
+    _text_cache.put(key, result)
+    return result
+
+
+# 스트리밍 응답 전환 기준 (문자 수) 및 조각 크기
+_STREAM_TEXT_THRESHOLD = 1_000_000
+_STREAM_TEXT_CHUNK = 256 * 1024
+
+
+def _stream_parse_response(text: str, pages: int, file_path: str) -> Iterator[bytes]:
+    """ParseResponse 형식 JSON을 조각 단위로 생성 (text 필드는 조각별로 이스케이프)"""
+    yield b'{"success":true,"characters":%d,"pages":%d,"file_path":%s,"error":null,"text":"' % (
+        len(text), pages, orjson.dumps(file_path)
+    )
+    for i in range(0, len(text), _STREAM_TEXT_CHUNK):
+        yield orjson.dumps(text[i:i + _STREAM_TEXT_CHUNK])[1:-1]
+    yield b'"}'
+
+
 @app.post("/api/parse", response_model=ParseResponse)
 async def parse_document(request: ParseRequest):
     """문서 파싱 (PDF/HWP/XLSX/DOCX)"""
     try:
-        from pathlib import Path
         file_path = Path(request.file_path)
 
         if not file_path.exists():
@@ -576,65 +937,13 @@ async def parse_document(request: ParseRequest):
                 error="파일을 찾을 수 없습니다"
             )
 
-        ext = file_path.suffix.lower()
-        text = ""
-        pages = 0
-
-        if ext == ".pdf":
-            # PyMuPDF로 PDF 파싱
-            import fitz
-            doc = fitz.open(str(file_path))
-            pages = len(doc)
-            text_parts = []
-            for page in doc:
-                text_parts.append(page.get_text())
-            doc.close()
-            text = "\n".join(text_parts)
-
-        elif ext == ".xlsx" or ext == ".xls":
-            # openpyxl로 Excel 파싱
-            import openpyxl
-            wb = openpyxl.load_workbook(str(file_path), data_only=True)
-            text_parts = []
-            for sheet in wb.sheetnames:
-                ws = wb[sheet]
-                text_parts.append(f"\n[시트: {sheet}]\n")
-                for row in ws.iter_rows(values_only=True):
-                    row_text = " | ".join(str(cell) if cell else "" for cell in row)
-                    if row_text.strip():
-                        text_parts.append(row_text)
-            text = "\n".join(text_parts)
-            pages = len(wb.sheetnames)
-
-        elif ext == ".docx":
-            # python-docx로 Word 파싱
-            from docx import Document
-            doc = Document(str(file_path))
-            text = "\n".join([p.text for p in doc.paragraphs if p.text.strip()])
-            pages = len(doc.paragraphs) // 30 + 1
-
-        elif ext == ".hwp":
-            # olefile로 HWP 파싱 (기본 텍스트 추출)
-            import olefile
-            if olefile.isOleFile(str(file_path)):
-                ole = olefile.OleFileIO(str(file_path))
-                if ole.exists("PrvText"):
-                    text = ole.openstream("PrvText").read().decode("utf-16", errors="ignore")
-                ole.close()
-            else:
-                text = "[HWP 파싱 실패: OLE 형식이 아님]"
-            pages = 1
-
-        elif ext == ".txt":
-            with open(file_path, "r", encoding="utf-8", errors="ignore") as f:
-                text = f.read()
-            pages = 1
+        text, pages = await _extract_text(file_path)
 
-        else:
-            return ParseResponse(
-                success=False,
-                file_path=request.file_path,
-                error=f"지원하지 않는 파일 형식: {ext}"
+        # 대용량 텍스트는 스트리밍 (전체 JSON 본문을 메모리에 만들지 않음)
+        if len(text) > _STREAM_TEXT_THRESHOLD:
+            return StreamingResponse(
+                _stream_parse_response(text, pages, request.file_path),
+                media_type="application/json"
             )
 
         return ParseResponse(
@@ -669,34 +978,30 @@ class IndexResponse(BaseModel):
 async def index_documents(request: IndexRequest):
     """문서를 OpenSearch에 인덱싱"""
     try:
-        from aws_agent.vectorstore.opensearch_client import OpenSearchVectorStore, LocalVectorStore
-        from aws_agent.preprocessing.embedder import BedrockEmbedder
-
         # 임베딩 생성
         embedder = BedrockEmbedder(config)
-        embedded_docs = []
-
-        for chunk in request.chunks:
-            content = chunk.get("content", "")
-            if not content:
-                continue
-
-            embedding = embedder.create_embedding(content)
+        chunks = [chunk for chunk in request.chunks if chunk.get("content")]
+        embeddings = await embedder.acreate_embeddings(
+            [chunk["content"] for chunk in chunks], BEDROCK_MAX_CONCURRENCY
+        )
 
-            embedded_docs.append({
+        embedded_docs = [
+            {
                 "tech_id": request.tech_id,
-                "chunk_index": chunk.get("index", len(embedded_docs)),
-                "content": content,
+                "chunk_index": chunk.get("index", idx),
+                "content": chunk["content"],
                 "embedding": embedding,
                 "page_numbers": chunk.get("page_numbers", []),
                 "section": chunk.get("section", ""),
-            })
+            }
+            for idx, (chunk, embedding) in enumerate(zip(chunks, embeddings))
+        ]
 
-        # OpenSearch 또는 로컬 저장소에 인덱싱
+        # OpenSearch 또는 로컬 저장소에 인덱싱 (_bulk 요청은 스레드에서 실행)
         if os.getenv("OPENSEARCH_ENDPOINT"):
             vectorstore = OpenSearchVectorStore(config)
-            vectorstore.create_index()
-            indexed = vectorstore.index_documents(embedded_docs)
+            await asyncio.to_thread(vectorstore.create_index)
+            indexed = await asyncio.to_thread(vectorstore.index_documents, embedded_docs)
         else:
             # 로컬 벡터스토어 사용
             vectorstore = LocalVectorStore()
@@ -735,71 +1040,40 @@ class RAGPipelineResponse(BaseModel):
 async def run_rag_pipeline(request: RAGPipelineRequest):
     """전체 RAG 파이프라인: 파싱 → 청킹 → 임베딩 → 인덱싱 → 평가"""
     try:
-        from pathlib import Path
-        import fitz  # PyMuPDF
-
-        all_text = []
-        files_parsed = 0
-
-        # 1. 문서 파싱
-        for file_path in request.file_paths:
-            path = Path(file_path)
-            if not path.exists():
-                continue
-
-            ext = path.suffix.lower()
-            text = ""
-
-            if ext == ".pdf":
-                doc = fitz.open(str(path))
-                for page in doc:
-                    text += page.get_text() + "\n"
-                doc.close()
-            elif ext == ".txt":
-                with open(path, "r", encoding="utf-8", errors="ignore") as f:
-                    text = f.read()
-            else:
-                continue
-
-            all_text.append(text)
-            files_parsed += 1
+        # 1. 문서 파싱 (/api/parse와 동일한 파서, 파일별 동시 파싱)
+        paths = [
+            path for path in map(Path, request.file_paths)
+            if path.exists() and path.suffix.lower() in _SUPPORTED_EXTENSIONS
+        ]
+        parsed = await asyncio.gather(*[_extract_text(path) for path in paths])
+        all_text = [text for text, _ in parsed]
+        files_parsed = len(all_text)
 
         combined_text = "\n\n".join(all_text)
 
         # 2. 청킹
-        chunks = []
-        chunk_size = config.chunk_size
-        overlap = config.chunk_overlap
-
-        for i in range(0, len(combined_text), chunk_size - overlap):
-            chunk_text = combined_text[i:i + chunk_size]
-            if chunk_text.strip():
-                chunks.append({
-                    "index": len(chunks),
-                    "content": chunk_text,
-                })
+        chunks = _sliding_chunks(combined_text, config.chunk_size, config.chunk_overlap)
 
         # 3. 임베딩 + 인덱싱
-        from aws_agent.preprocessing.embedder import BedrockEmbedder
-        from aws_agent.vectorstore.opensearch_client import OpenSearchVectorStore, LocalVectorStore
-
         embedder = BedrockEmbedder(config)
-        embedded_docs = []
-
-        for chunk in chunks:
-            embedding = embedder.create_embedding(chunk["content"])
-            embedded_docs.append({
+        embeddings = await embedder.acreate_embeddings(
+            [chunk["content"] for chunk in chunks], BEDROCK_MAX_CONCURRENCY
+        )
+        embedded_docs = [
+            {
                 "tech_id": request.tech_id,
                 "chunk_index": chunk["index"],
                 "content": chunk["content"],
                 "embedding": embedding,
-            })
+            }
+            for chunk, embedding in zip(chunks, embeddings)
+        ]
 
-        # 인덱싱
+        # 인덱싱 (_bulk 요청은 스레드에서 실행)
         if os.getenv("OPENSEARCH_ENDPOINT"):
             vectorstore = OpenSearchVectorStore(config)
-            vectorstore.create_index()
-            indexed = vectorstore.index_documents(embedded_docs)
+            await asyncio.to_thread(vectorstore.create_index)
+            indexed = await asyncio.to_thread(vectorstore.index_documents, embedded_docs)
         else:
             vectorstore = LocalVectorStore()
             indexed = vectorstore.index_documents(embedded_docs)
@@ -807,9 +1081,8 @@ async def run_rag_pipeline(request: RAGPipelineRequest):
         # 4. 평가 (선택적)
         evaluation_result = None
         if request.evaluate:
-            from aws_agent.evaluation.runner import EvaluationRunner
             runner = EvaluationRunner(config, use_aws=True)
-            result = runner.run_full_evaluation(request.tech_id)
+            result = await asyncio.to_thread(runner.run_full_evaluation, request.tech_id)
             evaluation_result = result.to_dict()
 
         return RAGPipelineResponse(
@@ -886,7 +1159,7 @@ async def kisti_token_status():
 
     try:
         # 토큰 발급/갱신
-        if not client.ensure_valid_token():
+        if not await asyncio.to_thread(client.ensure_valid_token):
             return KISTITokenResponse(
                 success=False,
                 error="토큰 발급 실패"
@@ -931,7 +1204,8 @@ async def kisti_search(request: KISTISearchRequest):
         )
 
     try:
-        result = client.search(
+        result = await asyncio.to_thread(
+            client.search,
             target=request.target,
             query=request.query,
             search_field=request.search_field,
@@ -1003,4 +1277,18 @@ if __name__ == "__main__":
     print(f"OpenSearch: {os.getenv('OPENSEARCH_ENDPOINT', 'Not configured (using local)')}")
     print("KISTI ScienceON API: 활성화")
     print("=" * 60)
-    uvicorn.run(app, host="127.0.0.1", port=8000)
+
+    # 워커 수: 기본 1 (API_WORKERS로 여러 워커 사용 가능)
+    # LLM/검색/텍스트/헬스 체크 캐시, 에이전트·임베더, 문서 파싱 프로세스 풀은 워커(프로세스)별로 따로 생기므로
+    # 워커를 늘리면 메모리가 배로 늘고 캐시 적중률이 떨어지며, 색인 시 캐시 무효화도 해당 워커에만 적용된다
+    workers = int(os.getenv("API_WORKERS", "1"))
+    uvicorn.run(
+        "aws_agent.api.server:app",
+        host="127.0.0.1",
+        port=8000,
+        workers=workers,
+        loop="auto",  # uvloop 설치 시 사용 (Windows는 미지원이라 asyncio)
+        http="auto",  # httptools 설치 시 사용
+        log_level="warning",
+        access_log=False
+    )
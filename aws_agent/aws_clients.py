@@ -0,0 +1,58 @@
+"""
+AWS 클라이언트 공유
+- 프로세스 전체에서 boto3 세션 하나를 재사용 (자격 증명/엔드포인트 데이터 로드 1회)
+- 서비스/리전별 클라이언트는 최초 호출 시 생성 후 공유 (boto3 클라이언트는 스레드 안전)
+"""
+
+import threading
+from typing import Any, Dict, Optional, Tuple
+
+import boto3
+from botocore.config import Config
+
+# 서비스별 클라이언트 설정 (동시 호출용 커넥션 풀, 적응형 재시도)
+_CLIENT_CONFIGS: Dict[str, Config] = {
+    # LLM 응답은 오래 걸릴 수 있어 읽기 제한 시간을 넉넉히
+    "bedrock-runtime": Config(
+        max_pool_connections=64,
+        connect_timeout=10,
+        read_timeout=120,
+        retries={"max_attempts": 6, "mode": "adaptive"},
+        tcp_keepalive=True
+    ),
+    # 병렬 업로드 스레드 + s3transfer 파트 업로드 스레드
+    "s3": Config(
+        max_pool_connections=64,
+        retries={"max_attempts": 10, "mode": "adaptive"},
+        tcp_keepalive=True
+    ),
+}
+
+_session: Optional[boto3.Session] = None
+_CLIENTS: Dict[Tuple[str, str], Any] = {}
+_lock = threading.Lock()
+
+
+def get_session() -> boto3.Session:
+    """프로세스 공유 boto3 세션 반환 (최초 호출 시 생성)"""
+    global _session
+    if _session is None:
+        with _lock:
+            if _session is None:
+                _session = boto3.Session()
+    return _session
+
+
+def get_client(service: str, region: str) -> Any:
+    """서비스/리전별 공유 클라이언트 반환 (최초 호출 시 생성)"""
+    key = (service, region)
+    client = _CLIENTS.get(key)
+    if client is None:
+        session = get_session()
+        with _lock:
+            client = _CLIENTS.get(key)
+            if client is None:
+                # boto3 세션은 스레드 안전하지 않으므로 생성은 잠금 안에서
+                client = session.client(service, region_name=region, config=_CLIENT_CONFIGS.get(service))
+                _CLIENTS[key] = client
+    return client
@@ -34,9 +34,41 @@ class AWSConfig:
         "amazon.titan-embed-text-v1"
     ))
 
+    # 임베딩 캐시 (SQLite, 내용 해시 기준 재사용, 경로를 지정한 경우에만 사용)
+    # 예: EMBEDDING_CACHE_PATH=~/.cache/aws_agent/embed_cache.db
+    embedding_cache_path: str = field(default_factory=lambda: os.path.expanduser(
+        os.getenv("EMBEDDING_CACHE_PATH", "")
+    ))
+
+    # Contextual Retrieval 문서 요약 모델 (청크 맥락 생성용, 저비용 모델)
+    bedrock_context_model_id: str = field(default_factory=lambda: os.getenv(
+        "BEDROCK_CONTEXT_MODEL_ID",
+        "anthropic.claude-3-haiku-20240307-v1:0"
+    ))
+
+    # 프롬프트 캐싱 (정적 시스템 프롬프트에 cache_control 적용)
+    bedrock_prompt_caching: bool = field(default_factory=lambda: os.getenv(
+        "BEDROCK_PROMPT_CACHING", "true"
+    ).lower() == "true")
+
+    # Bedrock 배치 추론 설정 (대량 평가용)
+    bedrock_batch_role_arn: str = field(default_factory=lambda: os.getenv("BEDROCK_BATCH_ROLE_ARN", ""))
+    s3_batch_prefix: str = field(default_factory=lambda: os.getenv("S3_BATCH_PREFIX", "batch/"))
+    batch_min_records: int = 100  # Bedrock 배치 작업 최소 레코드 수
+    batch_poll_interval: int = 30  # 작업 상태 확인 주기 (초)
+    batch_timeout: int = 24 * 3600  # 작업 완료 대기 최대 시간 (초, 초과 시 작업 중지 후 개별 호출)
+
     # OpenSearch Serverless 설정
     opensearch_endpoint: str = field(default_factory=lambda: os.getenv("OPENSEARCH_ENDPOINT", ""))
     opensearch_index_name: str = field(default_factory=lambda: os.getenv("OPENSEARCH_INDEX_NAME", "cnt-vectors"))
+    # kNN 벡터 스칼라 양자화 (faiss sq 인코더, "fp16" 또는 "none")
+    opensearch_vector_encoder: str = field(default_factory=lambda: os.getenv(
+        "OPENSEARCH_VECTOR_ENCODER", "fp16"
+    ).lower())
+    # tech_id 기준 샤드 라우팅 (색인/검색 양쪽에 적용, 기존 인덱스는 재색인 필요)
+    opensearch_routing: bool = field(default_factory=lambda: os.getenv(
+        "OPENSEARCH_ROUTING", "false"
+    ).lower() == "true")
 
     # 청킹 설정
     chunk_size: int = 1000
@@ -44,6 +76,7 @@ class AWSConfig:
 
     # 검색 설정
     retrieval_k: int = 10  # 검색할 청크 수
+    max_context_docs: int = 12  # LLM 컨텍스트에 넣을 최대 청크 수
 
     def validate(self) -> bool:
         """설정 유효성 검사"""
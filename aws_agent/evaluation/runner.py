@@ -3,22 +3,29 @@
 """
 
 import json
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
 from dataclasses import dataclass, asdict
 from pathlib import Path
 
+import orjson
+
 import sys
 sys.path.append(str(Path(__file__).parent.parent.parent))
 from aws_agent.config import AWSConfig
 from aws_agent.preprocessing.s3_uploader import S3Uploader
-from aws_agent.preprocessing.chunker import DocumentChunker, process_json_file
+from aws_agent.preprocessing.chunker import DocumentChunk, DocumentChunker, process_json_file
 from aws_agent.preprocessing.embedder import BedrockEmbedder, get_embedder
 from aws_agent.vectorstore.opensearch_client import OpenSearchVectorStore, get_vectorstore
 from aws_agent.agents.novelty_agent import NoveltyEvaluationAgent
 from aws_agent.agents.progress_agent import ProgressEvaluationAgent
 from aws_agent.agents.field_agent import FieldExcellenceAgent
 from aws_agent.agents.base_agent import EvaluationResult
+from aws_agent.aws_clients import get_client
+
+# 문서 요약 시 모델에 넘길 최대 본문 길이 (앞부분 기준)
+SUMMARY_MAX_CHARS = 20000
 
 
 @dataclass
@@ -64,21 +71,13 @@ class EvaluationRunner:
         print(f"1차 심사 시작: {tech_id}")
         print(f"{'='*50}")
 
-        results = {}
-
-        # 신규성 평가
-        results["novelty"] = self.novelty_agent.evaluate(tech_id)
+        # 신규성 + 진보성 동시 평가
+        results = self._evaluate_parallel(tech_id, {
+            "novelty": self.novelty_agent,
+            "progressiveness": self.progress_agent,
+        })
 
-        # 진보성 평가
-        results["progressiveness"] = self.progress_agent.evaluate(tech_id)
-
-        # 1차 심사 통과 여부 판정
-        stage_1_pass = (
-            results["novelty"].pass_status and
-            results["progressiveness"].pass_status
-        )
-
-        print(f"\n1차 심사 결과: {'통과' if stage_1_pass else '미통과'}")
+        self._print_stage_1_pass(results)
         return results
 
     def run_stage_2(self, tech_id: str) -> Dict[str, EvaluationResult]:
@@ -92,11 +91,27 @@ class EvaluationRunner:
         # 현장적용성 평가 (현장우수성 + 경제성 + 보급성 포함)
         results["field_applicability"] = self.field_agent.evaluate(tech_id)
 
-        # 2차 심사 통과 여부 판정
-        stage_2_pass = results["field_applicability"].pass_status
+        self._print_stage_2_pass(results)
+        return results
+
+    def _evaluate_parallel(self, tech_id: str, agents: Dict[str, Any]) -> Dict[str, EvaluationResult]:
+        """에이전트별 평가를 동시에 실행 (에이전트 간 공유 상태 없음, 입력 키 순서 유지)"""
+        with ThreadPoolExecutor(max_workers=len(agents)) as executor:
+            futures = {key: executor.submit(agent.evaluate, tech_id) for key, agent in agents.items()}
+            return {key: future.result() for key, future in futures.items()}
 
+    def _print_stage_1_pass(self, results: Dict[str, EvaluationResult]):
+        """1차 심사 통과 여부 출력"""
+        stage_1_pass = (
+            results["novelty"].pass_status and
+            results["progressiveness"].pass_status
+        )
+        print(f"\n1차 심사 결과: {'통과' if stage_1_pass else '미통과'}")
+
+    def _print_stage_2_pass(self, results: Dict[str, EvaluationResult]):
+        """2차 심사 통과 여부 출력"""
+        stage_2_pass = results["field_applicability"].pass_status
         print(f"\n2차 심사 결과: {'통과' if stage_2_pass else '미통과'}")
-        return results
 
     def run_full_evaluation(self, tech_id: str) -> FullEvaluationResult:
         """전체 평가 실행"""
@@ -104,11 +119,18 @@ class EvaluationRunner:
         print(f"# 건설신기술 평가 시작: {tech_id}")
         print(f"{'#'*60}")
 
-        # 1차 심사
-        stage_1_results = self.run_stage_1(tech_id)
+        # 1차(신규성, 진보성)와 2차(현장적용성) 평가는 서로 독립이므로 세 항목을 동시에 실행
+        results = self._evaluate_parallel(tech_id, {
+            "novelty": self.novelty_agent,
+            "progressiveness": self.progress_agent,
+            "field_applicability": self.field_agent,
+        })
 
-        # 2차 심사
-        stage_2_results = self.run_stage_2(tech_id)
+        stage_1_results = {key: results[key] for key in ("novelty", "progressiveness")}
+        self._print_stage_1_pass(stage_1_results)
+
+        stage_2_results = {"field_applicability": results["field_applicability"]}
+        self._print_stage_2_pass(stage_2_results)
 
         # 종합 점수 계산
         # 1차: (신규성 * 0.5 + 진보성 * 0.5) * 50
@@ -206,9 +228,11 @@ class EvaluationRunner:
 class EvaluationPipeline:
     """전체 파이프라인 (전처리 → 인덱싱 → 평가)"""
 
-    def __init__(self, config: AWSConfig = None, use_aws: bool = True):
+    def __init__(self, config: AWSConfig = None, use_aws: bool = True, generate_context: bool = False):
         self.config = config or AWSConfig()
         self.use_aws = use_aws
+        # 청크 임베딩에 문서 요약 맥락 추가 (Bedrock 요약 호출 필요, AWS 모드 전용)
+        self.generate_context = generate_context and use_aws
 
         # 컴포넌트 초기화
         if use_aws:
@@ -225,18 +249,7 @@ class EvaluationPipeline:
 
     def process_document(self, json_path: str) -> str:
         """문서 처리 (청킹 → 임베딩 → 인덱싱)"""
-        print(f"\n[처리] {json_path}")
-
-        # 1. JSON 로드
-        with open(json_path, 'r', encoding='utf-8') as f:
-            document = json.load(f)
-
-        tech_id = document.get("metadata", {}).get("tech_id", "unknown")
-        print(f"  신기술 번호: {tech_id}")
-
-        # 2. 청킹
-        chunks = self.chunker.chunk_document(document)
-        print(f"  청크 수: {len(chunks)}")
+        tech_id, chunks = self._chunk_document(json_path)
 
         # 3. 임베딩 생성
         embedded_chunks = self.embedder.create_embeddings_batch(chunks)
@@ -248,11 +261,100 @@ class EvaluationPipeline:
 
         # 5. S3 업로드 (AWS 모드인 경우)
         if self.use_aws and self.s3_uploader:
-            s3_key = f"processed/{tech_id}/{Path(json_path).name}"
-            self.s3_uploader.upload_file(json_path, s3_key)
+            self._upload_document(json_path, tech_id)
 
         return tech_id
 
+    def process_documents(self, json_paths: List[str]) -> List[str]:
+        """여러 문서 처리 (전체 청크를 한 번에 임베딩 → 인덱싱)
+
+        문서별로 임베딩하면 작은 배치가 여러 번 생기므로 모든 문서의 청크를 모아
+        한 번의 배치로 임베딩한다. S3 업로드는 임베딩과 겹쳐 백그라운드로 실행한다.
+        """
+        tech_ids = []
+        all_chunks = []
+
+        with ThreadPoolExecutor(max_workers=4) as upload_executor:
+            uploads = []
+            for json_path in json_paths:
+                tech_id, chunks = self._chunk_document(json_path)
+                tech_ids.append(tech_id)
+                all_chunks.extend(chunks)
+                if self.use_aws and self.s3_uploader:
+                    uploads.append(upload_executor.submit(self._upload_document, json_path, tech_id))
+
+            # 3. 임베딩 생성 (문서 전체 1회)
+            print(f"\n[임베딩] 문서 {len(json_paths)}개, 청크 {len(all_chunks)}개")
+            embedded_chunks = self.embedder.create_embeddings_batch(all_chunks)
+
+            # 4. 벡터 인덱싱
+            indexed = self.vectorstore.index_documents(embedded_chunks)
+            print(f"  인덱싱: {indexed}개")
+
+            for upload in uploads:
+                upload.result()
+
+        return tech_ids
+
+    def _upload_document(self, json_path: str, tech_id: str):
+        """원본 JSON S3 업로드"""
+        s3_key = f"processed/{tech_id}/{Path(json_path).name}"
+        self.s3_uploader.upload_file(json_path, s3_key)
+
+    def _chunk_document(self, json_path: str) -> Tuple[str, List[DocumentChunk]]:
+        """문서 로드 및 청킹 (맥락 생성 포함)"""
+        print(f"\n[처리] {json_path}")
+
+        # 1. JSON 로드
+        with open(json_path, 'rb') as f:
+            document = orjson.loads(f.read())
+
+        tech_id = document.get("metadata", {}).get("tech_id", "unknown")
+        print(f"  신기술 번호: {tech_id}")
+
+        # 2. 청킹
+        chunks = self.chunker.chunk_document(document)
+        print(f"  청크 수: {len(chunks)}")
+
+        if self.generate_context and chunks:
+            summary = self._summarize_document(document)
+            if summary:
+                self.chunker.add_context(chunks, summary)
+                print(f"  문서 맥락 추가: {summary[:50]}...")
+
+        return tech_id, chunks
+
+    def _summarize_document(self, document: Dict[str, Any]) -> str:
+        """청크 맥락용 문서 요약 1~2문장 (문서당 1회 호출)"""
+        parts = []
+        length = 0
+        for page in document.get("pages", []):
+            text = page.get("full_text", "")
+            parts.append(text)
+            length += len(text)
+            if length >= SUMMARY_MAX_CHARS:
+                break
+        body = "\n".join(parts)[:SUMMARY_MAX_CHARS]
+        if not body.strip():
+            return ""
+
+        prompt = (
+            "다음은 건설신기술 제안 문서의 앞부분입니다. 문서 검색에 쓰일 수 있도록 "
+            "이 기술이 무엇이며 어떤 문제를 해결하는지 한국어 1~2문장으로 요약하세요. "
+            "요약문만 출력하세요.\n\n" + body
+        )
+        try:
+            client = get_client("bedrock-runtime", self.config.bedrock_region)
+            response = client.converse(
+                modelId=self.config.bedrock_context_model_id,
+                messages=[{"role": "user", "content": [{"text": prompt}]}],
+                inferenceConfig={"maxTokens": 200, "temperature": 0.0}
+            )
+            return response["output"]["message"]["content"][0]["text"].strip()
+        except Exception as e:
+            print(f"  [경고] 문서 요약 실패, 맥락 없이 임베딩: {e}")
+            return ""
+
     def run_pipeline(
         self,
         json_paths: List[str],
@@ -262,10 +364,7 @@ class EvaluationPipeline:
         results = []
 
         # 문서 처리
-        tech_ids = []
-        for json_path in json_paths:
-            tech_id = self.process_document(json_path)
-            tech_ids.append(tech_id)
+        tech_ids = self.process_documents(json_paths)
 
         # 평가 실행
         if evaluate:
@@ -284,6 +383,9 @@ def evaluate_single_document(json_path: str, use_aws: bool = False) -> FullEvalu
 
 
 if __name__ == "__main__":
+    import logging
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+
     # 테스트 (로컬 모드)
     print("=== 평가 파이프라인 테스트 ===")
 
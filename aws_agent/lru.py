@@ -0,0 +1,41 @@
+"""
+프로세스 내 LRU 캐시
+- 최대 항목 수를 넘으면 가장 오래 사용하지 않은 항목부터 제거
+- 여러 스레드에서 동시에 조회/저장 가능
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Any, Hashable, Optional
+
+
+class LRUCache:
+    """잠금으로 보호되는 OrderedDict 기반 LRU 캐시 (값이 None이면 캐시하지 않은 것으로 취급)"""
+
+    def __init__(self, maxsize: int = 1024):
+        self.maxsize = maxsize
+        self._data: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """조회 (적중 시 최근 사용으로 이동)"""
+        with self._lock:
+            value = self._data.get(key)
+            if value is not None:
+                self._data.move_to_end(key)
+            return value
+
+    def put(self, key: Hashable, value: Any):
+        """저장 (가득 차면 가장 오래된 항목 제거)"""
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            if len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
@@ -6,17 +6,59 @@
 """
 
 import re
-import json
+from bisect import bisect_left
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Dict, Any, Optional
-from dataclasses import dataclass, asdict
+from typing import List, Dict, Any, Iterator, Optional, Tuple
+from dataclasses import dataclass
+
+import orjson
 
 import sys
 sys.path.append(str(Path(__file__).parent.parent.parent))
 from aws_agent.config import AWSConfig
 
 
-@dataclass
+# 주요 섹션 패턴 (우선순위 순)
+_SECTION_PATTERNS = [
+    (r'기술\s*개요', '기술개요'),
+    (r'기존\s*기술|문제점', '기존기술/문제점'),
+    (r'신기술\s*내용', '신기술내용'),
+    (r'비교\s*분석', '비교분석'),
+    (r'성능\s*시험|검증', '성능시험/검증'),
+    (r'현장\s*적용|실적', '현장적용실적'),
+    (r'경제성\s*분석', '경제성분석'),
+    (r'시공\s*방법', '시공방법'),
+    (r'품질|안전\s*관리', '품질/안전관리'),
+    (r'유지\s*관리', '유지관리'),
+    (r'특허|지식\s*재산', '특허/지식재산권'),
+    (r'결론|기대\s*효과', '결론/기대효과'),
+]
+# 패턴별 사전 컴파일 (우선순위 순서 유지)
+_SECTION_RES = [(re.compile(pattern, re.IGNORECASE), name) for pattern, name in _SECTION_PATTERNS]
+
+
+@lru_cache(maxsize=1024)
+def _detect_section_prefix(prefix: str) -> Optional[str]:
+    """머리말에서 섹션 이름 감지 (먼저 정의된 패턴 우선, 같은 머리말은 캐시 재사용)"""
+    for regex, name in _SECTION_RES:
+        if regex.search(prefix):
+            return name
+    return None
+
+
+# 청크 경계로 쓸 문자 (한국어는 띄어쓰기가 적은 구간이 있어 줄바꿈/마침표도 사용)
+_BOUNDARY_CHARS = (" ", "\n", ".", "。")
+
+
+def _snap_to_boundary(text: str, pos: int, lo: int) -> int:
+    """[lo, pos) 구간의 마지막 경계 문자 바로 뒤 위치 반환 (없으면 pos)"""
+    lo = max(lo, 0)
+    boundary = max(text.rfind(c, lo, pos) for c in _BOUNDARY_CHARS)
+    return boundary + 1 if boundary >= 0 else pos
+
+
+@dataclass(slots=True)
 class DocumentChunk:
     """청크 데이터 구조"""
     tech_id: str
@@ -26,9 +68,25 @@ class DocumentChunk:
     page_numbers: List[int]
     section: Optional[str] = None
     token_count: Optional[int] = None
+    context: Optional[str] = None  # 임베딩 시 앞에 붙이는 문서 맥락 (content는 원문 유지)
+
+    @property
+    def embedding_text(self) -> str:
+        """임베딩 입력 텍스트 (맥락이 있으면 원문 앞에 붙임)"""
+        return f"{self.context}\n{self.content}" if self.context else self.content
 
     def to_dict(self) -> Dict[str, Any]:
-        return asdict(self)
+        # asdict의 deepcopy 없이 얕은 dict 생성
+        return {
+            "tech_id": self.tech_id,
+            "file_name": self.file_name,
+            "chunk_index": self.chunk_index,
+            "content": self.content,
+            "page_numbers": self.page_numbers,
+            "section": self.section,
+            "token_count": self.token_count,
+            "context": self.context,
+        }
 
 
 class DocumentChunker:
@@ -59,26 +117,27 @@ class DocumentChunker:
 
         # 전체 텍스트 생성 (페이지 마커 포함)
         combined_text = ""
-        page_positions = []  # (position, page_number)
+        positions = []  # 페이지 시작 위치 (오름차순)
+        page_nums = []  # positions와 같은 순서의 페이지 번호
 
         for pt in page_texts:
-            start_pos = len(combined_text)
+            positions.append(len(combined_text))
+            page_nums.append(pt['page'])
             combined_text += f"\n[페이지 {pt['page']}]\n{pt['text']}"
-            page_positions.append((start_pos, pt['page']))
 
         # 슬라이딩 윈도우 청킹
         chunks = []
         chunk_index = 0
 
-        for i in range(0, len(combined_text), self.chunk_size - self.chunk_overlap):
-            chunk_text = combined_text[i:i + self.chunk_size]
+        for start, end in self._iter_windows(combined_text):
+            chunk_text = combined_text[start:end]
 
-            if not chunk_text.strip():
+            if chunk_text.isspace():
                 continue
 
             # 청크에 포함된 페이지 번호 추출
             included_pages = self._get_pages_in_range(
-                page_positions, i, i + self.chunk_size
+                positions, page_nums, start, end
             )
 
             # 섹션 감지
@@ -99,6 +158,18 @@ class DocumentChunker:
 
         return chunks
 
+    def add_context(self, chunks: List[DocumentChunk], summary: str) -> List[DocumentChunk]:
+        """청크마다 문서 요약/섹션 맥락 추가 (Contextual Retrieval)
+
+        "이 기술은"처럼 앞 문맥에 기대는 청크도 임베딩에 문서 내 역할이 반영되도록 한다.
+        """
+        for chunk in chunks:
+            context = f"[문서: {chunk.tech_id} — {summary}]"
+            if chunk.section:
+                context += f" [섹션: {chunk.section}]"
+            chunk.context = context
+        return chunks
+
     def chunk_by_section(self, document: Dict[str, Any]) -> List[DocumentChunk]:
         """섹션 기반 청킹 (목차 구조 활용)"""
         tech_id = document.get("metadata", {}).get("tech_id", "unknown")
@@ -114,43 +185,47 @@ class DocumentChunker:
         # 목차가 없으면 헤더 감지 기반 분할
         return self._chunk_by_headers(tech_id, file_name, pages)
 
+    def _iter_windows(self, text: str) -> Iterator[Tuple[int, int]]:
+        """슬라이딩 윈도우 (start, end) 생성
+
+        경계를 overlap 구간 안의 마지막 공백/줄바꿈/마침표 뒤로 당겨 단어 중간에서
+        잘리지 않게 한다. end는 다음 윈도우 시작 이후에 머물므로 빈 구간이 생기지 않는다.
+        """
+        text_len = len(text)
+        if text_len <= self.chunk_size:
+            # 짧은 문서는 윈도우 하나 (겹침 꼬리 청크 생성 방지)
+            if text_len:
+                yield 0, text_len
+            return
+
+        overlap = self.chunk_overlap
+        for i in range(0, text_len, self.chunk_size - overlap):
+            start = _snap_to_boundary(text, i, i - overlap) if i > 0 else 0
+            end = i + self.chunk_size
+            if end < text_len:
+                end = _snap_to_boundary(text, end, end - overlap)
+            yield start, min(end, text_len)
+
     def _get_pages_in_range(
         self,
-        page_positions: List[tuple],
+        positions: List[int],
+        page_nums: List[int],
         start: int,
         end: int
     ) -> List[int]:
-        """특정 범위에 포함된 페이지 번호 반환"""
-        pages = []
-        for pos, page_num in page_positions:
-            if pos >= start and pos < end:
-                if page_num not in pages:
-                    pages.append(page_num)
-        return pages or [1]
+        """특정 범위에서 시작하는 페이지 번호 반환 (positions는 오름차순)
+
+        범위 안에서 시작하는 페이지가 없으면 범위가 속한 페이지를 반환한다.
+        """
+        lo = bisect_left(positions, start)
+        hi = bisect_left(positions, end)
+        if lo < hi:
+            return page_nums[lo:hi]
+        return [page_nums[lo - 1]] if lo > 0 else [1]
 
     def _detect_section(self, text: str) -> Optional[str]:
-        """텍스트에서 섹션 이름 감지"""
-        # 주요 섹션 패턴
-        section_patterns = [
-            (r'기술\s*개요', '기술개요'),
-            (r'기존\s*기술|문제점', '기존기술/문제점'),
-            (r'신기술\s*내용', '신기술내용'),
-            (r'비교\s*분석', '비교분석'),
-            (r'성능\s*시험|검증', '성능시험/검증'),
-            (r'현장\s*적용|실적', '현장적용실적'),
-            (r'경제성\s*분석', '경제성분석'),
-            (r'시공\s*방법', '시공방법'),
-            (r'품질|안전\s*관리', '품질/안전관리'),
-            (r'유지\s*관리', '유지관리'),
-            (r'특허|지식\s*재산', '특허/지식재산권'),
-            (r'결론|기대\s*효과', '결론/기대효과'),
-        ]
-
-        for pattern, section_name in section_patterns:
-            if re.search(pattern, text[:500], re.IGNORECASE):
-                return section_name
-
-        return None
+        """텍스트에서 섹션 이름 감지 (앞 500자, 먼저 정의된 패턴 우선)"""
+        return _detect_section_prefix(text[:500])
 
     def _chunk_by_toc(
         self,
@@ -165,18 +240,17 @@ class DocumentChunker:
 
         # 페이지 번호로 텍스트 매핑
         page_map = {p.get("page_number"): p.get("full_text", "") for p in pages}
+        max_page = max(page_map, default=0)
 
         for i, toc_item in enumerate(toc):
             start_page = toc_item.get("page", 1)
             end_page = toc[i + 1].get("page", start_page + 5) if i + 1 < len(toc) else start_page + 5
 
-            section_text = ""
-            included_pages = []
-
-            for page_num in range(start_page, min(end_page, max(page_map.keys()) + 1)):
-                if page_num in page_map:
-                    section_text += f"\n{page_map[page_num]}"
-                    included_pages.append(page_num)
+            included_pages = [
+                page_num for page_num in range(start_page, min(end_page, max_page + 1))
+                if page_num in page_map
+            ]
+            section_text = "".join(f"\n{page_map[page_num]}" for page_num in included_pages)
 
             if section_text.strip():
                 # 큰 섹션은 추가 분할
@@ -229,9 +303,9 @@ class DocumentChunker:
         chunks = []
         chunk_index = start_index
 
-        for i in range(0, len(text), self.chunk_size - self.chunk_overlap):
-            chunk_text = text[i:i + self.chunk_size]
-            if chunk_text.strip():
+        for start, end in self._iter_windows(text):
+            chunk_text = text[start:end]
+            if not chunk_text.isspace():
                 chunk = DocumentChunk(
                     tech_id=tech_id,
                     file_name=file_name,
@@ -249,8 +323,8 @@ class DocumentChunker:
 
 def process_json_file(json_path: str) -> List[Dict[str, Any]]:
     """JSON 파일을 청킹하는 유틸리티 함수"""
-    with open(json_path, 'r', encoding='utf-8') as f:
-        document = json.load(f)
+    with open(json_path, 'rb') as f:
+        document = orjson.loads(f.read())
 
     chunker = DocumentChunker()
     chunks = chunker.chunk_document(document)
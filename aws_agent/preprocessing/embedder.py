@@ -3,39 +3,141 @@ Bedrock 임베딩 생성기
 """
 
 import json
-import boto3
+import asyncio
+import sqlite3
+import hashlib
+import threading
+import numpy as np
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Any, Optional
 from pathlib import Path
 from tenacity import retry, stop_after_attempt, wait_exponential
 
 import sys
 sys.path.append(str(Path(__file__).parent.parent.parent))
+from aws_agent.aws_clients import get_client
 from aws_agent.config import AWSConfig
 from aws_agent.preprocessing.chunker import DocumentChunk
 
+# 텍스트 길이 제한 (Titan은 8192 토큰)
+MAX_EMBEDDING_CHARS = 25000  # 대략 8000 토큰
+
+
+class EmbeddingCache:
+    """내용 해시 기반 임베딩 캐시 (SQLite, 프로세스/스레드 간 공유)"""
+
+    # SQLite 바인딩 변수 개수 제한 내에서 한 번에 조회할 키 수
+    LOOKUP_BATCH = 500
+
+    def __init__(self, path: str):
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, timeout=30, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS embeddings "
+            "(key TEXT PRIMARY KEY, model TEXT, dim INT, vec BLOB)"
+        )
+        self._conn.commit()
+
+    @staticmethod
+    def make_key(model_id: str, text: str) -> str:
+        return hashlib.sha256(f"{model_id}\x00{text}".encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[List[float]]:
+        return self.get_many([key]).get(key)
+
+    def get_many(self, keys: List[str]) -> Dict[str, List[float]]:
+        """여러 키를 한 번에 조회 (적중한 키만 반환)"""
+        found = {}
+        unique_keys = list(dict.fromkeys(keys))
+        with self._lock:
+            for i in range(0, len(unique_keys), self.LOOKUP_BATCH):
+                batch = unique_keys[i:i + self.LOOKUP_BATCH]
+                rows = self._conn.execute(
+                    f"SELECT key, vec FROM embeddings WHERE key IN ({','.join('?' * len(batch))})",
+                    batch
+                ).fetchall()
+                for key, vec in rows:
+                    found[key] = np.frombuffer(vec, dtype=np.float32).tolist()
+        return found
+
+    def put(self, key: str, model_id: str, embedding: List[float]):
+        vec = np.asarray(embedding, dtype=np.float32)
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO embeddings (key, model, dim, vec) VALUES (?, ?, ?, ?)",
+                (key, model_id, len(vec), vec.tobytes())
+            )
+            self._conn.commit()
+
+
+# 경로별 임베딩 캐시 (프로세스 공유)
+_EMBEDDING_CACHES: Dict[str, EmbeddingCache] = {}
+_embedding_caches_lock = threading.Lock()
+
+
+def _get_embedding_cache(path: str) -> Optional[EmbeddingCache]:
+    """경로별 임베딩 캐시 반환 (열 수 없으면 캐시 없이 동작)"""
+    if not path:
+        return None
+    cache = _EMBEDDING_CACHES.get(path)
+    if cache is None:
+        with _embedding_caches_lock:
+            cache = _EMBEDDING_CACHES.get(path)
+            if cache is None:
+                try:
+                    cache = EmbeddingCache(path)
+                except (sqlite3.Error, OSError) as e:
+                    print(f"[경고] 임베딩 캐시를 열 수 없습니다 ({path}): {e}")
+                    return None
+                _EMBEDDING_CACHES[path] = cache
+    return cache
+
 
 class BedrockEmbedder:
     """Amazon Bedrock을 사용한 임베딩 생성"""
 
     def __init__(self, config: AWSConfig = None):
         self.config = config or AWSConfig()
-        self.bedrock_client = boto3.client(
-            "bedrock-runtime",
-            region_name=self.config.bedrock_region
-        )
+        self.bedrock_client = get_client("bedrock-runtime", self.config.bedrock_region)
         self.model_id = self.config.bedrock_embedding_model_id
+        self.cache = _get_embedding_cache(self.config.embedding_cache_path)
+        # 청크 임베딩 보관 dtype (fp16 인코더 인덱스면 float16으로 보관해 메모리/전송량 절감)
+        self.vector_dtype = np.float16 if self.config.opensearch_vector_encoder == "fp16" else np.float32
+
+    def create_embedding(self, text: str) -> List[float]:
+        """단일 텍스트의 임베딩 생성 (캐시 적중 시 Bedrock 호출 생략)"""
+        text = text[:MAX_EMBEDDING_CHARS]
+        key = self.cache.make_key(self.model_id, text) if self.cache else None
+
+        embedding = self.cache.get(key) if key else None
+        if embedding is None:
+            embedding = self._invoke_embedding(text)
+            self._cache_put(key, embedding)
+
+        return self._postprocess(embedding)
+
+    def _cache_put(self, key: Optional[str], embedding: List[float]):
+        if key is None or not embedding:
+            return
+        try:
+            self.cache.put(key, self.model_id, embedding)
+        except sqlite3.Error as e:
+            print(f"[경고] 임베딩 캐시 저장 실패: {e}")
+
+    def _postprocess(self, embedding: List[float]) -> List[float]:
+        if embedding and self.config.opensearch_vector_encoder == "fp16":
+            # 인덱스의 fp16 인코더와 같은 정밀도로 맞춤 (fp16 범위 밖 값 색인 오류 방지)
+            embedding = np.asarray(embedding, dtype=np.float16).astype(np.float32).tolist()
+        return embedding
 
     @retry(
         stop=stop_after_attempt(3),
         wait=wait_exponential(multiplier=1, min=2, max=10)
     )
-    def create_embedding(self, text: str) -> List[float]:
-        """단일 텍스트의 임베딩 생성"""
-        # 텍스트 길이 제한 (Titan은 8192 토큰)
-        max_chars = 25000  # 대략 8000 토큰
-        if len(text) > max_chars:
-            text = text[:max_chars]
-
+    def _invoke_embedding(self, text: str) -> List[float]:
+        """Titan 임베딩 호출 (float32 정밀도, 캐시 적중 여부와 관계없이 같은 값이 되도록 캐시 저장 형식과 맞춤)"""
         request_body = {
             "inputText": text
         }
@@ -48,37 +150,109 @@ class BedrockEmbedder:
         )
 
         response_body = json.loads(response["body"].read())
-        embedding = response_body.get("embedding", [])
-
-        return embedding
+        return np.asarray(response_body.get("embedding", []), dtype=np.float32).tolist()
 
     def create_embeddings_batch(
         self,
         chunks: List[DocumentChunk],
-        batch_size: int = 10
+        batch_size: int = 10,
+        max_workers: int = 16
     ) -> List[Dict[str, Any]]:
-        """여러 청크의 임베딩을 배치로 생성"""
-        embedded_chunks = []
+        """여러 청크의 임베딩을 배치로 생성 (입력 순서 유지)
 
-        for i, chunk in enumerate(chunks):
-            try:
-                embedding = self.create_embedding(chunk.content)
+        Titan 임베딩 invoke_model은 요청당 텍스트 1개만 받으므로 요청을 병렬로 보낸다.
+        각 청크의 "embedding"은 vector_dtype numpy 배열로 담는다.
+        """
+        texts = [chunk.embedding_text[:MAX_EMBEDDING_CHARS] for chunk in chunks]
+
+        # 같은 내용(머리글/바닥글/반복 표 등)은 한 번만 임베딩 후 모든 청크에 공유
+        unique_texts = list(dict.fromkeys(texts))
+        if len(unique_texts) < len(texts):
+            print(f"[중복] {len(texts)}개 청크 중 고유 내용 {len(unique_texts)}개만 임베딩")
 
-                embedded_chunk = chunk.to_dict()
-                embedded_chunk["embedding"] = embedding
+        # 캐시 적중분은 한 번의 조회로 가져오고, 미적중분만 Bedrock 호출
+        keys = {t: self.cache.make_key(self.model_id, t) for t in unique_texts} if self.cache else {}
+        cached = self.cache.get_many(list(keys.values())) if self.cache else {}
+        if cached:
+            print(f"[캐시] 고유 내용 {len(unique_texts)}개 중 {len(cached)}개 임베딩 재사용")
 
-                embedded_chunks.append(embedded_chunk)
+        def _embed(text: str):
+            try:
+                key = keys.get(text)
+                embedding = cached.get(key) if key else None
+                if embedding is None:
+                    embedding = self._invoke_embedding(text)
+                    self._cache_put(key, embedding)
+                return np.asarray(embedding, dtype=self.vector_dtype), None
+            except Exception as e:
+                return np.empty(0, dtype=self.vector_dtype), e
 
+        results = {}
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(unique_texts)))) as executor:
+            for i, result in enumerate(executor.map(_embed, unique_texts)):
+                results[unique_texts[i]] = result
                 if (i + 1) % batch_size == 0:
-                    print(f"[진행] {i + 1}/{len(chunks)} 청크 임베딩 완료")
+                    print(f"[진행] {i + 1}/{len(unique_texts)} 청크 임베딩 완료")
 
-            except Exception as e:
-                print(f"[오류] 청크 {i} 임베딩 실패: {e}")
+        embedded_chunks = []
+        for i, (chunk, text) in enumerate(zip(chunks, texts)):
+            embedding, error = results[text]
+
+            embedded_chunk = chunk.to_dict()
+            embedded_chunk["embedding"] = embedding
+
+            if error is not None:
+                print(f"[오류] 청크 {i} 임베딩 실패: {error}")
                 # 임베딩 실패시 빈 벡터 추가
-                embedded_chunk = chunk.to_dict()
-                embedded_chunk["embedding"] = []
-                embedded_chunk["embedding_error"] = str(e)
-                embedded_chunks.append(embedded_chunk)
+                embedded_chunk["embedding_error"] = str(error)
+
+            embedded_chunks.append(embedded_chunk)
+
+        print(f"[완료] 총 {len(embedded_chunks)}개 청크 임베딩 생성")
+        return embedded_chunks
+
+    async def acreate_embedding(self, text: str) -> List[float]:
+        """단일 텍스트 임베딩 (비동기, boto3 호출은 스레드에서 실행)"""
+        return await asyncio.to_thread(self.create_embedding, text)
+
+    async def acreate_embeddings(
+        self,
+        texts: List[str],
+        max_concurrency: int = 16
+    ) -> List[List[float]]:
+        """여러 텍스트 임베딩을 동시에 생성 (입력 순서 유지, 동시 호출 수 제한)"""
+        sem = asyncio.Semaphore(max_concurrency)
+
+        async def _bounded(text: str) -> List[float]:
+            async with sem:
+                return await self.acreate_embedding(text)
+
+        return await asyncio.gather(*[_bounded(text) for text in texts])
+
+    async def acreate_embeddings_batch(
+        self,
+        chunks: List[DocumentChunk],
+        max_concurrency: int = 16
+    ) -> List[Dict[str, Any]]:
+        """create_embeddings_batch의 비동기 버전 (실패한 청크는 빈 벡터 + 오류 메시지)"""
+        sem = asyncio.Semaphore(max_concurrency)
+
+        async def _bounded(chunk: DocumentChunk) -> List[float]:
+            async with sem:
+                return await self.acreate_embedding(chunk.embedding_text)
+
+        results = await asyncio.gather(*[_bounded(chunk) for chunk in chunks], return_exceptions=True)
+
+        embedded_chunks = []
+        for i, (chunk, result) in enumerate(zip(chunks, results)):
+            embedded_chunk = chunk.to_dict()
+            if isinstance(result, Exception):
+                print(f"[오류] 청크 {i} 임베딩 실패: {result}")
+                embedded_chunk["embedding"] = np.empty(0, dtype=self.vector_dtype)
+                embedded_chunk["embedding_error"] = str(result)
+            else:
+                embedded_chunk["embedding"] = np.asarray(result, dtype=self.vector_dtype)
+            embedded_chunks.append(embedded_chunk)
 
         print(f"[완료] 총 {len(embedded_chunks)}개 청크 임베딩 생성")
         return embedded_chunks
@@ -87,6 +261,19 @@ class BedrockEmbedder:
         """검색 쿼리의 임베딩 생성"""
         return self.create_embedding(query)
 
+    def embed_queries(self, queries: List[str], max_workers: int = 8) -> List[List[float]]:
+        """여러 검색 쿼리의 임베딩을 한 번에 생성 (입력 순서 유지)
+
+        Titan v1은 배치 입력을 지원하지 않으므로 요청을 병렬로 보낸다.
+        """
+        if not queries:
+            return []
+        if len(queries) == 1:
+            return [self.create_embedding(queries[0])]
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(queries))) as executor:
+            return list(executor.map(self.create_embedding, queries))
+
 
 class LocalEmbedder:
     """로컬 테스트용 임베딩 생성기 (sentence-transformers 사용)"""
@@ -95,6 +282,9 @@ class LocalEmbedder:
         try:
             from sentence_transformers import SentenceTransformer
             self.model = SentenceTransformer(model_name)
+            if self.model.device.type == "cuda":
+                # GPU에서는 fp16 추론 (CPU는 fp16 연산이 느려 fp32 유지)
+                self.model.half()
             self.available = True
         except ImportError:
             print("[경고] sentence-transformers가 설치되지 않았습니다.")
@@ -106,24 +296,41 @@ class LocalEmbedder:
         if not self.available:
             return []
 
-        embedding = self.model.encode(text)
-        return embedding.tolist()
+        return self.create_embeddings([text])[0]
+
+    def create_embeddings(self, texts: List[str], batch_size: int = 64) -> List[List[float]]:
+        """여러 텍스트를 배치 인코딩 (결과 배열을 한 번에 리스트로 변환)"""
+        if not self.available or not texts:
+            return [[] for _ in texts]
+
+        return self._encode(texts, batch_size).tolist()
+
+    def _encode(self, texts: List[str], batch_size: int) -> np.ndarray:
+        """(텍스트 수, 차원) float32 배열로 인코딩"""
+        embeddings = self.model.encode(
+            texts,
+            batch_size=batch_size,
+            convert_to_numpy=True,
+            show_progress_bar=len(texts) > batch_size
+        )
+        return embeddings.astype(np.float32, copy=False)
 
     def create_embeddings_batch(
         self,
         chunks: List[DocumentChunk],
-        batch_size: int = 32
+        batch_size: int = 64
     ) -> List[Dict[str, Any]]:
         if not self.available:
             return [chunk.to_dict() for chunk in chunks]
 
-        texts = [chunk.content for chunk in chunks]
-        embeddings = self.model.encode(texts, batch_size=batch_size, show_progress_bar=True)
+        if not chunks:
+            return []
+        embeddings = self._encode([chunk.embedding_text for chunk in chunks], batch_size)
 
         embedded_chunks = []
         for chunk, embedding in zip(chunks, embeddings):
             embedded_chunk = chunk.to_dict()
-            embedded_chunk["embedding"] = embedding.tolist()
+            embedded_chunk["embedding"] = embedding
             embedded_chunks.append(embedded_chunk)
 
         return embedded_chunks
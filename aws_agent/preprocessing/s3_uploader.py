@@ -2,36 +2,48 @@
 S3 업로드 및 관리
 """
 
+import io
 import os
-import json
-import boto3
+import logging
+import orjson
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from itertools import islice
+from typing import List, Dict, Any, Iterator, Optional
+from boto3.exceptions import S3UploadFailedError
+from boto3.s3.transfer import TransferConfig, create_transfer_manager
 from botocore.exceptions import ClientError
 
 import sys
 sys.path.append(str(Path(__file__).parent.parent.parent))
+from aws_agent.aws_clients import get_client
 from aws_agent.config import AWSConfig
 
+logger = logging.getLogger(__name__)
+
+# 병렬 업로드 스레드 수 (공유 S3 클라이언트 커넥션 풀 64개 이내)
+UPLOAD_WORKERS = 32
+
+# 이 크기 이상의 JSON은 upload_fileobj로 멀티파트 업로드 (boto3 기본 임계값)
+MULTIPART_THRESHOLD = 8 * 1024 * 1024
 
 class S3Uploader:
     """S3에 문서 업로드 및 관리"""
 
     def __init__(self, config: AWSConfig = None):
         self.config = config or AWSConfig()
-        self.s3_client = boto3.client("s3", region_name=self.config.region)
+        self.s3_client = get_client("s3", self.config.region)
         self.bucket = self.config.s3_bucket
 
     def create_bucket_if_not_exists(self) -> bool:
         """버킷이 없으면 생성"""
         try:
             self.s3_client.head_bucket(Bucket=self.bucket)
-            print(f"[정보] 버킷 존재: {self.bucket}")
+            logger.info("[정보] 버킷 존재: %s", self.bucket)
             return True
         except ClientError as e:
             error_code = e.response["Error"]["Code"]
             if error_code == "404":
-                print(f"[정보] 버킷 생성: {self.bucket}")
+                logger.info("[정보] 버킷 생성: %s", self.bucket)
                 try:
                     # 리전별 설정
                     if self.config.region == "us-east-1":
@@ -45,10 +57,10 @@ class S3Uploader:
                         )
                     return True
                 except ClientError as create_error:
-                    print(f"[오류] 버킷 생성 실패: {create_error}")
+                    logger.error("[오류] 버킷 생성 실패: %s", create_error)
                     return False
             else:
-                print(f"[오류] 버킷 확인 실패: {e}")
+                logger.error("[오류] 버킷 확인 실패: %s", e)
                 return False
 
     def upload_file(self, local_path: str, s3_key: str) -> Optional[str]:
@@ -56,87 +68,125 @@ class S3Uploader:
         try:
             self.s3_client.upload_file(local_path, self.bucket, s3_key)
             s3_uri = f"s3://{self.bucket}/{s3_key}"
-            print(f"[성공] 업로드: {local_path} -> {s3_uri}")
+            logger.debug("[성공] 업로드: %s -> %s", local_path, s3_uri)
             return s3_uri
-        except ClientError as e:
-            print(f"[오류] 업로드 실패: {e}")
+        except (ClientError, S3UploadFailedError) as e:
+            logger.error("[오류] 업로드 실패: %s", e)
             return None
 
     def upload_json(self, data: Dict[str, Any], s3_key: str) -> Optional[str]:
         """JSON 데이터를 S3에 업로드"""
         try:
-            json_bytes = json.dumps(data, ensure_ascii=False, indent=2).encode("utf-8")
-            self.s3_client.put_object(
-                Bucket=self.bucket,
-                Key=s3_key,
-                Body=json_bytes,
-                ContentType="application/json"
+            # orjson은 UTF-8 bytes를 바로 반환 (들여쓰기 없는 압축 형식, numpy 배열 임베딩도 직렬화)
+            json_bytes = orjson.dumps(
+                data,
+                option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
             )
+            if len(json_bytes) >= MULTIPART_THRESHOLD:
+                # 큰 객체는 파트 단위 병렬 업로드
+                self.s3_client.upload_fileobj(
+                    io.BytesIO(json_bytes),
+                    self.bucket,
+                    s3_key,
+                    ExtraArgs={"ContentType": "application/json"}
+                )
+            else:
+                self.s3_client.put_object(
+                    Bucket=self.bucket,
+                    Key=s3_key,
+                    Body=json_bytes,
+                    ContentType="application/json"
+                )
             s3_uri = f"s3://{self.bucket}/{s3_key}"
-            print(f"[성공] JSON 업로드: {s3_uri}")
+            logger.debug("[성공] JSON 업로드: %s", s3_uri)
             return s3_uri
-        except ClientError as e:
-            print(f"[오류] JSON 업로드 실패: {e}")
+        except (ClientError, S3UploadFailedError) as e:
+            # upload_fileobj(멀티파트) 실패는 S3UploadFailedError로 감싸져 올라옴
+            logger.error("[오류] JSON 업로드 실패: %s", e)
             return None
 
     def upload_directory(
         self,
         local_dir: str,
         s3_prefix: str,
-        file_extension: str = ".json"
+        file_extension: str = ".json",
+        max_workers: int = UPLOAD_WORKERS
     ) -> List[str]:
-        """디렉토리 내 파일들을 S3에 업로드"""
-        uploaded = []
-        local_path = Path(local_dir)
+        """디렉토리 내 파일들을 S3에 병렬 업로드 (TransferManager 하나가 전체 전송을 스케줄링)"""
+        pairs = [
+            (str(file_path), f"{s3_prefix}{file_path.name}")
+            for file_path in Path(local_dir).glob(f"*{file_extension}")
+        ]
+        if not pairs:
+            logger.info("[완료] 업로드할 파일 없음")
+            return []
 
-        for file_path in local_path.glob(f"*{file_extension}"):
-            s3_key = f"{s3_prefix}{file_path.name}"
-            result = self.upload_file(str(file_path), s3_key)
-            if result:
-                uploaded.append(result)
+        transfer_config = TransferConfig(
+            max_concurrency=max_workers,
+            multipart_threshold=MULTIPART_THRESHOLD,
+            multipart_chunksize=MULTIPART_THRESHOLD,
+            max_io_queue=1000
+        )
 
-        print(f"[완료] {len(uploaded)}개 파일 업로드")
+        uploaded = []
+        failed = 0
+        with create_transfer_manager(self.s3_client, transfer_config) as manager:
+            futures = [manager.upload(local, self.bucket, s3_key) for local, s3_key in pairs]
+            for (local, s3_key), future in zip(pairs, futures):
+                try:
+                    future.result()
+                except Exception as e:
+                    logger.error("[오류] 업로드 실패: %s: %s", local, e)
+                    failed += 1
+                    continue
+                s3_uri = f"s3://{self.bucket}/{s3_key}"
+                logger.debug("[성공] 업로드: %s -> %s", local, s3_uri)
+                uploaded.append(s3_uri)
+
+        logger.info("[완료] %d개 파일 업로드, %d개 실패", len(uploaded), failed)
         return uploaded
 
     def download_file(self, s3_key: str, local_path: str) -> bool:
         """S3에서 파일 다운로드"""
         try:
             self.s3_client.download_file(self.bucket, s3_key, local_path)
-            print(f"[성공] 다운로드: {s3_key} -> {local_path}")
+            logger.debug("[성공] 다운로드: %s -> %s", s3_key, local_path)
             return True
         except ClientError as e:
-            print(f"[오류] 다운로드 실패: {e}")
+            logger.error("[오류] 다운로드 실패: %s", e)
             return False
 
-    def list_objects(self, prefix: str = "") -> List[Dict[str, Any]]:
-        """버킷 내 객체 목록 조회"""
+    def iter_objects(self, prefix: str = "") -> Iterator[Dict[str, Any]]:
+        """버킷 내 객체를 페이지 단위로 조회하며 하나씩 반환 (S3 응답 항목 그대로)"""
+        paginator = self.s3_client.get_paginator("list_objects_v2")
+        for page in paginator.paginate(
+            Bucket=self.bucket,
+            Prefix=prefix,
+            PaginationConfig={"PageSize": 1000}
+        ):
+            yield from page.get("Contents", ())
+
+    def list_objects(self, prefix: str = "", limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """버킷 내 객체 목록 조회 (1000개 초과 시 다음 페이지까지, last_modified는 ISO 문자열)"""
+        objects = []
         try:
-            response = self.s3_client.list_objects_v2(
-                Bucket=self.bucket,
-                Prefix=prefix
-            )
-
-            objects = []
-            for obj in response.get("Contents", []):
+            for obj in islice(self.iter_objects(prefix), limit):
                 objects.append({
                     "key": obj["Key"],
                     "size": obj["Size"],
                     "last_modified": obj["LastModified"].isoformat()
                 })
-
-            return objects
         except ClientError as e:
-            print(f"[오류] 목록 조회 실패: {e}")
-            return []
+            logger.error("[오류] 목록 조회 실패: %s", e)
+        return objects
 
     def get_json(self, s3_key: str) -> Optional[Dict[str, Any]]:
         """S3에서 JSON 파일 읽기"""
         try:
             response = self.s3_client.get_object(Bucket=self.bucket, Key=s3_key)
-            content = response["Body"].read().decode("utf-8")
-            return json.loads(content)
+            return orjson.loads(response["Body"].read())
         except ClientError as e:
-            print(f"[오류] JSON 읽기 실패: {e}")
+            logger.error("[오류] JSON 읽기 실패: %s", e)
             return None
 
 
@@ -149,7 +199,7 @@ def upload_extracted_jsons(json_dir: str = None):
 
     # 버킷 생성 확인
     if not uploader.create_bucket_if_not_exists():
-        print("[오류] 버킷 생성/확인 실패")
+        logger.error("[오류] 버킷 생성/확인 실패")
         return
 
     # JSON 파일 업로드
@@ -159,10 +209,11 @@ def upload_extracted_jsons(json_dir: str = None):
         file_extension=".json"
     )
 
-    print(f"\n총 {len(uploaded)}개 파일 업로드 완료")
+    logger.info("총 %d개 파일 업로드 완료", len(uploaded))
     return uploaded
 
 
 if __name__ == "__main__":
     # 테스트
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
     upload_extracted_jsons()
@@ -2,8 +2,10 @@
 벡터스토어 모듈
 - OpenSearch Serverless 연동
 - 벡터 인덱싱 및 검색
+- 검색 결과 시맨틱 캐시
 """
 
 from .opensearch_client import OpenSearchVectorStore
+from .semantic_cache import SemanticRetrievalCache
 
-__all__ = ["OpenSearchVectorStore"]
+__all__ = ["OpenSearchVectorStore", "SemanticRetrievalCache"]
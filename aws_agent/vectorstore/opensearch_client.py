@@ -3,66 +3,171 @@ OpenSearch Serverless 벡터 스토어 클라이언트
 """
 
 import json
-from typing import List, Dict, Any, Optional
+import time
+import logging
+import threading
+from itertools import islice
+from typing import List, Dict, Any, Iterator, Optional, Tuple
 from pathlib import Path
-from opensearchpy import OpenSearch, RequestsHttpConnection
-from requests_aws4auth import AWS4Auth
-import boto3
+import numpy as np
+import orjson
+from opensearchpy import OpenSearch, Urllib3AWSV4SignerAuth, Urllib3HttpConnection
+from opensearchpy.exceptions import NotFoundError, SerializationError
+from opensearchpy.helpers import bulk, parallel_bulk
+from opensearchpy.serializer import JSONSerializer
 
 import sys
 sys.path.append(str(Path(__file__).parent.parent.parent))
+from aws_agent.aws_clients import get_session
 from aws_agent.config import AWSConfig
+from aws_agent.vectorstore.semantic_cache import shared_retrieval_cache
+
+logger = logging.getLogger(__name__)
+
+# 벌크 요청 하나의 최대 본문 크기 (임베딩 포함 문서 기준)
+BULK_MAX_CHUNK_BYTES = 50 * 1024 * 1024
+
+
+def _invalidate_cached_results(documents: List[Dict[str, Any]]):
+    """새로 색인한 문서의 신기술에 대한 검색 결과 캐시 무효화"""
+    for tech_id in {doc.get("tech_id") for doc in documents}:
+        shared_retrieval_cache.invalidate(tech_id)
+
+
+class ORJSONSerializer(JSONSerializer):
+    """orjson 기반 요청/응답 직렬화 (벌크 본문의 임베딩 직렬화 비용 절감, numpy 배열 직접 지원)"""
+
+    def dumps(self, data: Any) -> str:
+        if isinstance(data, str):
+            return data
+        try:
+            return orjson.dumps(
+                data,
+                default=self.default,
+                option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+            ).decode("utf-8")
+        except orjson.JSONEncodeError as e:
+            raise SerializationError(data, e)
+
+    def loads(self, s: Any) -> Any:
+        try:
+            return orjson.loads(s)
+        except orjson.JSONDecodeError as e:
+            raise SerializationError(s, e)
+
+
+# OpenSearch 클라이언트 (엔드포인트/리전별 프로세스 공유, 스레드 안전)
+_OPENSEARCH_CLIENTS: Dict[Tuple[str, str], OpenSearch] = {}
+_opensearch_clients_lock = threading.Lock()
+
+
+def _get_opensearch_client(endpoint: str, region: str) -> OpenSearch:
+    """엔드포인트/리전별 OpenSearch 클라이언트 반환 (최초 호출 시 자격 증명 조회 및 생성)"""
+    key = (endpoint, region)
+    client = _OPENSEARCH_CLIENTS.get(key)
+    if client is None:
+        with _opensearch_clients_lock:
+            client = _OPENSEARCH_CLIENTS.get(key)
+            if client is None:
+                # AWS 인증 (요청마다 SigV4 서명, 임시 자격 증명은 boto3가 갱신)
+                credentials = get_session().get_credentials()
+                auth = Urllib3AWSV4SignerAuth(
+                    credentials,
+                    region,
+                    "aoss"  # OpenSearch Serverless 서비스명
+                )
+
+                # 엔드포인트에서 호스트 추출
+                host = endpoint.replace("https://", "").replace("http://", "")
+
+                client = OpenSearch(
+                    hosts=[{"host": host, "port": 443}],
+                    http_auth=auth,
+                    use_ssl=True,
+                    verify_certs=True,
+                    connection_class=Urllib3HttpConnection,
+                    pool_maxsize=64,  # parallel_bulk/다중 검색 스레드가 커넥션을 기다리지 않도록
+                    http_compress=True,  # 임베딩 벌크 본문 gzip 압축
+                    serializer=ORJSONSerializer(),
+                    timeout=30
+                )
+                _OPENSEARCH_CLIENTS[key] = client
+    return client
+
+
+# 검색 응답에서 임베딩 제외 (서버가 직렬화/전송하지 않음) 및 필요한 필드만 받기
+_SOURCE_EXCLUDES = {"excludes": ["embedding"]}
+_HITS_FILTER_PATH = "hits.hits._id,hits.hits._score,hits.hits._source"
+
+
+def _knn_clause(query_embedding: List[float], k: int, boost: Optional[float] = None) -> Dict[str, Any]:
+    """embedding 필드 kNN 절"""
+    params: Dict[str, Any] = {"vector": query_embedding, "k": k}
+    if boost is not None:
+        params["boost"] = boost
+    return {"knn": {"embedding": params}}
+
+
+def _tech_id_filter(tech_id: str) -> Dict[str, Any]:
+    """tech_id 일치 필터 절"""
+    return {"term": {"tech_id": tech_id}}
+
+
+# 존재가 확인된 인덱스 (엔드포인트, 인덱스 이름) - 프로세스 내 재확인 요청 생략
+_KNOWN_INDICES: set = set()
+
+# 자동 조정으로 선택한 벌크 크기 (엔드포인트, 인덱스 이름) - 요청마다 스토어를 새로 만들어도 측정은 1회
+_TUNED_BULK_SIZES: Dict[Tuple[str, str], int] = {}
 
 
 class OpenSearchVectorStore:
     """OpenSearch Serverless 벡터 스토어"""
 
+    # 벌크 크기 자동 조정 시 측정할 후보 (문서 수, 작은 것부터)
+    BULK_SIZE_CANDIDATES = (50, 200, 500, 1000)
+    DEFAULT_BULK_SIZE = 500
+
     def __init__(self, config: AWSConfig = None):
         self.config = config or AWSConfig()
         self.index_name = self.config.opensearch_index_name
         self.client = self._create_client()
 
     def _create_client(self) -> Optional[OpenSearch]:
-        """OpenSearch 클라이언트 생성"""
+        """OpenSearch 클라이언트 반환 (엔드포인트별 공유)"""
         if not self.config.opensearch_endpoint:
-            print("[경고] OPENSEARCH_ENDPOINT가 설정되지 않았습니다.")
-            print("OpenSearch Serverless 컬렉션을 생성하고 엔드포인트를 설정하세요.")
+            logger.warning(
+                "[경고] OPENSEARCH_ENDPOINT가 설정되지 않았습니다. "
+                "OpenSearch Serverless 컬렉션을 생성하고 엔드포인트를 설정하세요."
+            )
             return None
 
-        # AWS 인증
-        credentials = boto3.Session().get_credentials()
-        auth = AWS4Auth(
-            credentials.access_key,
-            credentials.secret_key,
-            self.config.region,
-            "aoss",  # OpenSearch Serverless 서비스명
-            session_token=credentials.token
-        )
-
-        # 엔드포인트에서 호스트 추출
-        host = self.config.opensearch_endpoint.replace("https://", "").replace("http://", "")
-
-        client = OpenSearch(
-            hosts=[{"host": host, "port": 443}],
-            http_auth=auth,
-            use_ssl=True,
-            verify_certs=True,
-            connection_class=RequestsHttpConnection,
-            timeout=30
-        )
-
-        return client
+        return _get_opensearch_client(self.config.opensearch_endpoint, self.config.region)
 
     def create_index(self) -> bool:
         """벡터 인덱스 생성"""
         if not self.client:
             return False
 
-        # 인덱스 존재 여부 확인
+        # 인덱스 존재 여부 확인 (확인된 인덱스는 요청 생략)
+        index_key = (self.config.opensearch_endpoint, self.index_name)
+        if index_key in _KNOWN_INDICES:
+            return True
         if self.client.indices.exists(index=self.index_name):
-            print(f"[정보] 인덱스 이미 존재: {self.index_name}")
+            logger.info("[정보] 인덱스 이미 존재: %s", self.index_name)
+            _KNOWN_INDICES.add(index_key)
             return True
 
+        # HNSW 파라미터 (fp16 스칼라 양자화 시 벡터 저장/거리 계산 대역폭 절반)
+        method_params: Dict[str, Any] = {
+            "ef_construction": 512,
+            "m": 16
+        }
+        if self.config.opensearch_vector_encoder == "fp16":
+            method_params["encoder"] = {
+                "name": "sq",
+                "parameters": {"type": "fp16"}
+            }
+
         # 인덱스 매핑 정의
         index_body = {
             "settings": {
@@ -72,6 +177,8 @@ class OpenSearchVectorStore:
                 }
             },
             "mappings": {
+                # 벡터는 kNN 그래프에만 저장 (_source 사본은 저장/반환하지 않음)
+                "_source": {"excludes": ["embedding"]},
                 "properties": {
                     "tech_id": {"type": "keyword"},
                     "file_name": {"type": "keyword"},
@@ -86,11 +193,8 @@ class OpenSearchVectorStore:
                         "method": {
                             "name": "hnsw",
                             "space_type": "l2",
-                            "engine": "nmslib",
-                            "parameters": {
-                                "ef_construction": 512,
-                                "m": 16
-                            }
+                            "engine": "faiss",
+                            "parameters": method_params
                         }
                     }
                 }
@@ -102,183 +206,281 @@ class OpenSearchVectorStore:
                 index=self.index_name,
                 body=index_body
             )
-            print(f"[성공] 인덱스 생성: {self.index_name}")
+            logger.info("[성공] 인덱스 생성: %s", self.index_name)
+            _KNOWN_INDICES.add(index_key)
             return True
         except Exception as e:
-            print(f"[오류] 인덱스 생성 실패: {e}")
+            logger.error("[오류] 인덱스 생성 실패: %s", e)
             return False
 
     def index_documents(
         self,
         documents: List[Dict[str, Any]],
-        batch_size: int = 100
+        batch_size: Optional[int] = None,
+        thread_count: int = 4
     ) -> int:
-        """문서들을 벡터 인덱스에 추가"""
+        """문서들을 벡터 인덱스에 추가 (여러 벌크 요청을 스레드로 동시 전송)
+
+        batch_size를 지정하지 않으면 엔드포인트/인덱스별 첫 색인 때 앞쪽 문서로 벌크 크기를 자동 조정한다.
+        """
         if not self.client:
             return 0
 
+        actions = self._bulk_actions(documents)
         indexed_count = 0
-
-        for i in range(0, len(documents), batch_size):
-            batch = documents[i:i + batch_size]
-            bulk_body = []
-
-            for doc in batch:
-                # 임베딩이 없거나 비어있으면 건너뛰기
-                if not doc.get("embedding"):
-                    continue
-
-                # 인덱스 액션
-                action = {
-                    "index": {
-                        "_index": self.index_name,
-                        "_id": f"{doc['tech_id']}_{doc['chunk_index']}"
-                    }
-                }
-                bulk_body.append(action)
-                bulk_body.append(doc)
-
-            if bulk_body:
-                try:
-                    response = self.client.bulk(body=bulk_body)
-                    if not response.get("errors"):
-                        indexed_count += len(batch)
-                        print(f"[진행] {indexed_count}개 문서 인덱싱 완료")
-                    else:
-                        print(f"[경고] 일부 문서 인덱싱 실패")
-                except Exception as e:
-                    print(f"[오류] 벌크 인덱싱 실패: {e}")
-
-        print(f"[완료] 총 {indexed_count}개 문서 인덱싱")
+        failed_count = 0
+
+        if batch_size is None:
+            batch_size = _TUNED_BULK_SIZES.get(self._bulk_size_key)
+            if batch_size is None:
+                batch_size, indexed_count, failed_count = self._autotune_batch_size(actions)
+
+        for ok, item in parallel_bulk(
+            self.client,
+            actions,
+            thread_count=thread_count,
+            chunk_size=batch_size,
+            max_chunk_bytes=BULK_MAX_CHUNK_BYTES,
+            queue_size=thread_count,
+            raise_on_error=False,
+            raise_on_exception=False
+        ):
+            if ok:
+                indexed_count += 1
+                if indexed_count % batch_size == 0:
+                    logger.debug("[진행] %d개 문서 인덱싱 완료", indexed_count)
+            else:
+                failed_count += 1
+                if failed_count == 1:
+                    logger.error("[오류] 문서 인덱싱 실패: %s", item)
+                    self._forget_index_if_missing(item)
+
+        if failed_count:
+            logger.warning("[경고] %d개 문서 인덱싱 실패", failed_count)
+        logger.info("[완료] 총 %d개 문서 인덱싱", indexed_count)
+        _invalidate_cached_results(documents)
         return indexed_count
 
+    @property
+    def _bulk_size_key(self) -> Tuple[str, str]:
+        return (self.config.opensearch_endpoint, self.index_name)
+
+    def _autotune_batch_size(self, actions: Iterator[Dict[str, Any]]) -> Tuple[int, int, int]:
+        """앞쪽 문서로 벌크 크기별 처리량(문서/초)을 측정해 가장 빠른 크기 선택
+
+        측정에 쓴 문서는 그대로 색인되며 (선택한 크기, 색인된 문서 수, 실패 문서 수)를 반환한다.
+        오류(429 요청 제한 포함)가 나면 더 큰 크기는 시도하지 않는다.
+        """
+        best_size, best_rate = self.DEFAULT_BULK_SIZE, 0.0
+        indexed = 0
+        failed = 0
+
+        for size in self.BULK_SIZE_CANDIDATES:
+            # 측정 구간도 액션 스트림에서 바로 소비 (리스트로 모으지 않음)
+            start = time.perf_counter()
+            success, errors = bulk(
+                self.client,
+                islice(actions, size),
+                chunk_size=size,
+                max_chunk_bytes=BULK_MAX_CHUNK_BYTES,
+                raise_on_error=False,
+                raise_on_exception=False
+            )
+            elapsed = time.perf_counter() - start
+            indexed += success
+            failed += len(errors)
+            consumed = success + len(errors)
+            if consumed == 0:
+                break
+
+            if errors:
+                logger.warning("[경고] 벌크 크기 %d에서 %d개 문서 실패, 자동 조정 중단", size, len(errors))
+                logger.error("[오류] 문서 인덱싱 실패: %s", errors[0])
+                self._forget_index_if_missing(errors[0])
+                if best_rate == 0:
+                    best_size = self.BULK_SIZE_CANDIDATES[0]
+                    _TUNED_BULK_SIZES[self._bulk_size_key] = best_size
+                break
+            if consumed < size:
+                # 남은 문서가 부족해 처리량 비교 불가
+                break
+
+            rate = success / elapsed if elapsed > 0 else 0.0
+            if rate > best_rate:
+                best_size, best_rate = size, rate
+
+        if best_rate > 0:
+            _TUNED_BULK_SIZES[self._bulk_size_key] = best_size
+            logger.info("[정보] 벌크 크기 자동 선택: %d (%.0f 문서/초)", best_size, best_rate)
+        return best_size, indexed, failed
+
+    def _forget_index_if_missing(self, error: Any):
+        """인덱스 없음 오류면 확인된 인덱스 기록에서 제거 (외부에서 삭제된 경우 다음 create_index가 다시 생성)"""
+        if isinstance(error, NotFoundError) or "index_not_found_exception" in str(error):
+            _KNOWN_INDICES.discard((self.config.opensearch_endpoint, self.index_name))
+
+    def _bulk_actions(self, documents: List[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+        """벌크 색인 액션을 문서 하나씩 생성 (임베딩이 없거나 비어있는 문서는 건너뜀)
+
+        벌크 본문을 리스트로 만들지 않고 헬퍼가 요청 단위로 소비하게 한다.
+        """
+        for doc in documents:
+            embedding = doc.get("embedding")
+            if embedding is None or len(embedding) == 0:
+                continue
+            if not isinstance(embedding, np.ndarray):
+                # 리스트 임베딩은 float32 배열로 바꿔 serializer의 numpy 경로로 직렬화 (원본 문서는 유지)
+                doc = {**doc, "embedding": np.asarray(embedding, dtype=np.float32)}
+
+            action = {
+                "_op_type": "index",
+                "_index": self.index_name,
+                "_id": f"{doc['tech_id']}_{doc['chunk_index']}",
+                "_source": doc
+            }
+            if self.config.opensearch_routing:
+                # 같은 신기술의 청크를 한 샤드에 모음
+                action["_routing"] = doc["tech_id"]
+            yield action
+
     def search(
         self,
         query_embedding: List[float],
         tech_id: Optional[str] = None,
-        k: int = 10
+        k: int = 10,
+        routing: Optional[str] = None
     ) -> List[Dict[str, Any]]:
-        """벡터 유사도 검색"""
+        """벡터 유사도 검색 (routing 지정 시 해당 샤드만 검색)"""
         if not self.client:
             return []
 
-        # kNN 검색 쿼리
-        query = {
-            "size": k,
-            "query": {
-                "knn": {
-                    "embedding": {
-                        "vector": query_embedding,
-                        "k": k
-                    }
-                }
-            }
-        }
-
-        # tech_id 필터 추가
-        if tech_id:
-            query["query"] = {
-                "bool": {
-                    "must": [
-                        {
-                            "knn": {
-                                "embedding": {
-                                    "vector": query_embedding,
-                                    "k": k * 2  # 필터링을 고려해 더 많이 검색
-                                }
-                            }
-                        }
-                    ],
-                    "filter": [
-                        {"term": {"tech_id": tech_id}}
-                    ]
-                }
-            }
-
         try:
             response = self.client.search(
                 index=self.index_name,
-                body=query
+                body=self._knn_query(query_embedding, tech_id, k),
+                routing=routing,
+                filter_path=_HITS_FILTER_PATH
             )
+            return self._parse_hits(response, k)
+
+        except Exception as e:
+            logger.error("[오류] 검색 실패: %s", e)
+            self._forget_index_if_missing(e)
+            return []
 
-            results = []
-            for hit in response["hits"]["hits"]:
-                result = hit["_source"].copy()
-                result["_score"] = hit["_score"]
-                result["_id"] = hit["_id"]
-                # 임베딩은 반환에서 제외 (너무 큼)
-                result.pop("embedding", None)
-                results.append(result)
+    def msearch(
+        self,
+        query_embeddings: List[List[float]],
+        tech_id: Optional[str] = None,
+        k: int = 10,
+        routing: Optional[str] = None
+    ) -> List[List[Dict[str, Any]]]:
+        """여러 쿼리 벡터를 _msearch 요청 한 번으로 검색 (입력 순서 유지)
 
-            return results[:k]
+        실패한 쿼리는 빈 결과를 반환한다.
+        """
+        if not self.client or not query_embeddings:
+            return [[] for _ in query_embeddings]
 
+        header: Dict[str, Any] = {"index": self.index_name}
+        if routing:
+            header["routing"] = routing
+
+        body = []
+        for query_embedding in query_embeddings:
+            body.append(header)
+            body.append(self._knn_query(query_embedding, tech_id, k))
+
+        try:
+            response = self.client.msearch(body=body)
         except Exception as e:
-            print(f"[오류] 검색 실패: {e}")
-            return []
+            logger.error("[오류] 다중 검색 실패: %s", e)
+            self._forget_index_if_missing(e)
+            return [[] for _ in query_embeddings]
+
+        results = []
+        for item in response.get("responses", []):
+            if "error" in item:
+                logger.error("[오류] 검색 실패: %s", item["error"])
+                self._forget_index_if_missing(item["error"])
+                results.append([])
+            else:
+                results.append(self._parse_hits(item, k))
+        return results
+
+    def _knn_query(
+        self,
+        query_embedding: List[float],
+        tech_id: Optional[str],
+        k: int
+    ) -> Dict[str, Any]:
+        """kNN 검색 요청 본문 생성 (tech_id 지정 시 필터 추가)"""
+        if not tech_id:
+            return {"size": k, "_source": _SOURCE_EXCLUDES, "query": _knn_clause(query_embedding, k)}
+
+        # tech_id 필터 (필터링을 고려해 더 많이 검색)
+        return {
+            "size": k,
+            "_source": _SOURCE_EXCLUDES,
+            "query": {
+                "bool": {
+                    "must": [_knn_clause(query_embedding, k * 2)],
+                    "filter": [_tech_id_filter(tech_id)]
+                }
+            }
+        }
+
+    @staticmethod
+    def _parse_hits(response: Dict[str, Any], k: int) -> List[Dict[str, Any]]:
+        """검색 응답에서 상위 k개 문서 추출 (filter_path로 결과가 없으면 hits 키 자체가 없음)"""
+        results = []
+        for hit in response.get("hits", {}).get("hits", []):
+            result = hit["_source"]
+            result["_score"] = hit["_score"]
+            result["_id"] = hit["_id"]
+            results.append(result)
+
+        return results[:k]
 
     def hybrid_search(
         self,
         query_text: str,
         query_embedding: List[float],
         tech_id: Optional[str] = None,
-        k: int = 10
+        k: int = 10,
+        routing: Optional[str] = None
     ) -> List[Dict[str, Any]]:
         """하이브리드 검색 (키워드 + 벡터)"""
         if not self.client:
             return []
 
-        query = {
-            "size": k,
-            "query": {
-                "bool": {
-                    "should": [
-                        # 키워드 검색
-                        {
-                            "match": {
-                                "content": {
-                                    "query": query_text,
-                                    "boost": 0.3
-                                }
-                            }
-                        },
-                        # 벡터 검색
-                        {
-                            "knn": {
-                                "embedding": {
-                                    "vector": query_embedding,
-                                    "k": k * 2,
-                                    "boost": 0.7
-                                }
-                            }
-                        }
-                    ]
-                }
-            }
+        bool_query: Dict[str, Any] = {
+            "should": [
+                # 키워드 검색
+                {"match": {"content": {"query": query_text, "boost": 0.3}}},
+                # 벡터 검색
+                _knn_clause(query_embedding, k * 2, boost=0.7)
+            ]
         }
 
         # tech_id 필터
         if tech_id:
-            query["query"]["bool"]["filter"] = [
-                {"term": {"tech_id": tech_id}}
-            ]
+            bool_query["filter"] = [_tech_id_filter(tech_id)]
+
+        query = {"size": k, "_source": _SOURCE_EXCLUDES, "query": {"bool": bool_query}}
 
         try:
             response = self.client.search(
                 index=self.index_name,
-                body=query
+                body=query,
+                routing=routing,
+                filter_path=_HITS_FILTER_PATH
             )
-
-            results = []
-            for hit in response["hits"]["hits"]:
-                result = hit["_source"].copy()
-                result["_score"] = hit["_score"]
-                result.pop("embedding", None)
-                results.append(result)
-
-            return results[:k]
+            return self._parse_hits(response, k)
 
         except Exception as e:
-            print(f"[오류] 하이브리드 검색 실패: {e}")
+            logger.error("[오류] 하이브리드 검색 실패: %s", e)
+            self._forget_index_if_missing(e)
             return []
 
     def delete_by_tech_id(self, tech_id: str) -> int:
@@ -295,13 +497,16 @@ class OpenSearchVectorStore:
         try:
             response = self.client.delete_by_query(
                 index=self.index_name,
-                body=query
+                body=query,
+                routing=tech_id if self.config.opensearch_routing else None
             )
             deleted = response.get("deleted", 0)
-            print(f"[성공] {tech_id}의 {deleted}개 청크 삭제")
+            logger.info("[성공] %s의 %d개 청크 삭제", tech_id, deleted)
+            shared_retrieval_cache.invalidate(tech_id)
             return deleted
         except Exception as e:
-            print(f"[오류] 삭제 실패: {e}")
+            logger.error("[오류] 삭제 실패: %s", e)
+            self._forget_index_if_missing(e)
             return 0
 
     def get_stats(self) -> Dict[str, Any]:
@@ -316,55 +521,126 @@ class OpenSearchVectorStore:
                 "size_bytes": stats["indices"][self.index_name]["primaries"]["store"]["size_in_bytes"]
             }
         except Exception as e:
-            print(f"[오류] 통계 조회 실패: {e}")
+            logger.error("[오류] 통계 조회 실패: %s", e)
+            self._forget_index_if_missing(e)
             return {}
 
 
 class LocalVectorStore:
-    """로컬 테스트용 인메모리 벡터 스토어"""
+    """로컬 테스트용 인메모리 벡터 스토어
+
+    임베딩은 정규화된 (문서 수, 차원) float16 행렬 하나로 모아 두고(float32 대비 메모리 절반),
+    검색은 행 블록 단위로 float32로 올려 행렬-벡터 곱으로 코사인 유사도를 계산한다.
+    """
+
+    # 유사도 계산 시 한 번에 float32로 변환할 행 수 (numpy의 float16 matmul은 BLAS를 쓰지 않음)
+    SCORE_BLOCK_ROWS = 4096
 
     def __init__(self):
         self.documents: List[Dict[str, Any]] = []
+        # 검색 행렬의 행과 같은 순서의 메타데이터 (임베딩 제외) / tech_id
+        self._metadata: List[Dict[str, Any]] = []
+        self._tech_ids: List[Optional[str]] = []
+        # 아직 행렬에 합치지 않은 문서 (검색 시 한 번에 정규화 후 합침)
+        self._pending_docs: List[Dict[str, Any]] = []
+        self._matrix: Optional[np.ndarray] = None
+        self._tech_id_array: Optional[np.ndarray] = None
 
     def index_documents(self, documents: List[Dict[str, Any]], **kwargs) -> int:
         self.documents.extend(documents)
+
+        self._pending_docs.extend(
+            doc for doc in documents
+            if doc.get("embedding") is not None and len(doc["embedding"]) > 0
+        )
+        _invalidate_cached_results(documents)
         return len(documents)
 
+    def _build_matrix(self):
+        """새로 색인된 문서를 정규화해 검색 행렬에 합침 (노름은 한 번에 계산, 0 벡터 제외)"""
+        if not self._pending_docs:
+            return
+        docs = self._pending_docs
+        self._pending_docs = []
+
+        rows = np.vstack([np.asarray(doc["embedding"], dtype=np.float32) for doc in docs])
+        norms = np.linalg.norm(rows, axis=1)
+        keep = np.flatnonzero(norms > 0)
+        rows = (rows[keep] / norms[keep, None]).astype(np.float16)
+
+        for i in keep:
+            doc = docs[i]
+            self._metadata.append({key: value for key, value in doc.items() if key != "embedding"})
+            self._tech_ids.append(doc.get("tech_id"))
+
+        self._matrix = rows if self._matrix is None else np.vstack([self._matrix, rows])
+        self._tech_id_array = np.array(self._tech_ids, dtype=object)
+
     def search(
         self,
         query_embedding: List[float],
         tech_id: Optional[str] = None,
-        k: int = 10
+        k: int = 10,
+        routing: Optional[str] = None
     ) -> List[Dict[str, Any]]:
-        import numpy as np
+        return self.msearch([query_embedding], tech_id, k)[0]
 
-        # 필터링
-        filtered = self.documents
+    def _scores(self, matrix: np.ndarray, queries: np.ndarray) -> np.ndarray:
+        """float16 행렬과 float32 쿼리 행렬의 내적 (블록별 float32 변환 후 BLAS 행렬 곱, 결과는 문서 x 쿼리)"""
+        scores = np.empty((len(matrix), len(queries)), dtype=np.float32)
+        for start in range(0, len(matrix), self.SCORE_BLOCK_ROWS):
+            block = matrix[start:start + self.SCORE_BLOCK_ROWS]
+            scores[start:start + len(block)] = block.astype(np.float32) @ queries.T
+        return scores
+
+    def msearch(
+        self,
+        query_embeddings: List[List[float]],
+        tech_id: Optional[str] = None,
+        k: int = 10,
+        routing: Optional[str] = None
+    ) -> List[List[Dict[str, Any]]]:
+        """여러 쿼리를 행렬 곱 한 번으로 채점하고 쿼리별 상위 k개만 부분 선택"""
+        self._build_matrix()
+        if self._matrix is None or k <= 0 or not query_embeddings:
+            return [[] for _ in query_embeddings]
+
+        queries = np.asarray(query_embeddings, dtype=np.float32)
+        query_norms = np.linalg.norm(queries, axis=1)
+        valid = query_norms > 0
+        queries[valid] /= query_norms[valid, None]
+
+        # 필터링 (tech_id 일치 행만) 후 코사인 유사도 = 정규화 행렬 @ 정규화 쿼리
         if tech_id:
-            filtered = [d for d in self.documents if d.get("tech_id") == tech_id]
+            rows = np.flatnonzero(self._tech_id_array == tech_id)
+            matrix = self._matrix[rows]
+        else:
+            rows = None
+            matrix = self._matrix
+        if len(matrix) == 0:
+            return [[] for _ in query_embeddings]
+        scores = self._scores(matrix, queries)
+
+        # 쿼리(열)별 상위 k개만 부분 선택 (전체 정렬 대신 O(N))
+        k = min(k, len(matrix))
+        if k < len(matrix):
+            top = np.argpartition(-scores, k - 1, axis=0)[:k]
+        else:
+            top = np.broadcast_to(np.arange(len(matrix))[:, None], scores.shape)
 
-        # 유사도 계산
         results = []
-        query_vec = np.array(query_embedding)
-
-        for doc in filtered:
-            if not doc.get("embedding"):
+        for j in range(len(queries)):
+            if not valid[j]:
+                results.append([])
                 continue
-
-            doc_vec = np.array(doc["embedding"])
-            # 코사인 유사도
-            similarity = np.dot(query_vec, doc_vec) / (
-                np.linalg.norm(query_vec) * np.linalg.norm(doc_vec)
-            )
-
-            result = doc.copy()
-            result["_score"] = float(similarity)
-            result.pop("embedding", None)
-            results.append(result)
-
-        # 정렬 및 상위 k개 반환
-        results.sort(key=lambda x: x["_score"], reverse=True)
-        return results[:k]
+            idx = top[:, j]
+            idx = idx[np.argsort(-scores[idx, j])]
+            doc_ids = rows[idx] if rows is not None else idx
+            results.append([
+                self._metadata[i] | {"_score": float(score)}
+                for i, score in zip(doc_ids.tolist(), scores[idx, j].tolist())
+            ])
+        return results
 
 
 def get_vectorstore(use_opensearch: bool = True) -> Any:
@@ -377,6 +653,7 @@ def get_vectorstore(use_opensearch: bool = True) -> Any:
 
 if __name__ == "__main__":
     # 테스트
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
     print("=== OpenSearch 연결 테스트 ===")
 
     store = OpenSearchVectorStore()
@@ -0,0 +1,169 @@
+"""
+검색 결과 시맨틱 캐시
+- (tech_id, 쿼리) 정확 일치 캐시
+- 쿼리 임베딩 코사인 유사도 기반 근사 일치 캐시
+"""
+
+import time
+import threading
+from typing import List, Dict, Any, Hashable, Optional, Tuple
+
+import numpy as np
+
+
+class SemanticRetrievalCache:
+    """벡터 검색 결과 캐시 (프로세스 내 메모리)
+
+    동일 쿼리는 임베딩 없이 바로 반환하고, 유사한 쿼리(코사인 유사도 >= threshold)는
+    임베딩 후 벡터 검색을 건너뛴다. scope는 검색 대상(인덱스, 라우팅 등)을 구분하는 키로,
+    scope가 다른 검색 결과는 서로 공유하지 않는다.
+    """
+
+    def __init__(
+        self,
+        threshold: float = 0.95,
+        ttl_seconds: float = 3600,
+        max_entries: int = 1024
+    ):
+        self.threshold = threshold
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+
+        self._lock = threading.Lock()
+        # (tech_id, scope, k, query) -> (저장 시각, 결과)
+        self._exact: Dict[Tuple[Optional[str], Hashable, int, str], Tuple[float, List[Dict[str, Any]]]] = {}
+        # (tech_id, scope, k) -> [(저장 시각, 정규화 임베딩, 결과)]
+        self._vectors: Dict[Tuple[Optional[str], Hashable, int], List[Tuple[float, np.ndarray, List[Dict[str, Any]]]]] = {}
+
+        self.hits = 0
+        self.semantic_hits = 0
+        self.misses = 0
+
+    def get_exact(
+        self,
+        tech_id: Optional[str],
+        query: str,
+        k: int,
+        scope: Hashable = None
+    ) -> Optional[List[Dict[str, Any]]]:
+        """정확 일치 조회 (임베딩 불필요)"""
+        with self._lock:
+            entry = self._exact.get((tech_id, scope, k, query))
+            if entry and time.monotonic() - entry[0] < self.ttl_seconds:
+                self.hits += 1
+                # 호출자가 결과를 수정해도 캐시가 바뀌지 않도록 (결과 dict 단위) 얕은 복사본 반환
+                return [dict(r) for r in entry[1]]
+        return None
+
+    def get_similar(
+        self,
+        tech_id: Optional[str],
+        query_embedding: List[float],
+        k: int,
+        scope: Hashable = None
+    ) -> Optional[List[Dict[str, Any]]]:
+        """임베딩 유사도 기반 조회"""
+        query_vec = self._normalize(query_embedding)
+        if query_vec is None:
+            return None
+
+        now = time.monotonic()
+        with self._lock:
+            entries = self._vectors.get((tech_id, scope, k), [])
+            best_score = self.threshold
+            best_results = None
+            for stored_at, vec, results in entries:
+                if now - stored_at >= self.ttl_seconds:
+                    continue
+                score = float(np.dot(query_vec, vec))
+                if score >= best_score:
+                    best_score = score
+                    best_results = results
+
+            if best_results is not None:
+                self.semantic_hits += 1
+                return [dict(r) for r in best_results]
+            self.misses += 1
+            return None
+
+    def put(
+        self,
+        tech_id: Optional[str],
+        query: str,
+        query_embedding: List[float],
+        k: int,
+        results: List[Dict[str, Any]],
+        scope: Hashable = None
+    ):
+        """검색 결과 저장"""
+        now = time.monotonic()
+        query_vec = self._normalize(query_embedding)
+
+        with self._lock:
+            if len(self._exact) >= self.max_entries:
+                self._evict(now)
+            self._exact[(tech_id, scope, k, query)] = (now, results)
+            if query_vec is not None:
+                # 같은 쿼리의 이전 항목은 교체 (오래된 결과가 유사도 조회에 남지 않도록)
+                entries = [
+                    e for e in self._vectors.get((tech_id, scope, k), [])
+                    if not np.array_equal(e[1], query_vec)
+                ]
+                entries.append((now, query_vec, results))
+                self._vectors[(tech_id, scope, k)] = entries
+
+    def invalidate(self, tech_id: Optional[str] = None):
+        """색인/삭제된 신기술의 캐시 제거 (tech_id 필터 없는 검색 결과도 함께 제거, None이면 전체)"""
+        if tech_id is None:
+            self.clear()
+            return
+        targets = (tech_id, None)
+        with self._lock:
+            self._exact = {key: entry for key, entry in self._exact.items() if key[0] not in targets}
+            self._vectors = {key: entries for key, entries in self._vectors.items() if key[0] not in targets}
+
+    def clear(self):
+        """캐시 비우기"""
+        with self._lock:
+            self._exact.clear()
+            self._vectors.clear()
+
+    def stats(self) -> Dict[str, int]:
+        """캐시 적중 통계"""
+        return {
+            "hits": self.hits,
+            "semantic_hits": self.semantic_hits,
+            "misses": self.misses,
+            "entries": len(self._exact),
+        }
+
+    def _evict(self, now: float):
+        """만료 항목 제거, 그래도 가득 차면 가장 오래된 항목 제거"""
+        self._exact = {
+            key: entry for key, entry in self._exact.items()
+            if now - entry[0] < self.ttl_seconds
+        }
+        for key in list(self._vectors):
+            self._vectors[key] = [e for e in self._vectors[key] if now - e[0] < self.ttl_seconds]
+
+        while len(self._exact) >= self.max_entries:
+            oldest = min(self._exact, key=lambda key: self._exact[key][0])
+            vector_key = oldest[:3]
+            stored_at = self._exact.pop(oldest)[0]
+            self._vectors[vector_key] = [
+                e for e in self._vectors.get(vector_key, []) if e[0] != stored_at
+            ]
+
+    @staticmethod
+    def _normalize(embedding: List[float]) -> Optional[np.ndarray]:
+        if embedding is None or len(embedding) == 0:
+            return None
+        vec = np.asarray(embedding, dtype=np.float32)
+        norm = np.linalg.norm(vec)
+        if norm == 0:
+            return None
+        return vec / norm
+
+
+# 프로세스 공유 검색 캐시 (에이전트 조회, 벡터 스토어 색인/삭제 시 무효화)
+shared_retrieval_cache = SemanticRetrievalCache()
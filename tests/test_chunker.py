@@ -0,0 +1,15 @@
+"""청크 섹션 감지 회귀 테스트"""
+
+import pytest
+
+from aws_agent.preprocessing.chunker import _detect_section_prefix
+
+
+@pytest.mark.parametrize("prefix", ["기존기술개요", "검증된 기존 기술 개요"])
+def test_detect_section_prefers_higher_priority_pattern(prefix):
+    # 앞선 하위 우선순위 패턴이 문자열을 먼저 소비해도 기술개요가 우선해야 함
+    assert _detect_section_prefix(prefix) == "기술개요"
+
+
+def test_detect_section_without_match():
+    assert _detect_section_prefix("일반 본문") is None